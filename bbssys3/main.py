@@ -9,24 +9,36 @@ Created: 2025-07-06
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext, filedialog
+from tkinter import ttk, messagebox, scrolledtext, filedialog, font as tkfont
 import sqlite3
 import threading
+import asyncio
 import time
 import random
 import json
 import datetime
 import sys
 import os
+import pathlib
 import re
 import subprocess
+import http.client
 import shutil
-from typing import Dict, List, Optional, Tuple, Any
+import gzip
+from typing import Dict, List, Optional, Tuple, Any, Iterator
 import queue
+import heapq
+import bisect
 import logging
 import hashlib
 import pickle
 import csv
+import atexit
+import functools
+import contextlib
+import unicodedata
+from collections import defaultdict, OrderedDict, Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 
 # G4Fライブラリのインポートとエラーハンドリング
 try:
@@ -39,9 +51,23 @@ except ImportError as e:
     print(f"[WARNING] g4fライブラリの読み込みに失敗しました: {e}")
     print("[INFO] Gemini CLIを使用します")
 
+# 応答検証用の正規表現エンジン（google-re2があればDFAで一括走査）
+try:
+    import re2 as _pattern_engine
+except ImportError:
+    _pattern_engine = re
+
+# キャッシュキー用の高速ハッシュ（xxhashがなければblake2bを使用）
+try:
+    import xxhash
+    _fast_digest = xxhash.xxh3_128_digest
+except ImportError:
+    def _fast_digest(data: bytes) -> bytes:
+        return hashlib.blake2b(data, digest_size=16).digest()
+
 # ペルソナモジュールのインポート
 try:
-    from persona import PersonaManager
+    from persona import PersonaManager, Generation, PersonalityType
     print("[SYSTEM] ペルソナモジュールが正常に読み込まれました")
 except ImportError as e:
     print(f"[ERROR] ペルソナモジュールの読み込みに失敗しました: {e}")
@@ -61,6 +87,49 @@ VERSION_HISTORY = [
     {"version": "3.1.0", "date": "2025-07-06", "changes": "投稿頻度向上、ユーザー応答強化、レスポンシブ対応"}
 ]
 
+# 管理画面のバージョン情報（起動日時以外は定数なので読み込み時に組み立てる）
+_VERSION_INFO_HEAD = f"""
+■ アプリケーション情報 ■
+名前: {APP_NAME}
+バージョン: {APP_VERSION}
+ビルド: {APP_BUILD}
+作成者: {APP_AUTHOR}
+"""
+_VERSION_INFO_FEATURES = """
+■ 新機能（v3.1.0） ■
+✅ 投稿頻度大幅向上（5-15秒間隔）
+✅ ユーザー応答強化（即座反応システム）
+✅ 1366x768完全対応
+✅ バッチ投稿生成システム
+✅ 高頻度投稿スケジューラー
+✅ レスポンシブ最適化
+
+■ 機能状況 ■
+✅ 基本BBS機能
+✅ AIペルソナシステム（100体）
+✅ G4F + Gemini CLI対応
+✅ 自動投稿システム（高頻度）
+✅ 動的スレッド作成
+✅ 呼びかけ応答機能
+✅ データエクスポート機能
+✅ 管理画面
+✅ バージョン管理
+✅ レスポンシブ対応
+✅ ユーザー名設定機能
+"""
+
+# バージョン履歴の表示テキスト（新しい順）
+_VERSION_HISTORY_RENDERED = "■ バージョン履歴 ■\n\n" + "".join(
+    f"Version {v['version']} ({v['date']})\n  変更内容: {v['changes']}\n\n"
+    for v in reversed(VERSION_HISTORY)
+)
+
+# 管理画面の統計値（接続状況・ペルソナ統計）を再利用する秒数
+STATS_CACHE_TTL = 2.0
+
+# ペルソナ詳細エクスポートの区切り線
+_PERSONA_EXPORT_SEP = "\n" + "=" * 80 + "\n\n"
+
 # ログ設定
 logging.basicConfig(
     level=logging.INFO,
@@ -72,18 +141,171 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def _try_remove(path: str) -> None:
+    """ファイルを削除（存在しなければ何もしない）"""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _file_timestamp() -> str:
+    """ファイル名用のタイムスタンプ（datetimeオブジェクトを作らない）"""
+    return time.strftime("%Y%m%d_%H%M%S")
+
+
+def _gzip_log_archive(path: str) -> None:
+    """退避したログをgzip圧縮して元ファイルを削除（バックグラウンド用）"""
+    try:
+        with open(path, 'rb') as src, gzip.open(path + '.gz', 'wb', compresslevel=1) as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.remove(path)
+    except OSError as e:
+        logger.error(f"[ADMIN] ログ圧縮エラー: {e}")
+
+# AI応答検証用の正規表現（モジュール読み込み時に一度だけコンパイル）
+_ERROR_RE = _pattern_engine.compile(
+    r'(?i)^(?:Error:|Sorry|I apologize|Unable to)'
+    r'|エラー|失敗|利用.*できません|AI.*として|人工知能.*です|助手.*です'
+)
+_INAPPROPRIATE_RE = _pattern_engine.compile(r'殺|死|危険.*薬物|違法')
+_JP_RE = re.compile(r'[\u3040-\u30FF\u4E00-\u9FFF\uFF66-\uFF9F]')
+
+# メンション検出用の正規表現（@名前 / 名前さん・君・ちゃん を1回の走査で検出）
+_AT_MENTION_RE = re.compile(r'@([^\s]+)')
+_MENTION_RE = re.compile(r'@(\S+)|([^\s、。！？]+?)(?:さん|君|ちゃん)(?=\s|$|[、。！？])')
+_MENTION_SUFFIXES = ('さん', '君', 'ちゃん')
+# 全体への呼びかけキーワード
+_MENTION_KEYWORDS_RE = re.compile(r'みんな|だれか|誰か|みなさん|皆さん')
+
+# デフォルト小分類（大分類名 -> (名前, 説明) のタプル）
+_DEFAULT_SUB_CATEGORIES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "雑談": (
+        ("日常の話", "日々の出来事や身近な話題"),
+        ("最近の出来事", "ニュースや時事問題について"),
+        ("天気の話", "天気や季節に関する話題"),
+        ("グルメ情報", "食べ物や料理に関する話題"),
+        ("地域情報", "地域のイベントや情報")
+    ),
+    "ゲーム": (
+        ("レトロゲーム", "昔懐かしいゲームの話題"),
+        ("RPG", "ロールプレイングゲーム全般"),
+        ("アクションゲーム", "アクション系ゲームの話題"),
+        ("パズルゲーム", "パズル・思考系ゲーム"),
+        ("新作ゲーム", "最新ゲームの情報と感想")
+    ),
+    "趣味": (
+        ("読書", "本や文学に関する話題"),
+        ("映画鑑賞", "映画やドラマの感想"),
+        ("音楽", "音楽や楽器に関する話題"),
+        ("スポーツ", "スポーツ観戦や実践"),
+        ("旅行", "旅行先や観光地の情報")
+    ),
+    "パソコン": (
+        ("ハードウェア", "PCパーツや機器の話題"),
+        ("ソフトウェア", "アプリケーションの情報"),
+        ("プログラミング", "プログラミング技術の話題"),
+        ("インターネット", "ネット関連の話題"),
+        ("トラブル相談", "PC関連のトラブル解決")
+    ),
+    "仕事": (
+        ("転職相談", "転職活動や求職情報"),
+        ("スキルアップ", "技能向上や学習"),
+        ("職場の悩み", "職場環境や人間関係"),
+        ("副業", "副業や在宅ワーク"),
+        ("資格取得", "資格試験や勉強法")
+    )
+}
+
+# INSERT ... RETURNING は SQLite 3.35.0 以降で利用可能
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# 頻出SQL（文字列を固定してsqlite3のステートメントキャッシュに載せる）
+_SQL_INCR_VIEW = "UPDATE threads SET view_count = view_count + ? WHERE thread_id = ?"
+_SQL_INSERT_POST = """INSERT INTO posts (thread_id, persona_name, content, is_user_post, reply_to_post_id, mention_names)
+                      VALUES (?, ?, ?, ?, ?, ?)"""
+_SQL_TOUCH_THREAD = """UPDATE threads SET
+                       post_count = post_count + 1,
+                       last_post_time = CURRENT_TIMESTAMP,
+                       updated_at = CURRENT_TIMESTAMP,
+                       last_ai_post_time = CASE WHEN ? THEN last_ai_post_time ELSE CURRENT_TIMESTAMP END
+                       WHERE thread_id = ?"""
+_SQL_THREAD_TOTALS = """SELECT t.main_category_id, COUNT(*), COALESCE(SUM(t.post_count), 0), COALESCE(SUM(t.view_count), 0)
+                        FROM threads t
+                        JOIN sub_categories s ON t.sub_category_id = s.sub_category_id
+                        WHERE t.status='active'{where}
+                        GROUP BY t.main_category_id"""
+_SQL_THREAD_POSTS = """SELECT post_id, persona_name, content, posted_at, is_user_post,
+                              is_edited, reply_to_post_id, mention_names
+                       FROM posts
+                       WHERE thread_id=? AND is_deleted=0 AND post_id > ?
+                       ORDER BY post_id ASC LIMIT ?"""
+_SQL_SECONDS_SINCE_AI_POST = """SELECT CAST((julianday('now') - julianday(last_ai_post_time)) * 86400 AS REAL)
+                                FROM threads WHERE thread_id=?"""
+_SQL_AI_POST_AGES = """SELECT thread_id, CAST((julianday('now') - julianday(last_ai_post_time)) * 86400 AS REAL)
+                       FROM threads WHERE status='active'{where}"""
+_SQL_AI_POST_CANDIDATES = """SELECT t.thread_id, t.title, t.post_count, t.is_locked,
+                                    CAST((julianday('now') - julianday(t.last_ai_post_time)) * 86400 AS REAL)
+                             FROM threads t
+                             JOIN main_categories m ON t.main_category_id = m.category_id
+                             JOIN sub_categories s ON t.sub_category_id = s.sub_category_id
+                             WHERE t.status='active'"""
+_SQL_LOG_ACTIVITY = """INSERT INTO activity_logs (activity_type, user_name, target_type, target_id, description)
+                       VALUES (?, ?, ?, ?, ?)"""
+
+# プロンプト末尾の固定指示
+_RESPONSE_SUFFIX = "\n\n回答は自然で人間らしい日本語で、150文字以内にまとめてください。"
+
+# 日本語文字（U+3040〜U+9FFF, U+FF66〜U+FF9F）のUTF-8先頭バイト
+_JP_LEAD_BYTES = tuple(bytes([b]) for b in (0xE3, 0xE4, 0xE5, 0xE6, 0xE7, 0xE8, 0xE9, 0xEF))
+
+def _has_japanese(text: str, minimum: int = 2) -> bool:
+    """日本語文字が指定数以上含まれるか（見つかった時点で打ち切り）"""
+    # ASCIIのみの応答は即座に除外
+    if text.isascii():
+        return False
+    
+    # UTF-8先頭バイトの出現数で事前判定（C実装のbytes.countで走査）
+    encoded = text.encode("utf-8")
+    if sum(encoded.count(lead) for lead in _JP_LEAD_BYTES) < minimum:
+        return False
+    
+    count = 0
+    for _ in _JP_RE.finditer(text):
+        count += 1
+        if count >= minimum:
+            return True
+    return False
+
 class DatabaseManager:
     """データベース管理クラス - 完全版"""
     
     def __init__(self, db_path: str = "bbs_database.db"):
         self.db_path = db_path
+        # スレッドごとの永続接続（毎回のconnect/closeを避ける）
+        self._local = threading.local()
+        self._connections: Dict[threading.Thread, sqlite3.Connection] = {}
+        self._conn_lock = threading.Lock()
+        atexit.register(self.close_all)
         self.init_database()
         self.migrate_database()
         logger.info(f"[DB] データベース初期化完了: {db_path}")
     
+    @staticmethod
+    def _apply_pragmas(conn: sqlite3.Connection):
+        """接続ごとのPRAGMA設定（WAL・キャッシュ調整）"""
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
+    
     def init_database(self):
         """データベース初期化 - 拡張版"""
-        with sqlite3.connect(self.db_path) as conn:
+        # スレッド共有接続上で全DDLを単一トランザクションにまとめる
+        with self.transaction() as conn:
             cursor = conn.cursor()
             
             # 大分類テーブル
@@ -255,20 +477,15 @@ class DatabaseManager:
                     FOREIGN KEY (thread_id) REFERENCES threads(thread_id)
                 )
             ''')
-            
-            conn.commit()
     
     def migrate_database(self):
         """データベースマイグレーション - 拡張版"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # 既存のthreadsテーブルをチェック
-            cursor.execute("PRAGMA table_info(threads)")
-            columns = [column[1] for column in cursor.fetchall()]
-            
-            # 必要なカラムを段階的に追加
-            new_columns = [
+        conn = self._conn()
+        cursor = conn.cursor()
+        
+        # 必要なカラムを段階的に追加
+        new_columns = {
+            'threads': [
                 ('last_ai_post_time', 'TIMESTAMP'),
                 ('main_category_id', 'INTEGER'),
                 ('sub_category_id', 'INTEGER'),
@@ -278,21 +495,9 @@ class DatabaseManager:
                 ('is_pinned', 'BOOLEAN DEFAULT FALSE'),
                 ('is_locked', 'BOOLEAN DEFAULT FALSE'),
                 ('auto_created', 'BOOLEAN DEFAULT FALSE')
-            ]
-            
-            for column_name, column_type in new_columns:
-                if column_name not in columns:
-                    try:
-                        cursor.execute(f"ALTER TABLE threads ADD COLUMN {column_name} {column_type}")
-                        logger.info(f"[DB] {column_name}カラムを追加しました")
-                    except Exception as e:
-                        logger.error(f"[DB] マイグレーションエラー: {e}")
-            
+            ],
             # postsテーブルの拡張
-            cursor.execute("PRAGMA table_info(posts)")
-            post_columns = [column[1] for column in cursor.fetchall()]
-            
-            post_new_columns = [
+            'posts': [
                 ('updated_at', 'TIMESTAMP'),
                 ('is_edited', 'BOOLEAN DEFAULT FALSE'),
                 ('is_deleted', 'BOOLEAN DEFAULT FALSE'),
@@ -301,113 +506,298 @@ class DatabaseManager:
                 ('ip_address', 'TEXT'),
                 ('user_agent', 'TEXT')
             ]
-            
-            for column_name, column_type in post_new_columns:
-                if column_name not in post_columns:
+        }
+        
+        # 既存カラムはテーブルごとに一度だけ確認し、不足分のみ抽出
+        pending = []
+        for table_name, table_columns in new_columns.items():
+            cursor.execute(f"PRAGMA table_info({table_name})")
+            existing = {column[1] for column in cursor.fetchall()}
+            pending.extend(
+                (table_name, column_name, column_type)
+                for column_name, column_type in table_columns
+                if column_name not in existing
+            )
+        
+        # 不足カラムがあれば単一トランザクションで追加
+        if pending:
+            with self.transaction():
+                for table_name, column_name, column_type in pending:
                     try:
-                        cursor.execute(f"ALTER TABLE posts ADD COLUMN {column_name} {column_type}")
-                        logger.info(f"[DB] posts.{column_name}カラムを追加しました")
+                        cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}")
+                        logger.info(f"[DB] {table_name}.{column_name}カラムを追加しました")
                     except Exception as e:
                         logger.error(f"[DB] マイグレーションエラー: {e}")
+        
+        # インデックス作成（カラム追加後に実行）
+        self.create_indexes(conn)
+        
+        # バージョン履歴の初期化
+        self.init_version_history()
+    
+    def create_indexes(self, conn: sqlite3.Connection):
+        """検索頻度の高いカラムのインデックス作成"""
+        try:
+            cursor = conn.cursor()
             
-            # バージョン履歴の初期化
-            self.init_version_history()
+            # 一意インデックス作成前に重複行を整理
+            cursor.execute("""DELETE FROM ai_connection_stats WHERE stat_id NOT IN
+                              (SELECT MIN(stat_id) FROM ai_connection_stats GROUP BY provider_name, model_name)""")
+            cursor.execute("""DELETE FROM version_history WHERE history_id NOT IN
+                              (SELECT MIN(history_id) FROM version_history GROUP BY version)""")
+            
+            cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_stats_provider_model ON ai_connection_stats(provider_name, model_name)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_posts_thread ON posts(thread_id, posted_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_threads_cat ON threads(main_category_id, sub_category_id, updated_at)")
+            cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_version_history_version ON version_history(version)")
+            
+            # スレッド一覧・投稿一覧・自動作成チェック用の複合インデックス
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_threads_cat_status_order ON threads(main_category_id, status, is_pinned DESC, last_post_time DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_posts_thread_active_time ON posts(thread_id, is_deleted, posted_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_threads_autocreate ON threads(main_category_id, sub_category_id, auto_created)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_posts_thread_active_id ON posts(thread_id, is_deleted, post_id)")
+            conn.commit()
             
+            # 統計情報が未収集なら一度だけANALYZE、以降はPRAGMA optimizeに任せる
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name='sqlite_stat1'")
+            if cursor.fetchone() is None:
+                cursor.execute("ANALYZE")
+            else:
+                cursor.execute("PRAGMA optimize")
             conn.commit()
+        except Exception as e:
+            logger.error(f"[DB] インデックス作成エラー: {e}")
     
     def init_version_history(self):
         """バージョン履歴の初期化"""
-        try:
-            for version_info in VERSION_HISTORY:
-                existing = self.execute_query(
-                    "SELECT history_id FROM version_history WHERE version=?",
-                    (version_info["version"],)
-                )
-                
-                if not existing:
-                    self.execute_insert(
-                        """INSERT INTO version_history 
-                           (version, release_date, changes, author)
-                           VALUES (?, ?, ?, ?)""",
-                        (
-                            version_info["version"],
-                            version_info["date"],
-                            version_info["changes"],
-                            APP_AUTHOR
-                        )
-                    )
+        rows = [
+            (version_info["version"], version_info["date"], version_info["changes"], APP_AUTHOR)
+            for version_info in VERSION_HISTORY
+        ]
+        if self.execute_many(
+            """INSERT OR IGNORE INTO version_history 
+               (version, release_date, changes, author)
+               VALUES (?, ?, ?, ?)""",
+            rows
+        ):
             logger.info("[DB] バージョン履歴を初期化しました")
+        else:
+            logger.error("[DB] バージョン履歴初期化エラー")
+    
+    def _conn(self) -> sqlite3.Connection:
+        """現在のスレッド用の永続接続を取得"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   isolation_level=None, cached_statements=256)
+            self._apply_pragmas(conn)
+            self._local.conn = conn
+            with self._conn_lock:
+                # 終了済みスレッドが残した接続はここで回収する
+                dead = [t for t in self._connections if not t.is_alive()]
+                for t in dead:
+                    self._close_conn(self._connections.pop(t))
+                self._connections[threading.current_thread()] = conn
+        return conn
+    
+    @staticmethod
+    def _close_conn(conn: sqlite3.Connection):
+        """接続を閉じる（エラーはログのみ）"""
+        try:
+            conn.close()
         except Exception as e:
-            logger.error(f"[DB] バージョン履歴初期化エラー: {e}")
+            logger.error(f"[DB] 接続クローズエラー: {e}")
+    
+    def release_thread_connection(self):
+        """現在のスレッドの接続をクローズ（ワーカー終了時用）"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+        self._local.conn = None
+        with self._conn_lock:
+            self._connections.pop(threading.current_thread(), None)
+        self._close_conn(conn)
+    
+    def close_all(self):
+        """全スレッドの接続をクローズ"""
+        with self._conn_lock:
+            for conn in self._connections.values():
+                self._close_conn(conn)
+            self._connections.clear()
+        self._local = threading.local()
+    
+    def reopen(self):
+        """接続を張り直してスキーマを再構築（同じインスタンスを使い続ける）"""
+        self.close_all()
+        self.init_database()
+        self.migrate_database()
+        logger.info(f"[DB] データベース再オープン完了: {self.db_path}")
+    
+    def recreate(self, source_path: Optional[str] = None):
+        """DBファイルを作り直す（source_path指定時はそのファイルの内容で置き換え）"""
+        self.close_all()
+        if source_path:
+            # バックアップを読み取り専用で開き、SQLiteのページ単位で書き戻す
+            source = sqlite3.connect(pathlib.Path(source_path).resolve().as_uri() + "?mode=ro", uri=True)
+            try:
+                source.backup(self._conn())
+            finally:
+                source.close()
+        else:
+            for suffix in ("-wal", "-shm", ""):
+                _try_remove(self.db_path + suffix)
+        self.reopen()
+    
+    def backup_to(self, dest_path: str):
+        """オンラインバックアップAPIで別ファイルへ複製（WAL上の未反映分も含めた一貫したコピー）"""
+        dest = sqlite3.connect(dest_path)
+        try:
+            self._conn().backup(dest)
+            # バックアップは-wal/-shmを伴わない単一ファイルにする
+            dest.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            dest.close()
+    
+    def optimize(self):
+        """VACUUM/ANALYZEを既存の永続接続で実行"""
+        conn = self._conn()
+        conn.execute("VACUUM")
+        conn.execute("ANALYZE")
     
     def execute_query(self, query: str, params: tuple = ()) -> List[tuple]:
         """クエリ実行"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                return cursor.fetchall()
+            return self._conn().execute(query, params).fetchall()
         except Exception as e:
             logger.error(f"[DB] クエリ実行エラー: {e}")
             return []
     
+    def execute_query_dicts(self, query: str, params: tuple = ()) -> List[Dict]:
+        """クエリ実行（カラム名はcursor.descriptionから取得して辞書化）"""
+        try:
+            cursor = self._conn().execute(query, params)
+            columns = [desc[0] for desc in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor]
+        except Exception as e:
+            logger.error(f"[DB] クエリ実行エラー: {e}")
+            return []
+    
+    def iter_query(self, query: str, params: tuple = (), arraysize: int = 1000) -> Iterator[tuple]:
+        """クエリ結果を逐次取得（全件をメモリに展開しない）"""
+        try:
+            cursor = self._conn().execute(query, params)
+            while True:
+                rows = cursor.fetchmany(arraysize)
+                if not rows:
+                    break
+                yield from rows
+        except Exception as e:
+            logger.error(f"[DB] クエリ逐次実行エラー: {e}")
+    
     def execute_insert(self, query: str, params: tuple = ()) -> int:
         """INSERT実行"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                conn.commit()
-                return cursor.lastrowid
+            return self._conn().execute(query, params).lastrowid
         except Exception as e:
             logger.error(f"[DB] INSERT実行エラー: {e}")
             return -1
     
+    @contextlib.contextmanager
+    def transaction(self, immediate: bool = False):
+        """トランザクション（ネスト時は外側のトランザクションに参加）"""
+        conn = self._conn()
+        if conn.in_transaction:
+            yield conn
+            return
+        # 書き込み確定の処理は最初から書き込みロックを取得してロック昇格の競合を避ける
+        conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+    
+    def execute_many(self, query: str, rows: List[tuple]) -> bool:
+        """同一ステートメントを単一トランザクションで一括実行"""
+        try:
+            with self.transaction() as conn:
+                conn.executemany(query, rows)
+            return True
+        except Exception as e:
+            logger.error(f"[DB] 一括実行エラー: {e}")
+            return False
+    
+    def execute_batch(self, statements: List[Tuple[str, tuple]]) -> bool:
+        """複数ステートメントを単一トランザクションで実行"""
+        try:
+            with self.transaction() as conn:
+                for query, params in statements:
+                    conn.execute(query, params)
+            return True
+        except Exception as e:
+            logger.error(f"[DB] バッチ実行エラー: {e}")
+            return False
+    
     def log_activity(self, activity_type: str, user_name: str, target_type: str = None, 
                     target_id: int = None, description: str = None):
         """アクティビティログ記録"""
         try:
             self.execute_insert(
-                """INSERT INTO activity_logs 
-                   (activity_type, user_name, target_type, target_id, description)
-                   VALUES (?, ?, ?, ?, ?)""",
+                _SQL_LOG_ACTIVITY,
                 (activity_type, user_name, target_type, target_id, description)
             )
         except Exception as e:
             logger.error(f"[DB] アクティビティログ記録エラー: {e}")
 
+def _update_running(n: int, total: float, mn: float, mx: float, rt: float) -> Tuple[int, float, float, float]:
+    """応答時間の累計・最小・最大を更新（数値のみを扱う純粋関数）"""
+    return n + 1, total + rt, (rt if rt < mn else mn), (rt if rt > mx else mx)
+
+@functools.lru_cache(maxsize=1)
+def _gemini_cli_available() -> bool:
+    """Gemini CLIの存在確認"""
+    try:
+        result = subprocess.run(
+            ["gemini", "--version"],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        return result.returncode == 0
+    except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
+        # 代替チェック: gcloud cli
+        try:
+            result = subprocess.run(
+                ["gcloud", "ai", "models", "list", "--limit=1"],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            return result.returncode == 0
+        except:
+            return False
+
 class GeminiCLIManager:
     """Gemini CLI管理クラス - 強化版"""
     
+    API_HOST = "generativelanguage.googleapis.com"
+    
     def __init__(self):
-        self.available = self._check_gemini_cli()
         self.model = "gemini-pro"
         self.timeout = 30
         self.max_retries = 3
-        logger.info(f"[GEMINI] CLI利用可能: {self.available}")
+        # APIキーがあればREST APIを直接呼び出し、CLIの起動を省く
+        self.api_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
+        self._http_local = threading.local()
+        self.available = bool(self.api_key) or self._check_gemini_cli()
+        logger.info(f"[GEMINI] CLI利用可能: {self.available} (API直接接続: {bool(self.api_key)})")
     
     def _check_gemini_cli(self) -> bool:
-        """Gemini CLIの利用可能性チェック"""
-        try:
-            result = subprocess.run(
-                ["gemini", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-            # 代替チェック: gcloud cli
-            try:
-                result = subprocess.run(
-                    ["gcloud", "ai", "models", "list", "--limit=1"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                return result.returncode == 0
-            except:
-                return False
+        """Gemini CLIの利用可能性チェック（プロセス内で一度だけ実行）"""
+        return _gemini_cli_available()
     
     def generate_response(self, prompt: str, persona_context: str = "", 
                          mention_context: str = "") -> Optional[str]:
@@ -415,48 +805,81 @@ class GeminiCLIManager:
         if not self.available:
             return None
         
+        # フルプロンプト構築
+        full_prompt = self._build_full_prompt(prompt, persona_context, mention_context)
+        
         for attempt in range(self.max_retries):
             try:
-                # フルプロンプト構築
-                full_prompt = self._build_full_prompt(prompt, persona_context, mention_context)
-                
-                # Gemini CLIコマンド実行
-                result = subprocess.run(
-                    ["gemini", "generate", "--model", self.model, "--prompt", full_prompt],
-                    capture_output=True,
-                    text=True,
-                    timeout=self.timeout
-                )
+                if self.api_key:
+                    response = self._request_via_api(full_prompt)
+                else:
+                    response = self._request_via_cli(full_prompt)
                 
-                if result.returncode == 0 and result.stdout.strip():
-                    response = result.stdout.strip()
+                if response:
                     cleaned_response = self._clean_response(response)
                     if cleaned_response:
                         logger.info(f"[GEMINI] 応答生成成功 (試行{attempt+1}/{self.max_retries})")
                         return cleaned_response
                 
-                time.sleep(1)  # リトライ前の待機
-                
             except Exception as e:
                 logger.warning(f"[GEMINI] 応答生成エラー (試行{attempt+1}/{self.max_retries}): {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2)
+            
+            # リトライ前の待機（1s, 2s, 4s...）
+            if attempt < self.max_retries - 1:
+                time.sleep(2 ** attempt)
         
         return None
     
-    def _build_full_prompt(self, prompt: str, persona_context: str, mention_context: str) -> str:
-        """フルプロンプト構築"""
-        parts = []
-        
-        if persona_context:
-            parts.append(f"ペルソナ情報:\n{persona_context}")
-        
+    def _http_connection(self) -> http.client.HTTPSConnection:
+        """スレッドごとの持続HTTPS接続を取得"""
+        conn = getattr(self._http_local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPSConnection(self.API_HOST, timeout=self.timeout)
+            self._http_local.conn = conn
+        return conn
+    
+    def _request_via_api(self, full_prompt: str) -> Optional[str]:
+        """REST API経由の応答生成（接続を再利用）"""
+        body = json.dumps({"contents": [{"parts": [{"text": full_prompt}]}]})
+        path = f"/v1beta/models/{self.model}:generateContent?key={self.api_key}"
+        conn = self._http_connection()
+        try:
+            conn.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+            res = conn.getresponse()
+            data = res.read()
+        except Exception:
+            # 切断された接続は破棄して次回再接続
+            conn.close()
+            self._http_local.conn = None
+            raise
+        
+        if res.status != 200:
+            raise RuntimeError(f"HTTP {res.status}")
+        
+        payload = json.loads(data)
+        parts = payload["candidates"][0]["content"]["parts"]
+        return "".join(part.get("text", "") for part in parts).strip()
+    
+    def _request_via_cli(self, full_prompt: str) -> Optional[str]:
+        """Gemini CLIコマンド実行"""
+        result = subprocess.run(
+            ["gemini", "generate", "--model", self.model, "--prompt", full_prompt],
+            capture_output=True,
+            text=True,
+            timeout=self.timeout
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+        return None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _build_full_prompt(prompt: str, persona_context: str, mention_context: str) -> str:
+        """フルプロンプト構築（同一引数はキャッシュから返す）"""
+        header = f"ペルソナ情報:\n{persona_context}\n\n" if persona_context else ""
         if mention_context:
-            parts.append(f"呼びかけ情報:\n{mention_context}")
-        
-        parts.append(f"指示:\n{prompt}")
-        
-        return "\n\n".join(parts)
+            header += f"呼びかけ情報:\n{mention_context}\n\n"
+        return f"{header}指示:\n{prompt}"
     
     def _clean_response(self, response: str) -> str:
         """応答のクリーニング - 強化版"""
@@ -464,29 +887,16 @@ class GeminiCLIManager:
             return ""
         
         # エラーパターンの除外
-        error_patterns = [
-            r'^Error:.*', r'^Sorry.*', r'^I apologize.*', r'^Unable to.*',
-            r'.*エラー.*', r'.*失敗.*', r'.*利用.*できません.*',
-            r'.*AI.*として.*', r'.*人工知能.*です.*', r'.*助手.*です.*'
-        ]
-        
-        for pattern in error_patterns:
-            if re.search(pattern, response.strip(), re.IGNORECASE):
-                return ""
+        if _ERROR_RE.search(response.strip()):
+            return ""
         
         # 日本語チェック
-        japanese_chars = re.findall(r'[ひらがなカタカナ漢字]', response)
-        if len(japanese_chars) < 2:
+        if not _has_japanese(response):
             return ""
         
         # 不適切な内容のチェック
-        inappropriate_patterns = [
-            r'.*殺.*', r'.*死.*', r'.*危険.*薬物.*', r'.*違法.*'
-        ]
-        
-        for pattern in inappropriate_patterns:
-            if re.search(pattern, response.strip()):
-                return ""
+        if _INAPPROPRIATE_RE.search(response):
+            return ""
         
         return response.strip()
 
@@ -503,12 +913,50 @@ class AIManager:
         self.lock = threading.Lock()
         self.request_count = 0
         self.success_count = 0
+        self.cache_hits = 0  # キャッシュから返した応答数（プロバイダー呼び出しには数えない）
         self.failure_count = 0
         
+        # 接続状況のキャッシュ（カウンタやプロバイダー変更時のみ再構築）
+        self._status_dirty = True
+        self._cached_status: Dict = {}
+        
+        # 統計の書き込みバッファ（まとめてフラッシュ）
+        self._stat_deltas: Dict[Tuple[str, str], Dict[str, float]] = defaultdict(self._new_stat_delta)
+        self._stat_pending = 0
+        self._stat_timer: Optional[Future] = None
+        self.stats_flush_threshold = 50
+        self.stats_flush_interval = 5.0
+        atexit.register(self._flush_stats)
+        
+        # 応答キャッシュ（同一プロンプトの再生成を避ける）
+        self._resp_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self.resp_cache_size = 1024
+        
+        # 非同期実行基盤（待機はイベントループ上のタイマー、AI呼び出しは共有ワーカーで実行）
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ai-worker")
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(self._executor)
+        threading.Thread(target=self._loop.run_forever, name="ai-loop", daemon=True).start()
+        
         # 初期化
         self.init_ai_connections()
         logger.info(f"[AI] 初期化完了 - G4F: {self.g4f_available}, Gemini: {self.gemini_cli.available}")
     
+    async def _run_later(self, delay: float, func, *args):
+        """指定秒後にワーカーで関数を実行"""
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return await self._loop.run_in_executor(None, func, *args)
+    
+    def schedule(self, delay: float, func, *args) -> Future:
+        """遅延実行の登録（待機中はスレッドを占有しない）"""
+        return asyncio.run_coroutine_threadsafe(self._run_later(delay, func, *args), self._loop)
+    
+    def submit(self, prompt: str, persona_context: str = "", mention_context: str = "",
+               delay: float = 0.0, cacheable: bool = False) -> Future:
+        """AI応答生成の非同期実行"""
+        return self.schedule(delay, self.generate_response, prompt, persona_context, mention_context, cacheable)
+    
     def init_ai_connections(self):
         """AI接続初期化 - 拡張版"""
         if self.g4f_available:
@@ -521,6 +969,8 @@ class AIManager:
         if not self.g4f_available and not self.gemini_cli.available:
             logger.warning("[AI] 利用可能なAI接続がありません")
         
+        self._status_dirty = True
+        
         # デフォルト統計レコードの作成
         self._init_default_stats()
     
@@ -543,42 +993,54 @@ class AIManager:
                 if hasattr(provider, 'working') and provider.working
             ]
             
-            # 優先順位順にテスト
-            for combo in sorted(verified_combinations, key=lambda x: x['priority']):
+            providers_by_name = {provider.__name__: provider for provider in working_providers}
+            
+            def _probe(combo: Dict) -> Optional[Dict]:
+                """単一組み合わせの接続テスト"""
                 provider_name = combo['provider_name']
                 model = combo['model']
+                provider_obj = providers_by_name.get(provider_name)
+                if not provider_obj:
+                    return None
                 
-                provider_obj = None
-                for provider in working_providers:
-                    if provider.__name__ == provider_name:
-                        provider_obj = provider
-                        break
-                
-                if provider_obj:
-                    # 接続テスト
-                    try:
-                        test_response = g4f.ChatCompletion.create(
-                            model=model,
-                            provider=provider_obj,
-                            messages=[{"role": "user", "content": "テスト"}],
-                            timeout=15
-                        )
-                        
-                        if test_response and len(str(test_response).strip()) > 0:
-                            self.available_combinations.append({
-                                'provider': provider_obj,
-                                'model': model,
-                                'priority': combo['priority']
-                            })
-                            logger.info(f"[G4F] 利用可能: {provider_name} + {model}")
-                            
-                            # 最初の成功した組み合わせを現在のものとして設定
-                            if not self.current_provider:
-                                self.current_provider = provider_obj
-                                self.current_model = model
-                            
-                    except Exception as e:
-                        logger.warning(f"[G4F] テスト失敗: {provider_name} + {model} - {e}")
+                try:
+                    test_response = g4f.ChatCompletion.create(
+                        model=model,
+                        provider=provider_obj,
+                        messages=[{"role": "user", "content": "テスト"}],
+                        timeout=15
+                    )
+                    
+                    if test_response and len(str(test_response).strip()) > 0:
+                        logger.info(f"[G4F] 利用可能: {provider_name} + {model}")
+                        return {
+                            'provider': provider_obj,
+                            'model': model,
+                            'priority': combo['priority']
+                        }
+                except Exception as e:
+                    logger.warning(f"[G4F] テスト失敗: {provider_name} + {model} - {e}")
+                return None
+            
+            # 全組み合わせを並列にテスト（起動時間をタイムアウト1回分に抑える）
+            results = []
+            executor = ThreadPoolExecutor(max_workers=len(verified_combinations))
+            futures = [executor.submit(_probe, combo) for combo in verified_combinations]
+            try:
+                for future in as_completed(futures, timeout=20):
+                    result = future.result()
+                    if result:
+                        results.append(result)
+            except FuturesTimeoutError:
+                logger.warning("[G4F] 接続テストがタイムアウトしました")
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+            
+            # 優先順位順に登録
+            self.available_combinations.extend(sorted(results, key=lambda x: x['priority']))
+            if self.available_combinations and not self.current_provider:
+                self.current_provider = self.available_combinations[0]['provider']
+                self.current_model = self.available_combinations[0]['model']
             
             if self.available_combinations:
                 logger.info(f"[G4F] 使用組み合わせ: {self.current_provider.__name__} + {self.current_model}")
@@ -594,26 +1056,28 @@ class AIManager:
         """デフォルト統計レコードの初期化"""
         try:
             providers = ["G4F-Chatai", "G4F-Bing", "G4F-You", "Gemini CLI"]
-            for provider in providers:
-                existing = self.db_manager.execute_query(
-                    "SELECT stat_id FROM ai_connection_stats WHERE provider_name=?",
-                    (provider,)
-                )
-                
-                if not existing:
-                    self.db_manager.execute_insert(
-                        """INSERT INTO ai_connection_stats 
-                           (provider_name, model_name, success_count, failure_count)
-                           VALUES (?, ?, 0, 0)""",
-                        (provider, "default")
-                    )
+            self.db_manager.execute_many(
+                """INSERT INTO ai_connection_stats 
+                   (provider_name, model_name, success_count, failure_count)
+                   SELECT ?, 'default', 0, 0 WHERE NOT EXISTS
+                   (SELECT 1 FROM ai_connection_stats WHERE provider_name=?)""",
+                [(provider, provider) for provider in providers]
+            )
         except Exception as e:
             logger.error(f"[AI] デフォルト統計初期化エラー: {e}")
     
     def generate_response(self, prompt: str, persona_context: str = "", 
-                         mention_context: str = "") -> Optional[str]:
-        """AI応答生成 - 完全版"""
+                         mention_context: str = "", cacheable: bool = False) -> Optional[str]:
+        """AI応答生成 - 完全版（cacheable=Trueはプロンプトに文脈を含む呼び出し元のみ）"""
+        cache_key = self._response_cache_key(prompt, persona_context, mention_context) if cacheable else None
         with self.lock:
+            self._status_dirty = True
+            if cache_key is not None:
+                cached = self._resp_cache.get(cache_key)
+                if cached is not None:
+                    self._resp_cache.move_to_end(cache_key)
+                    self.cache_hits += 1
+                    return cached
             self.request_count += 1
         
         start_time = time.time()
@@ -642,7 +1106,10 @@ class AIManager:
                             
                             with self.lock:
                                 self.success_count += 1
+                                self._status_dirty = True
                             
+                            if cache_key is not None:
+                                self._store_cached_response(cache_key, cleaned_response)
                             return cleaned_response
                 
                 except Exception as e:
@@ -661,7 +1128,10 @@ class AIManager:
                     
                     with self.lock:
                         self.success_count += 1
+                        self._status_dirty = True
                     
+                    if cache_key is not None:
+                        self._store_cached_response(cache_key, response)
                     return response
                 else:
                     response_time = time.time() - start_time
@@ -671,23 +1141,34 @@ class AIManager:
         
         with self.lock:
             self.failure_count += 1
+            self._status_dirty = True
         
         return None
     
-    def _build_full_prompt(self, prompt: str, persona_context: str, mention_context: str) -> str:
-        """フルプロンプト構築"""
-        parts = []
-        
+    @staticmethod
+    def _response_cache_key(prompt: str, persona_context: str, mention_context: str) -> bytes:
+        """応答キャッシュのキー生成"""
+        return _fast_digest(f"{persona_context}|{mention_context}|{prompt}".encode("utf-8"))
+    
+    def _store_cached_response(self, cache_key: bytes, response: str):
+        """応答をキャッシュに保存（古いものから破棄）"""
+        with self.lock:
+            self._resp_cache[cache_key] = response
+            self._resp_cache.move_to_end(cache_key)
+            while len(self._resp_cache) > self.resp_cache_size:
+                self._resp_cache.popitem(last=False)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _build_full_prompt(prompt: str, persona_context: str, mention_context: str) -> str:
+        """フルプロンプト構築（同一引数はキャッシュから返す）"""
+        if persona_context and mention_context:
+            return f"{persona_context}\n\n重要: {mention_context}\n\n{prompt}{_RESPONSE_SUFFIX}"
         if persona_context:
-            parts.append(persona_context)
-        
+            return f"{persona_context}\n\n{prompt}{_RESPONSE_SUFFIX}"
         if mention_context:
-            parts.append(f"重要: {mention_context}")
-        
-        parts.append(prompt)
-        parts.append("回答は自然で人間らしい日本語で、150文字以内にまとめてください。")
-        
-        return "\n\n".join(parts)
+            return f"重要: {mention_context}\n\n{prompt}{_RESPONSE_SUFFIX}"
+        return f"{prompt}{_RESPONSE_SUFFIX}"
     
     def _clean_response(self, response: str) -> str:
         """応答のクリーニング - 強化版"""
@@ -695,19 +1176,11 @@ class AIManager:
             return ""
         
         # エラーパターンの除外
-        error_patterns = [
-            r'^Error:.*', r'^Sorry.*', r'^I apologize.*', r'^Unable to.*',
-            r'.*エラー.*', r'.*失敗.*', r'.*利用.*できません.*',
-            r'.*AI.*として.*', r'.*人工知能.*です.*', r'.*助手.*です.*'
-        ]
-        
-        for pattern in error_patterns:
-            if re.search(pattern, response.strip(), re.IGNORECASE):
-                return ""
+        if _ERROR_RE.search(response.strip()):
+            return ""
         
         # 日本語チェック
-        japanese_chars = re.findall(r'[ひらがなカタカナ漢字]', response)
-        if len(japanese_chars) < 2:
+        if not _has_japanese(response):
             return ""
         
         # 長さ制限
@@ -716,70 +1189,107 @@ class AIManager:
         
         return response.strip()
     
+    @staticmethod
+    def _new_stat_delta() -> Dict[str, float]:
+        """統計差分の初期値"""
+        return {"success": 0, "failure": 0, "sum_rt": 0.0, "rt_count": 0,
+                "min_rt": float("inf"), "max_rt": 0.0}
+    
     def _update_stats(self, provider_name: str, model_name: str, success: bool, response_time: float):
-        """統計更新 - 拡張版"""
+        """統計更新 - バッファリング版"""
         try:
-            # 既存レコードを取得
-            existing = self.db_manager.execute_query(
-                "SELECT success_count, failure_count, total_requests, avg_response_time, min_response_time, max_response_time FROM ai_connection_stats WHERE provider_name=? AND model_name=?",
-                (provider_name, model_name)
-            )
-            
-            if existing:
-                success_count, failure_count, total_requests, avg_response_time, min_response_time, max_response_time = existing[0]
-                
+            with self.lock:
+                delta = self._stat_deltas[(provider_name, model_name)]
                 if success:
-                    success_count += 1
+                    delta["success"] += 1
+                    # 応答時間統計は成功時のみ反映
+                    if response_time > 0:
+                        (delta["rt_count"], delta["sum_rt"],
+                         delta["min_rt"], delta["max_rt"]) = _update_running(
+                            delta["rt_count"], delta["sum_rt"],
+                            delta["min_rt"], delta["max_rt"], response_time
+                        )
                 else:
-                    failure_count += 1
-                
-                total_requests += 1
+                    delta["failure"] += 1
+                self._stat_pending += 1
                 
-                # 応答時間統計の更新
-                if response_time > 0:
-                    if avg_response_time == 0:
-                        avg_response_time = response_time
-                    else:
-                        avg_response_time = (avg_response_time * (total_requests - 1) + response_time) / total_requests
-                    
-                    if min_response_time == 0 or response_time < min_response_time:
-                        min_response_time = response_time
-                    
-                    if response_time > max_response_time:
-                        max_response_time = response_time
-                
-                # 更新
-                if success:
-                    self.db_manager.execute_insert(
-                        """UPDATE ai_connection_stats SET 
-                           success_count=?, total_requests=?, avg_response_time=?, 
-                           min_response_time=?, max_response_time=?, last_success_time=CURRENT_TIMESTAMP,
-                           updated_at=CURRENT_TIMESTAMP
-                           WHERE provider_name=? AND model_name=?""",
-                        (success_count, total_requests, avg_response_time, min_response_time, max_response_time, provider_name, model_name)
-                    )
-                else:
-                    self.db_manager.execute_insert(
-                        """UPDATE ai_connection_stats SET 
-                           failure_count=?, total_requests=?, last_failure_time=CURRENT_TIMESTAMP,
-                           updated_at=CURRENT_TIMESTAMP
-                           WHERE provider_name=? AND model_name=?""",
-                        (failure_count, total_requests, provider_name, model_name)
-                    )
-            else:
-                # 新規作成
-                self.db_manager.execute_insert(
-                    """INSERT INTO ai_connection_stats 
-                       (provider_name, model_name, success_count, failure_count, total_requests, avg_response_time, min_response_time, max_response_time, last_success_time)
-                       VALUES (?, ?, ?, ?, 1, ?, ?, ?, CURRENT_TIMESTAMP)""",
-                    (provider_name, model_name, 1 if success else 0, 0 if success else 1, response_time, response_time, response_time)
-                )
+                flush_now = self._stat_pending >= self.stats_flush_threshold
+                if not flush_now and self._stat_timer is None:
+                    # 常駐のAIループで遅延実行（フラッシュごとにスレッド・接続を作らない）
+                    self._stat_timer = self.schedule(self.stats_flush_interval, self._flush_stats)
+            
+            if flush_now:
+                self._flush_stats()
                 
         except Exception as e:
             logger.error(f"[AI] 統計更新エラー: {e}")
     
+    def _flush_stats(self):
+        """バッファ済み統計を単一トランザクションで書き込み"""
+        with self.lock:
+            if self._stat_timer is not None:
+                self._stat_timer.cancel()
+                self._stat_timer = None
+            if not self._stat_deltas:
+                return
+            deltas = self._stat_deltas
+            self._stat_deltas = defaultdict(self._new_stat_delta)
+            self._stat_pending = 0
+        
+        statements = []
+        for (provider_name, model_name), d in deltas.items():
+            min_rt = d["min_rt"] if d["rt_count"] else 0.0
+            statements.append((
+                """INSERT INTO ai_connection_stats 
+                   (provider_name, model_name, success_count, failure_count, total_requests,
+                    avg_response_time, min_response_time, max_response_time,
+                    last_success_time, last_failure_time)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?,
+                           CASE WHEN ? > 0 THEN CURRENT_TIMESTAMP END,
+                           CASE WHEN ? > 0 THEN CURRENT_TIMESTAMP END)
+                   ON CONFLICT(provider_name, model_name) DO UPDATE SET 
+                   avg_response_time=CASE WHEN ? > 0
+                       THEN (avg_response_time * success_count + ?) / (success_count + ?)
+                       ELSE avg_response_time END,
+                   min_response_time=CASE WHEN ? > 0 AND (min_response_time = 0 OR ? < min_response_time)
+                       THEN ? ELSE min_response_time END,
+                   max_response_time=MAX(max_response_time, excluded.max_response_time),
+                   success_count=success_count + excluded.success_count,
+                   failure_count=failure_count + excluded.failure_count,
+                   total_requests=total_requests + excluded.total_requests,
+                   last_success_time=COALESCE(excluded.last_success_time, last_success_time),
+                   last_failure_time=COALESCE(excluded.last_failure_time, last_failure_time),
+                   updated_at=CURRENT_TIMESTAMP""",
+                (provider_name, model_name, d["success"], d["failure"], d["success"] + d["failure"],
+                 d["sum_rt"] / d["rt_count"] if d["rt_count"] else 0.0, min_rt, d["max_rt"],
+                 d["success"], d["failure"],
+                 d["rt_count"], d["sum_rt"], d["rt_count"],
+                 d["rt_count"], min_rt, min_rt)
+            ))
+        
+        if not self.db_manager.execute_batch(statements):
+            logger.error("[AI] 統計フラッシュに失敗しました（次回に再試行）")
+            self._restore_stat_deltas(deltas)
+    
+    def _restore_stat_deltas(self, deltas: Dict[Tuple[str, str], Dict[str, float]]):
+        """書き込みに失敗した統計差分をバッファへ戻し、再フラッシュを予約"""
+        with self.lock:
+            for key, d in deltas.items():
+                cur = self._stat_deltas[key]
+                for field in ("success", "failure", "sum_rt", "rt_count"):
+                    cur[field] += d[field]
+                cur["min_rt"] = min(cur["min_rt"], d["min_rt"])
+                cur["max_rt"] = max(cur["max_rt"], d["max_rt"])
+                self._stat_pending += d["success"] + d["failure"]
+            if self._stat_timer is None:
+                self._stat_timer = self.schedule(self.stats_flush_interval, self._flush_stats)
+    
     def get_connection_status(self) -> Dict:
         """接続状況取得 - 拡張版"""
+        if not self._status_dirty:
+            return self._cached_status
+        
+        self._status_dirty = False
         status = {
             'g4f_available': self.g4f_available,
             'gemini_available': self.gemini_cli.available,
@@ -789,6 +1299,7 @@ class AIManager:
             'total_requests': self.request_count,
             'success_count': self.success_count,
             'failure_count': self.failure_count,
+            'cache_hits': self.cache_hits,
             'success_rate': 0.0
         }
         
@@ -802,6 +1313,7 @@ class AIManager:
             status['current_provider'] = "Gemini CLI"
             status['current_model'] = "gemini-pro"
         
+        self._cached_status = status
         return status
 
 class CategoryManager:
@@ -809,9 +1321,31 @@ class CategoryManager:
     
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
+        
+        # カテゴリ一覧のキャッシュ（書き込み時に破棄）
+        self._main_cache: Optional[List[Dict]] = None
+        self._sub_cache: Dict[int, List[Dict]] = {}
+        self._cache_lock = threading.Lock()
+        
+        # カテゴリ変更時の通知先（UI側のキャッシュ破棄用）
+        self.on_change = None
+        
         self.init_default_categories()
         logger.info("[CATEGORY] カテゴリ管理初期化完了")
     
+    def invalidate_cache(self):
+        """カテゴリキャッシュの破棄"""
+        with self._cache_lock:
+            self._main_cache = None
+            self._sub_cache.clear()
+        if self.on_change:
+            self.on_change()
+    
+    def reload(self):
+        """DB再構築後のキャッシュ破棄とデフォルトカテゴリ再作成"""
+        self.invalidate_cache()
+        self.init_default_categories()
+    
     def init_default_categories(self):
         """デフォルトカテゴリ初期化 - 拡張版"""
         # 大分類の初期化
@@ -823,82 +1357,68 @@ class CategoryManager:
             ("仕事", 5, "仕事や職業に関する話題")
         ]
         
-        for category_name, order, description in default_main_categories:
-            existing = self.db_manager.execute_query(
-                "SELECT category_id FROM main_categories WHERE category_name=?",
-                (category_name,)
-            )
-            
-            if not existing:
-                category_id = self.db_manager.execute_insert(
-                    "INSERT INTO main_categories (category_name, display_order) VALUES (?, ?)",
-                    (category_name, order)
-                )
+        try:
+            with self.db_manager.transaction() as conn:
+                existing = {row[0] for row in conn.execute("SELECT category_name FROM main_categories")}
                 
-                # 小分類の初期化
-                sub_categories = self.get_default_sub_categories(category_name)
-                for i, (sub_name, sub_desc) in enumerate(sub_categories):
-                    self.db_manager.execute_insert(
-                        "INSERT INTO sub_categories (main_category_id, sub_category_name, display_order) VALUES (?, ?, ?)",
+                sub_rows = []
+                for category_name, order, description in default_main_categories:
+                    if category_name in existing:
+                        continue
+                    
+                    if _HAS_RETURNING:
+                        category_id = conn.execute(
+                            "INSERT INTO main_categories (category_name, display_order) VALUES (?, ?) RETURNING category_id",
+                            (category_name, order)
+                        ).fetchone()[0]
+                    else:
+                        category_id = conn.execute(
+                            "INSERT INTO main_categories (category_name, display_order) VALUES (?, ?)",
+                            (category_name, order)
+                        ).lastrowid
+                    
+                    # 小分類の初期化
+                    sub_categories = self.get_default_sub_categories(category_name)
+                    sub_rows.extend(
                         (category_id, sub_name, i + 1)
+                        for i, (sub_name, sub_desc) in enumerate(sub_categories)
                     )
+                
+                if sub_rows:
+                    conn.executemany(
+                        "INSERT INTO sub_categories (main_category_id, sub_category_name, display_order) VALUES (?, ?, ?)",
+                        sub_rows
+                    )
+        except Exception as e:
+            logger.error(f"[CATEGORY] デフォルトカテゴリ初期化エラー: {e}")
+        finally:
+            self.invalidate_cache()
     
-    def get_default_sub_categories(self, main_category: str) -> List[Tuple[str, str]]:
+    def get_default_sub_categories(self, main_category: str) -> Tuple[Tuple[str, str], ...]:
         """デフォルト小分類取得 - 説明付き"""
-        sub_categories_map = {
-            "雑談": [
-                ("日常の話", "日々の出来事や身近な話題"),
-                ("最近の出来事", "ニュースや時事問題について"),
-                ("天気の話", "天気や季節に関する話題"),
-                ("グルメ情報", "食べ物や料理に関する話題"),
-                ("地域情報", "地域のイベントや情報")
-            ],
-            "ゲーム": [
-                ("レトロゲーム", "昔懐かしいゲームの話題"),
-                ("RPG", "ロールプレイングゲーム全般"),
-                ("アクションゲーム", "アクション系ゲームの話題"),
-                ("パズルゲーム", "パズル・思考系ゲーム"),
-                ("新作ゲーム", "最新ゲームの情報と感想")
-            ],
-            "趣味": [
-                ("読書", "本や文学に関する話題"),
-                ("映画鑑賞", "映画やドラマの感想"),
-                ("音楽", "音楽や楽器に関する話題"),
-                ("スポーツ", "スポーツ観戦や実践"),
-                ("旅行", "旅行先や観光地の情報")
-            ],
-            "パソコン": [
-                ("ハードウェア", "PCパーツや機器の話題"),
-                ("ソフトウェア", "アプリケーションの情報"),
-                ("プログラミング", "プログラミング技術の話題"),
-                ("インターネット", "ネット関連の話題"),
-                ("トラブル相談", "PC関連のトラブル解決")
-            ],
-            "仕事": [
-                ("転職相談", "転職活動や求職情報"),
-                ("スキルアップ", "技能向上や学習"),
-                ("職場の悩み", "職場環境や人間関係"),
-                ("副業", "副業や在宅ワーク"),
-                ("資格取得", "資格試験や勉強法")
-            ]
-        }
-        
-        return sub_categories_map.get(main_category, [])
+        return _DEFAULT_SUB_CATEGORIES.get(main_category, ())
     
     def get_main_categories(self) -> List[Dict]:
-        """大分類一覧取得"""
-        categories = self.db_manager.execute_query(
-            "SELECT category_id, category_name FROM main_categories ORDER BY display_order"
-        )
-        return [{"id": c[0], "name": c[1]} for c in categories]
+        """大分類一覧取得（キャッシュ付き）"""
+        with self._cache_lock:
+            if self._main_cache is None:
+                categories = self.db_manager.execute_query(
+                    "SELECT category_id, category_name FROM main_categories ORDER BY display_order"
+                )
+                self._main_cache = [{"id": c[0], "name": c[1]} for c in categories]
+            return list(self._main_cache)
     
     def get_sub_categories(self, main_category_id: int) -> List[Dict]:
-        """小分類一覧取得"""
-        sub_categories = self.db_manager.execute_query(
-            "SELECT sub_category_id, sub_category_name FROM sub_categories WHERE main_category_id=? ORDER BY display_order",
-            (main_category_id,)
-        )
-        return [{"id": s[0], "name": s[1]} for s in sub_categories]
+        """小分類一覧取得（キャッシュ付き）"""
+        with self._cache_lock:
+            cached = self._sub_cache.get(main_category_id)
+            if cached is None:
+                sub_categories = self.db_manager.execute_query(
+                    "SELECT sub_category_id, sub_category_name FROM sub_categories WHERE main_category_id=? ORDER BY display_order",
+                    (main_category_id,)
+                )
+                cached = self._sub_cache[main_category_id] = [{"id": s[0], "name": s[1]} for s in sub_categories]
+            return list(cached)
     
     def create_category(self, category_name: str, parent_id: int = None) -> int:
         """動的カテゴリ作成"""
@@ -916,6 +1436,13 @@ class CategoryManager:
                     (parent_id, category_name, 999)
                 )
             
+            # キャッシュ破棄
+            with self._cache_lock:
+                if parent_id is None:
+                    self._main_cache = None
+                else:
+                    self._sub_cache.pop(parent_id, None)
+            
             self.db_manager.log_activity("category_create", "システム", "category", category_id, f"カテゴリ作成: {category_name}")
             return category_id
         except Exception as e:
@@ -928,31 +1455,69 @@ class ThreadManager:
     def __init__(self, db_manager: DatabaseManager, category_manager: CategoryManager):
         self.db_manager = db_manager
         self.category_manager = category_manager
+        
+        # ビューカウントはメモリ上で集計し、定期的にまとめて書き込む
+        self._pending_views: Counter = Counter()
+        self._view_lock = threading.Lock()
+        self._view_wake = threading.Event()
+        self._view_flusher: Optional[threading.Thread] = None
+        self.view_flush_interval = 5.0
+        atexit.register(self.flush_view_counts)
+        
+        # カテゴリ別スレッド一覧のキャッシュ（スレッド・投稿・閲覧数の書き込み時に破棄）
+        self._threads_cache: Dict[int, List[Dict]] = {}
+        self._cache_lock = threading.Lock()
+        
         self.init_default_threads()
         logger.info("[THREAD] スレッド管理初期化完了")
     
+    def invalidate_cache(self):
+        """スレッド一覧キャッシュの破棄"""
+        with self._cache_lock:
+            self._threads_cache.clear()
+    
+    def reload(self):
+        """DB再構築後の保留ビュー・キャッシュ破棄とデフォルトスレッド再作成"""
+        with self._view_lock:
+            self._pending_views.clear()
+        self.invalidate_cache()
+        self.init_default_threads()
+    
     def init_default_threads(self):
         """デフォルトスレッド作成 - 拡張版"""
-        main_categories = self.category_manager.get_main_categories()
-        for main_cat in main_categories:
-            sub_categories = self.category_manager.get_sub_categories(main_cat["id"])
-            for sub_cat in sub_categories:
-                thread_title = f"{sub_cat['name']}について語りましょう"
-                thread_description = f"{sub_cat['name']}に関する話題を自由に投稿してください。"
+        try:
+            with self.db_manager.transaction() as conn:
+                # 自動作成スレッドが存在しない（大分類, 小分類）の組を一度に取得
+                missing = conn.execute(
+                    """SELECT m.category_id, s.sub_category_id, s.sub_category_name
+                       FROM main_categories m
+                       JOIN sub_categories s ON s.main_category_id = m.category_id
+                       LEFT JOIN threads t ON t.main_category_id = m.category_id
+                                          AND t.sub_category_id = s.sub_category_id
+                                          AND t.auto_created = 1
+                       WHERE t.thread_id IS NULL
+                       ORDER BY m.display_order, s.display_order"""
+                ).fetchall()
                 
-                # 既存チェック
-                existing = self.db_manager.execute_query(
-                    "SELECT thread_id FROM threads WHERE main_category_id=? AND sub_category_id=? AND auto_created=1",
-                    (main_cat["id"], sub_cat["id"])
-                )
+                rows = [
+                    (main_id, sub_id,
+                     f"{sub_name}について語りましょう",
+                     f"{sub_name}に関する話題を自由に投稿してください。",
+                     "システム", True)
+                    for main_id, sub_id, sub_name in missing
+                ]
                 
-                if not existing:
-                    thread_id = self.db_manager.execute_insert(
+                if rows:
+                    conn.executemany(
                         """INSERT INTO threads (main_category_id, sub_category_id, title, description, created_by, auto_created)
                            VALUES (?, ?, ?, ?, ?, ?)""",
-                        (main_cat["id"], sub_cat["id"], thread_title, thread_description, "システム", True)
+                        rows
                     )
-                    logger.debug(f"[THREAD] デフォルトスレッド作成: {thread_title} (ID: {thread_id})")
+                    logger.debug(f"[THREAD] デフォルトスレッド作成: {len(rows)}件")
+        except Exception as e:
+            logger.error(f"[THREAD] デフォルトスレッド作成エラー: {e}")
+        finally:
+            self.invalidate_cache()
     
     def create_thread_safe(self, main_category_id: int, sub_category_id: int, title: str, 
                           description: str = "", created_by: str = "ユーザー") -> int:
@@ -990,6 +1555,8 @@ class ThreadManager:
             )
             
             if thread_id > 0:
+                self.invalidate_cache()
+                
                 # アクティビティログ
                 self.db_manager.log_activity("thread_create", created_by, "thread", thread_id, f"スレッド作成: {normalized_title}")
                 logger.info(f"[THREAD] 新規スレッド作成成功: {normalized_title} (ID: {thread_id})")
@@ -1003,7 +1570,15 @@ class ThreadManager:
             return -1
     
     def get_threads_by_category(self, main_category_id: int) -> List[Dict]:
-        """カテゴリ別スレッド取得 - 拡張版"""
+        """カテゴリ別スレッド取得 - 拡張版（キャッシュ付き）"""
+        with self._cache_lock:
+            cached = self._threads_cache.get(main_category_id)
+            if cached is None:
+                cached = self._threads_cache[main_category_id] = self._query_threads_by_category(main_category_id)
+            return list(cached)
+    
+    def _query_threads_by_category(self, main_category_id: int) -> List[Dict]:
+        """カテゴリ別スレッドをDBから取得"""
         threads = self.db_manager.execute_query(
             """SELECT t.thread_id, s.sub_category_name, t.title, t.post_count, 
                       t.last_post_time, t.view_count, t.is_pinned, t.is_locked,
@@ -1032,19 +1607,26 @@ class ThreadManager:
             for t in threads
         ]
     
-    def get_thread_posts(self, thread_id: int, limit: int = 50) -> List[Dict]:
-        """スレッド投稿取得 - 拡張版"""
+    def get_aggregate_stats(self, main_category_id: Optional[int] = None) -> Dict[int, Dict[str, int]]:
+        """大分類ごとのスレッド数・投稿数・閲覧数をSQLの集計1回で取得"""
+        if main_category_id is None:
+            rows = self.db_manager.execute_query(_SQL_THREAD_TOTALS.format(where=""))
+        else:
+            rows = self.db_manager.execute_query(
+                _SQL_THREAD_TOTALS.format(where=" AND t.main_category_id=?"), (main_category_id,)
+            )
+        return {
+            row[0]: {"thread_count": row[1], "post_count": row[2], "view_count": row[3]}
+            for row in rows
+        }
+    
+    def get_thread_posts(self, thread_id: int, limit: int = 50,
+                         after_post_id: Optional[int] = None) -> List[Dict]:
+        """スレッド投稿取得 - 拡張版（after_post_id より後の投稿をキーセットで取得）"""
         # ビューカウント更新
         self.increment_view_count(thread_id)
         
-        posts = self.db_manager.execute_query(
-            """SELECT post_id, persona_name, content, posted_at, is_user_post, 
-                      is_edited, reply_to_post_id, mention_names
-               FROM posts 
-               WHERE thread_id=? AND is_deleted=0
-               ORDER BY posted_at ASC LIMIT ?""",
-            (thread_id, limit)
-        )
+        posts = self.db_manager.execute_query(_SQL_THREAD_POSTS, (thread_id, after_post_id or 0, limit))
         
         return [
             {
@@ -1061,75 +1643,121 @@ class ThreadManager:
         ]
     
     def add_post(self, thread_id: int, persona_name: str, content: str, 
-                is_user_post: bool = False, reply_to_post_id: int = None) -> bool:
-        """投稿追加 - 拡張版"""
+                is_user_post: bool = False, reply_to_post_id: int = None) -> Optional[int]:
+        """投稿追加 - 拡張版（成功時は投稿IDを返す）"""
         try:
             # メンション検出
             mention_names = self.extract_mentions(content)
             
-            # 投稿を追加
-            post_id = self.db_manager.execute_insert(
-                """INSERT INTO posts (thread_id, persona_name, content, is_user_post, reply_to_post_id, mention_names)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (thread_id, persona_name, content, is_user_post, reply_to_post_id, mention_names)
-            )
-            
-            # スレッドの統計更新
-            self.db_manager.execute_insert(
-                """UPDATE threads SET
-                   post_count = (SELECT COUNT(*) FROM posts WHERE thread_id = ? AND is_deleted=0),
-                   last_post_time = CURRENT_TIMESTAMP,
-                   updated_at = CURRENT_TIMESTAMP
-                   WHERE thread_id = ?""",
-                (thread_id, thread_id)
-            )
+            activity_type = "user_post" if is_user_post else "ai_post"
             
-            if not is_user_post:
-                # AI投稿の場合、最終AI投稿時間も更新
-                self.db_manager.execute_insert(
-                    """UPDATE threads SET last_ai_post_time = CURRENT_TIMESTAMP WHERE thread_id = ?""",
-                    (thread_id,)
+            with self.db_manager.transaction(immediate=True) as conn:
+                # 投稿を追加
+                post_id = conn.execute(
+                    _SQL_INSERT_POST,
+                    (thread_id, persona_name, content, is_user_post, reply_to_post_id, mention_names)
+                ).lastrowid
+                
+                # スレッドの統計更新（AI投稿の場合は最終AI投稿時間も更新）
+                conn.execute(_SQL_TOUCH_THREAD, (is_user_post, thread_id))
+                
+                # アクティビティログ
+                conn.execute(
+                    _SQL_LOG_ACTIVITY,
+                    (activity_type, persona_name, "post", post_id, f"投稿: {content[:50]}...")
                 )
             
-            # アクティビティログ
-            activity_type = "user_post" if is_user_post else "ai_post"
-            self.db_manager.log_activity(activity_type, persona_name, "post", post_id, f"投稿: {content[:50]}...")
-            
+            self.invalidate_cache()
             logger.info(f"[THREAD] 投稿追加: {persona_name} -> Thread {thread_id} (Post {post_id})")
-            return True
+            return post_id
             
         except Exception as e:
             logger.error(f"[THREAD] 投稿追加エラー: {e}")
-            return False
+            return None
     
     def extract_mentions(self, content: str) -> str:
         """メンション抽出"""
         # @username パターンでメンションを検出
-        mentions = re.findall(r'@([^\s]+)', content)
+        mentions = _AT_MENTION_RE.findall(content)
         return ",".join(mentions) if mentions else ""
     
     def increment_view_count(self, thread_id: int):
-        """ビューカウント増加"""
+        """ビューカウント増加（書き込みはflush_view_countsでまとめて実行）"""
+        with self._view_lock:
+            self._pending_views[thread_id] += 1
+            if self._view_flusher is None:
+                self._view_flusher = threading.Thread(
+                    target=self._view_flush_worker, name="view-flush", daemon=True
+                )
+                self._view_flusher.start()
+        self._view_wake.set()
+    
+    def _view_flush_worker(self):
+        """ビューカウントを一定間隔でまとめて反映する常駐ワーカー（接続は1本を使い続ける）"""
+        while True:
+            self._view_wake.wait()
+            time.sleep(self.view_flush_interval)
+            self._view_wake.clear()
+            self.flush_view_counts()
+    
+    def flush_view_counts(self):
+        """保留中のビューカウントを単一トランザクションで反映"""
+        with self._view_lock:
+            if not self._pending_views:
+                return
+            snapshot = self._pending_views
+            self._pending_views = Counter()
+        
+        if not self.db_manager.execute_many(
+            _SQL_INCR_VIEW,
+            [(count, thread_id) for thread_id, count in snapshot.items()]
+        ):
+            logger.error("[THREAD] ビューカウント更新エラー（次回に再試行）")
+            # 失敗分は保留に戻して次の周期で再試行
+            with self._view_lock:
+                self._pending_views.update(snapshot)
+            self._view_wake.set()
+            return
+        self.invalidate_cache()
+    
+    def get_ai_post_ages(self, thread_ids: Optional[List[int]] = None) -> Dict[int, float]:
+        """アクティブスレッドの最終AI投稿からの経過秒数を1クエリでまとめて取得"""
         try:
-            self.db_manager.execute_insert(
-                "UPDATE threads SET view_count = view_count + 1 WHERE thread_id = ?",
-                (thread_id,)
-            )
+            if thread_ids is None:
+                rows = self.db_manager.execute_query(_SQL_AI_POST_AGES.format(where=""))
+            elif not thread_ids:
+                return {}
+            else:
+                placeholders = ",".join("?" * len(thread_ids))
+                rows = self.db_manager.execute_query(
+                    _SQL_AI_POST_AGES.format(where=f" AND thread_id IN ({placeholders})"), tuple(thread_ids)
+                )
+            return {thread_id: 999999 if age is None else age for thread_id, age in rows}
         except Exception as e:
-            logger.error(f"[THREAD] ビューカウント更新エラー: {e}")
+            logger.error(f"[THREAD] AI投稿経過時間一括取得エラー: {e}")
+            return {}
+    
+    def get_ai_post_ages_bulk(self) -> List[Dict]:
+        """自動投稿の候補判定に必要なスレッド情報と経過秒数を1クエリで取得"""
+        rows = self.db_manager.execute_query(_SQL_AI_POST_CANDIDATES)
+        return [
+            {
+                "thread_id": r[0],
+                "title": r[1],
+                "post_count": r[2] or 0,
+                "is_locked": bool(r[3]),
+                "seconds_since_last_ai_post": 999999 if r[4] is None else r[4]
+            }
+            for r in rows
+        ]
     
     def get_seconds_since_last_ai_post(self, thread_id: int) -> float:
         """最後のAI投稿からの経過秒数を取得"""
         try:
-            result = self.db_manager.execute_query(
-                "SELECT last_ai_post_time FROM threads WHERE thread_id=?",
-                (thread_id,)
-            )
+            result = self.db_manager.execute_query(_SQL_SECONDS_SINCE_AI_POST, (thread_id,))
             
-            if result and result[0][0]:
-                last_time = datetime.datetime.fromisoformat(result[0][0])
-                now = datetime.datetime.now()
-                return (now - last_time).total_seconds()
+            if result and result[0][0] is not None:
+                return result[0][0]
             else:
                 return 999999
         except Exception as e:
@@ -1316,28 +1944,28 @@ class MentionManager:
     def __init__(self, persona_manager, ai_manager: AIManager):
         self.persona_manager = persona_manager
         self.ai_manager = ai_manager
-        self.mention_patterns = [
-            r'@([^\s]+)',
-            r'([^\s]+)さん',
-            r'([^\s]+)君',
-            r'([^\s]+)ちゃん'
-        ]
+        self.mention_pattern = _MENTION_RE
+        self._personas_snapshot: frozenset = frozenset()
+        self._snapshot_version = None
+    
+    def _get_personas_snapshot(self) -> frozenset:
+        """ペルソナ名のスナップショット（ペルソナ構成の変更時のみ再構築）"""
+        version = getattr(self.persona_manager, 'version', None)
+        if version is None or version != self._snapshot_version:
+            self._personas_snapshot = frozenset(getattr(self.persona_manager, 'personas', ()))
+            self._snapshot_version = version
+        return self._personas_snapshot
     
     def detect_mentions(self, content: str) -> List[str]:
         """メンション検出"""
-        mentions = []
-        for pattern in self.mention_patterns:
-            found = re.findall(pattern, content)
-            mentions.extend(found)
-        
-        # ペルソナ名と照合
-        valid_mentions = []
-        if hasattr(self.persona_manager, 'personas'):
-            for mention in mentions:
-                if mention in self.persona_manager.personas:
-                    valid_mentions.append(mention)
+        # 呼びかけ記号がなければ正規表現を走らせない
+        if not content or ('@' not in content and not any(suffix in content for suffix in _MENTION_SUFFIXES)):
+            return []
         
-        return list(set(valid_mentions))
+        # ペルソナ名と照合（出現順を保って重複除去）
+        snapshot = self._get_personas_snapshot()
+        names = (at_name or suffixed_name for at_name, suffixed_name in self.mention_pattern.findall(content))
+        return list(dict.fromkeys(name for name in names if name in snapshot))
     
     def should_respond_to_mention(self, persona_name: str, content: str) -> bool:
         """メンション応答判定"""
@@ -1347,10 +1975,8 @@ class MentionManager:
             return random.random() < 0.8
         
         # その他のキーワードベース判定
-        keywords = ["みんな", "だれか", "誰か", "みなさん", "皆さん"]
-        for keyword in keywords:
-            if keyword in content:
-                return random.random() < 0.3
+        if _MENTION_KEYWORDS_RE.search(content):
+            return random.random() < 0.3
         
         return False
     
@@ -1401,6 +2027,18 @@ class MentionManager:
 class UserResponseManager:
     """ユーザー応答管理クラス - 新規追加"""
     
+    # 世代による反応確率の補正（若い世代は積極的、年配世代は控えめ）
+    GENERATION_BONUS = {
+        Generation.GENERATION_2010s: 0.2,
+        Generation.GENERATION_1950s: 0.1,
+    }
+    
+    # 特殊属性による補正（荒らしは積極的、変人は独特に反応）
+    SPECIAL_BONUS = {
+        PersonalityType.TROLL: 0.4,
+        PersonalityType.WEIRD: 0.2,
+    }
+    
     def __init__(self, persona_manager, ai_manager, thread_manager):
         self.persona_manager = persona_manager
         self.ai_manager = ai_manager
@@ -1416,32 +2054,31 @@ class UserResponseManager:
                 # レスポンス時間をずらす
                 delay = random.uniform(3, 12) + (i * random.uniform(2, 5))
                 
-                def delayed_response(p=persona, d=delay):
-                    time.sleep(d)
+                def delayed_response(p=persona):
                     response = self._generate_user_response(p, username, content, thread_id)
                     if response:
                         success = self.thread_manager.add_post(thread_id, p.name, response, is_user_post=False)
                         if success:
                             logger.info(f"[USER_RESPONSE] 即座応答成功: {p.name}")
                 
-                # 別スレッドで遅延実行
-                threading.Thread(target=delayed_response, daemon=True).start()
+                # AIマネージャーのイベントループで遅延実行
+                self.ai_manager.schedule(delay, delayed_response)
             
             # 2. 5-15分後に追加のペルソナが反応
+            def post_follow_up(persona, response):
+                success = self.thread_manager.add_post(thread_id, persona.name, response, is_user_post=False)
+                if success:
+                    logger.info(f"[USER_RESPONSE] フォローアップ応答成功: {persona.name}")
+            
             def delayed_follow_up():
-                time.sleep(random.uniform(300, 900))  # 5-15分
                 follow_up_responders = self._select_follow_up_responders(username, content, immediate_responders)
                 
                 for persona in follow_up_responders:
                     response = self._generate_follow_up_response(persona, username, content, thread_id)
                     if response:
-                        delay = random.uniform(5, 30)
-                        time.sleep(delay)
-                        success = self.thread_manager.add_post(thread_id, persona.name, response, is_user_post=False)
-                        if success:
-                            logger.info(f"[USER_RESPONSE] フォローアップ応答成功: {persona.name}")
+                        self.ai_manager.schedule(random.uniform(5, 30), post_follow_up, persona, response)
             
-            threading.Thread(target=delayed_follow_up, daemon=True).start()
+            self.ai_manager.schedule(random.uniform(300, 900), delayed_follow_up)  # 5-15分
             
         except Exception as e:
             logger.error(f"[USER_RESPONSE] ユーザー応答エラー: {e}")
@@ -1451,52 +2088,29 @@ class UserResponseManager:
         if not hasattr(self.persona_manager, 'personas'):
             return []
         
+        # 反応確率 = 基本確率 + 社交性 + 世代補正 + 特殊属性補正
+        generation_bonus = self.GENERATION_BONUS
+        special_bonus = self.SPECIAL_BONUS
         candidates = []
         
         for persona in self.persona_manager.personas.values():
             if not persona.is_active:
                 continue
             
-            # 反応確率計算
-            base_probability = 0.3
-            
-            # 社交性による調整
-            social_bonus = persona.personality.sociability * 0.3
-            
-            # 世代による調整
-            if hasattr(persona, 'generation'):
-                from persona import Generation
-                if persona.generation == Generation.GENERATION_2010s:
-                    generation_bonus = 0.2  # 若い世代は積極的
-                elif persona.generation == Generation.GENERATION_1950s:
-                    generation_bonus = 0.1  # 年配世代は控えめ
-                else:
-                    generation_bonus = 0.15
-            else:
-                generation_bonus = 0.15
-            
-            # 特殊属性による調整
-            if hasattr(persona, 'special'):
-                from persona import PersonalityType
-                if persona.special.personality_type == PersonalityType.TROLL:
-                    special_bonus = 0.4  # 荒らしは積極的に反応
-                elif persona.special.personality_type == PersonalityType.WEIRD:
-                    special_bonus = 0.2  # 変人は独特に反応
-                else:
-                    special_bonus = 0.0
-            else:
-                special_bonus = 0.0
-            
-            total_probability = base_probability + social_bonus + generation_bonus + special_bonus
+            total_probability = (
+                0.3
+                + persona.personality.sociability * 0.3
+                + generation_bonus.get(getattr(persona, 'generation', None), 0.15)
+                + (special_bonus.get(persona.special.personality_type, 0.0) if hasattr(persona, 'special') else 0.0)
+            )
             
             if random.random() < total_probability:
                 candidates.append((persona, total_probability))
         
-        # 確率の高い順にソートして上位2-4体を選択
-        candidates.sort(key=lambda x: x[1], reverse=True)
+        # 確率の高い順に上位2-4体を選択（全体ソートは不要）
         responder_count = min(random.randint(2, 4), len(candidates))
         
-        return [candidate[0] for candidate in candidates[:responder_count]]
+        return [candidate[0] for candidate in heapq.nlargest(responder_count, candidates, key=lambda x: x[1])]
     
     def _select_follow_up_responders(self, username: str, content: str, immediate_responders: List) -> List:
         """フォローアップ応答者選択"""
@@ -1591,9 +2205,122 @@ class UserResponseManager:
         
         return processed
 
+class DataExporter:
+    """データエクスポートクラス"""
+    
+    EXPORT_TABLES = ("main_categories", "sub_categories", "threads", "posts", "personas", "ai_connection_stats")
+    
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+        # テーブル名 -> カラム名一覧（スキーマは固定のため一度だけ取得）
+        self._column_cache: Dict[str, Tuple[str, ...]] = {}
+    
+    def _columns(self, table_name: str) -> Tuple[str, ...]:
+        """テーブルのカラム名一覧"""
+        columns = self._column_cache.get(table_name)
+        if columns is None:
+            columns = tuple(row[1] for row in self.db_manager.execute_query(f"PRAGMA table_info({table_name})"))
+            if columns:
+                self._column_cache[table_name] = columns
+        return columns
+    
+    def export_all_data(self, format_type: str = "json") -> Optional[str]:
+        """全データエクスポート"""
+        try:
+            timestamp = _file_timestamp()
+            
+            if format_type == "json":
+                return self._export_json(f"bbs_export_{timestamp}.json")
+            if format_type == "csv":
+                return self._export_csv(f"bbs_export_{timestamp}")
+            if format_type == "backup":
+                filename = f"bbs_database_backup_{timestamp}.db"
+                self.db_manager.backup_to(filename)
+                logger.info(f"[EXPORT] データベースバックアップ完了: {filename}")
+                return filename
+            
+            logger.error(f"[EXPORT] 未対応のエクスポート形式: {format_type}")
+            return None
+        except Exception as e:
+            logger.error(f"[EXPORT] エクスポートエラー: {e}")
+            return None
+    
+    def _export_json(self, filename: str) -> str:
+        """JSON形式エクスポート"""
+        data = {
+            "app_version": APP_VERSION,
+            "exported_at": datetime.datetime.now().isoformat()
+        }
+        
+        for table_name in self.EXPORT_TABLES:
+            data[table_name] = self.db_manager.execute_query_dicts(f"SELECT * FROM {table_name}")
+        
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+        
+        logger.info(f"[EXPORT] JSONエクスポート完了: {filename}")
+        return filename
+    
+    def _export_csv(self, directory: str) -> str:
+        """CSV形式エクスポート（テーブルごとに1ファイル）"""
+        os.makedirs(directory, exist_ok=True)
+        
+        for table_name in self.EXPORT_TABLES:
+            with open(os.path.join(directory, f"{table_name}.csv"), 'w', newline='', encoding='utf-8-sig') as f:
+                writer = csv.writer(f)
+                writer.writerow(self._columns(table_name))
+                writer.writerows(self.db_manager.iter_query(f"SELECT * FROM {table_name}", arraysize=10000))
+        
+        logger.info(f"[EXPORT] CSVエクスポート完了: {directory}")
+        return directory
+
+def _truncate_display(text: str, max_cells: int = 50, ellipsis: str = "...") -> str:
+    """全角を2セルとして表示幅で切り詰め"""
+    if text.isascii():
+        return text if len(text) <= max_cells else text[:max_cells - len(ellipsis)] + ellipsis
+    
+    budget = max_cells - len(ellipsis)
+    cells = 0
+    cut = None
+    for i, char in enumerate(text):
+        cells += 2 if unicodedata.east_asian_width(char) in 'WF' else 1
+        if cut is None and cells > budget:
+            cut = i
+        if cells > max_cells:
+            return text[:cut] + ellipsis
+    return text
+
+# 45文字以上になった最初の区切り文字で折り返す（PC-98風）
+_WRAP_RE = re.compile(r'.{44,}?[。！？、 ]|.+')
+
+@functools.lru_cache(maxsize=4096)
+def _format_post_content(content: str) -> str:
+    """投稿内容のフォーマット（同一本文は再整形しない）"""
+    if not content:
+        return ""
+    
+    # 改行ごとに空行を挟み、各行は正規表現1回の走査で折り返す
+    lines = []
+    for i, segment in enumerate(content.split('\n')):
+        if i:
+            lines.append("")
+        lines.extend(_WRAP_RE.findall(segment))
+    
+    # 空白のみの行は空行として扱う
+    return '\n '.join(line if line.strip() else "" for line in lines)
+
 class BBSApplication:
     """メインアプリケーションクラス - 完全版"""
     
+    # 共有フォント（基準サイズからの差分, 太さ）
+    FONT_SPECS = {
+        'title': (2, 'bold'),
+        'body': (0, 'normal'),
+        'bold': (0, 'bold'),
+        'body_small': (-1, 'normal'),
+        'small': (-2, 'normal'),
+    }
+    
     def __init__(self):
         self.root = tk.Tk()
         
@@ -1614,6 +2341,7 @@ class BBSApplication:
         self.persona_manager = PersonaManager(self.db_manager, self.ai_manager)
         self.mention_manager = MentionManager(self.persona_manager, self.ai_manager)
         self.user_response_manager = UserResponseManager(self.persona_manager, self.ai_manager, self.thread_manager)
+        self.data_exporter = DataExporter(self.db_manager)
         
         # 投稿スケジューラー
         self.post_scheduler = PostScheduler(self.persona_manager, self.thread_manager, self.ai_manager)
@@ -1622,13 +2350,36 @@ class BBSApplication:
         self.current_main_category_id = None
         self.current_thread_id = None
         self.current_threads = []
+        self._thread_display_cache: List[str] = []
+        self._thread_rendered = 0
+        self._thread_render_job = None
+        self.post_display_limit = 50
+        self._post_render_key = None
+        self._rendered_post_count = 0
+        self._last_rendered_post_id = 0
+        self._post_line_starts: List[int] = []
+        self._post_line_ids: List[int] = []
+        self._main_category_ids: List[int] = []
+        self._main_category_ids_source = None
+        self._persona_detail_cache: Dict[str, Tuple[Any, int, str]] = {}
+        self._stats_cache: Dict[str, Tuple[float, Any]] = {}
+        self._interval_job = None
+        self._font_job = None
+        self._msg_safety_job = None
         self.admin_mode = False
         self.ai_activity_enabled = True
         self.selected_post_id = None
         
+        # 自動投稿ワーカーの起床用（AI活動切替・スレッド作成・間隔変更で通知）
+        self._auto_post_cond = threading.Condition()
+        self._auto_post_reseed = True
+        
         # メッセージキュー
         self.message_queue = queue.Queue()
         
+        # DB書き込みをTkのメインスレッドから外すワーカー
+        self._io_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bbs-io")
+        
         # GUI構築
         self.create_widgets()
         self.setup_keybindings()
@@ -1639,28 +2390,41 @@ class BBSApplication:
         # 自動投稿システム開始
         self.start_enhanced_auto_posting()
         
-        # メッセージ処理開始
+        # メッセージ処理開始（以降はワーカーからの<<MsgQueue>>通知で起動）
+        self.root.bind('<<MsgQueue>>', lambda e: self.process_messages())
         self.process_messages()
         
         logger.info(f"[APP] アプリケーション初期化完了 - Version {APP_VERSION}")
     
     def load_settings(self):
-        """設定読み込み - 拡張版"""
+        """設定読み込み - 拡張版（変更がなければ再解析しない）"""
         try:
-            if os.path.exists("bbs_settings.json"):
-                with open("bbs_settings.json", "r", encoding="utf-8") as f:
-                    settings = json.load(f)
-                    self.font_size = settings.get("font_size", 12)
-                    self.window_width = settings.get("window_width", 1366)
-                    self.window_height = settings.get("window_height", 768)
-                    self.auto_post_interval = settings.get("auto_post_interval", 30)
-                    self.ai_activity_enabled = settings.get("ai_activity_enabled", True)
-                    self.current_username = settings.get("current_username", "あなた")
+            try:
+                st = os.stat("bbs_settings.json")
+            except FileNotFoundError:
+                return
+            
+            settings_key = (st.st_mtime_ns, st.st_size)
+            if settings_key == getattr(self, "_settings_key", None):
+                return
+            
+            with open("bbs_settings.json", "r", encoding="utf-8") as f:
+                text = f.read()
+            settings = json.loads(text)
+            self.font_size = settings.get("font_size", 12)
+            self.window_width = settings.get("window_width", 1366)
+            self.window_height = settings.get("window_height", 768)
+            self.auto_post_interval = settings.get("auto_post_interval", 30)
+            self.ai_activity_enabled = settings.get("ai_activity_enabled", True)
+            self.current_username = settings.get("current_username", "あなた")
+            
+            self._settings_key = settings_key
+            self._settings_text = text
         except Exception as e:
             logger.error(f"[APP] 設定読み込みエラー: {e}")
     
     def save_settings(self):
-        """設定保存 - 拡張版"""
+        """設定保存 - 拡張版（一時ファイル経由で置換）"""
         try:
             settings = {
                 "font_size": self.font_size,
@@ -1670,8 +2434,20 @@ class BBSApplication:
                 "ai_activity_enabled": self.ai_activity_enabled,
                 "current_username": self.current_username
             }
-            with open("bbs_settings.json", "w", encoding="utf-8") as f:
-                json.dump(settings, f, ensure_ascii=False, indent=2)
+            text = json.dumps(settings, ensure_ascii=False, indent=2)
+            
+            # 内容が変わっていなければ書き込まない
+            if text == getattr(self, "_settings_text", None):
+                return
+            
+            tmp_path = "bbs_settings.json.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, "bbs_settings.json")
+            
+            st = os.stat("bbs_settings.json")
+            self._settings_key = (st.st_mtime_ns, st.st_size)
+            self._settings_text = text
         except Exception as e:
             logger.error(f"[APP] 設定保存エラー: {e}")
     
@@ -1687,17 +2463,28 @@ class BBSApplication:
         # 画面中央に配置
         self._center_window()
         
-        # ウィンドウリサイズイベント
+        # ウィンドウリサイズイベント（連続イベントはまとめて処理）
+        self._resize_job = None
+        self._laid_out_size = None
+        self._applied_layout: Dict[str, int] = {}
         self.root.bind('<Configure>', self.on_window_resize)
         
+        # 共有フォント（サイズ変更はフォント側の設定だけで全ウィジェットに反映）
+        self._fonts = {
+            name: tkfont.Font(root=self.root, family='MS Gothic',
+                              size=self.font_size + offset, weight=weight)
+            for name, (offset, weight) in self.FONT_SPECS.items()
+        }
+        self._fonts['display'] = tkfont.Font(root=self.root, family='MS Gothic', size=self.font_size)
+        
         # PC-98風カラーテーマ
         style = ttk.Style()
         style.theme_use('clam')
         style.configure('BBS.TFrame', background='#000000', foreground='#00FF00')
         style.configure('BBS.TLabel', background='#000000', foreground='#00FF00',
-                       font=('MS Gothic', self.font_size))
+                       font=self._fonts['body'])
         style.configure('BBS.TButton', background='#0000FF', foreground='#FFFFFF',
-                       font=('MS Gothic', self.font_size - 1))
+                       font=self._fonts['body_small'])
         style.configure('BBS.Treeview', background='#000080', foreground='#FFFFFF',
                        fieldbackground='#000080')
         
@@ -1724,10 +2511,28 @@ class BBSApplication:
         if event.widget == self.root:
             self.window_width = event.width
             self.window_height = event.height
-            self.adjust_responsive_layout()
+            
+            # ドラッグ中の連続イベントは最後の1回だけレイアウトする
+            if self._resize_job is not None:
+                self.root.after_cancel(self._resize_job)
+            self._resize_job = self.root.after(120, self._do_resize)
+    
+    def _do_resize(self):
+        """リサイズ確定後のレイアウト調整"""
+        self._resize_job = None
+        size = (self.window_width, self.window_height)
+        if size == self._laid_out_size:
+            return
+        self._laid_out_size = size
+        self.adjust_responsive_layout()
+    
+    def _apply_font_sizes(self):
+        """基準フォントサイズを共有フォントに反映"""
+        for name, (offset, _weight) in self.FONT_SPECS.items():
+            self._fonts[name].configure(size=self.font_size + offset)
     
     def adjust_responsive_layout(self):
-        """レスポンシブレイアウト調整 - 1366x768対応"""
+        """レスポンシブレイアウト調整 - 1366x768対応（変化した設定のみ反映）"""
         try:
             # フォントサイズの動的調整
             if self.window_width < 1024:
@@ -1737,50 +2542,27 @@ class BBSApplication:
             else:
                 new_font_size = self.font_size
             
-            # UIコンポーネントのサイズ調整
-            if hasattr(self, 'category_listbox'):
-                if self.window_height < 700:
-                    self.category_listbox.configure(height=5)
-                elif self.window_height < 800:
-                    self.category_listbox.configure(height=6)
-                else:
-                    self.category_listbox.configure(height=8)
-            
-            if hasattr(self, 'thread_listbox'):
-                if self.window_height < 700:
-                    self.thread_listbox.configure(height=12)
-                elif self.window_height < 800:
-                    self.thread_listbox.configure(height=15)
-                else:
-                    self.thread_listbox.configure(height=18)
-            
-            if hasattr(self, 'post_display'):
-                if self.window_height < 700:
-                    self.post_display.configure(height=18)
-                elif self.window_height < 800:
-                    self.post_display.configure(height=22)
-                else:
-                    self.post_display.configure(height=25)
-                self.post_display.configure(font=('MS Gothic', new_font_size))
-            
-            if hasattr(self, 'post_input'):
-                if self.window_height < 700:
-                    self.post_input.configure(height=3)
-                else:
-                    self.post_input.configure(height=4)
-                self.post_input.configure(font=('MS Gothic', new_font_size))
-            
-            # 1366x768での最適化
+            # UIコンポーネントの高さ（ウィジェットは作り直さず設定のみ変更）
             if self.window_width == 1366 and self.window_height == 768:
-                # 特別最適化
-                if hasattr(self, 'category_listbox'):
-                    self.category_listbox.configure(height=6)
-                if hasattr(self, 'thread_listbox'):
-                    self.thread_listbox.configure(height=14)
-                if hasattr(self, 'post_display'):
-                    self.post_display.configure(height=20)
-                if hasattr(self, 'post_input'):
-                    self.post_input.configure(height=3)
+                # 1366x768での最適化
+                heights = {'category_listbox': 6, 'thread_listbox': 14, 'post_display': 20, 'post_input': 3}
+            elif self.window_height < 700:
+                heights = {'category_listbox': 5, 'thread_listbox': 12, 'post_display': 18, 'post_input': 3}
+            elif self.window_height < 800:
+                heights = {'category_listbox': 6, 'thread_listbox': 15, 'post_display': 22, 'post_input': 4}
+            else:
+                heights = {'category_listbox': 8, 'thread_listbox': 18, 'post_display': 25, 'post_input': 4}
+            
+            for name, height in heights.items():
+                widget = getattr(self, name, None)
+                if widget is not None and self._applied_layout.get(name) != height:
+                    widget.configure(height=height)
+                    self._applied_layout[name] = height
+            
+            # 投稿表示・入力欄のフォント（共有フォントなので設定のみで反映）
+            if self._applied_layout.get('display_font') != new_font_size:
+                self._fonts['display'].configure(size=new_font_size)
+                self._applied_layout['display_font'] = new_font_size
                     
         except Exception as e:
             logger.error(f"[APP] レスポンシブ調整エラー: {e}")
@@ -1811,7 +2593,7 @@ class BBSApplication:
             header_frame,
             text=f"■ {APP_NAME} ■",
             style='BBS.TLabel',
-            font=('MS Gothic', self.font_size + 2, 'bold')
+            font=self._fonts['title']
         )
         title_label.pack()
         
@@ -1825,7 +2607,7 @@ class BBSApplication:
             header_frame,
             text=status_text,
             style='BBS.TLabel',
-            font=('MS Gothic', self.font_size - 2)
+            font=self._fonts['small']
         )
         status_label.pack()
         self.status_label = status_label
@@ -1842,7 +2624,7 @@ class BBSApplication:
             textvariable=self.username_var,
             bg="#000080",
             fg="#FFFFFF",
-            font=('MS Gothic', self.font_size),
+            font=self._fonts['body'],
             width=15
         )
         self.username_entry.pack(side=tk.LEFT, padx=(5, 10))
@@ -1859,7 +2641,7 @@ class BBSApplication:
             user_frame,
             text=f"投稿間隔: {self.auto_post_interval}秒",
             style='BBS.TLabel',
-            font=('MS Gothic', self.font_size - 2)
+            font=self._fonts['small']
         )
         self.ai_status_label.pack(side=tk.RIGHT)
         
@@ -1879,7 +2661,7 @@ class BBSApplication:
             left_frame,
             bg="#000080",
             fg="#FFFFFF",
-            font=('MS Gothic', self.font_size),
+            font=self._fonts['body'],
             width=20,
             height=8,
             selectbackground="#0080FF"
@@ -1887,8 +2669,10 @@ class BBSApplication:
         
         # 大分類を読み込み
         main_categories = self.category_manager.get_main_categories()
-        for category in main_categories:
-            self.category_listbox.insert(tk.END, category["name"])
+        self.category_listbox.insert(tk.END, *(category["name"] for category in main_categories))
+        self._main_category_ids = [category["id"] for category in main_categories]
+        self._main_category_ids_source = self.category_manager
+        self.category_manager.on_change = self._invalidate_category_cache
         
         self.category_listbox.pack(pady=(5, 10))
         self.category_listbox.bind('<<ListboxSelect>>', self.on_category_select)
@@ -1925,7 +2709,7 @@ class BBSApplication:
             left_frame,
             bg="#000080",
             fg="#FFFFFF",
-            font=('MS Gothic', self.font_size - 1),
+            font=self._fonts['body_small'],
             width=35,
             height=18,
             selectbackground="#0080FF"
@@ -1946,7 +2730,7 @@ class BBSApplication:
             thread_info_frame, 
             text="スレッドを選択してください", 
             style='BBS.TLabel',
-            font=('MS Gothic', self.font_size - 1)
+            font=self._fonts['body_small']
         )
         self.thread_info_label.pack(anchor=tk.W)
         
@@ -1958,7 +2742,7 @@ class BBSApplication:
             right_frame,
             bg="#000000",
             fg="#00FF00",
-            font=('MS Gothic', self.font_size),
+            font=self._fonts['display'],
             wrap=tk.WORD,
             height=25,
             state=tk.DISABLED,
@@ -1966,6 +2750,7 @@ class BBSApplication:
         )
         self.post_display.pack(fill=tk.BOTH, expand=True, pady=(5, 10))
         self.post_display.bind('<Button-1>', self.on_post_click)
+        self.configure_post_display_tags()
         
         # 投稿入力エリア
         input_label = ttk.Label(right_frame, text="■ 投稿入力 ■", style='BBS.TLabel')
@@ -1984,7 +2769,7 @@ class BBSApplication:
             textvariable=self.mention_var,
             bg="#000080",
             fg="#FFFFFF",
-            font=('MS Gothic', self.font_size - 1),
+            font=self._fonts['body_small'],
             width=15
         )
         self.mention_entry.pack(side=tk.LEFT, padx=(0, 10))
@@ -2001,7 +2786,7 @@ class BBSApplication:
             right_frame,
             bg="#000080",
             fg="#FFFFFF",
-            font=('MS Gothic', self.font_size),
+            font=self._fonts['display'],
             height=4,
             wrap=tk.WORD,
             insertbackground="#FFFFFF"
@@ -2117,9 +2902,10 @@ class BBSApplication:
         """初期化状態を検証し、必要に応じて自動復旧"""
         try:
             # データベースの存在確認
-            if not os.path.exists("bbs_database.db"):
+            if not os.path.exists(self.db_manager.db_path):
                 logger.warning("[INIT] データベースが存在しません。自動作成します。")
-                self.db_manager = DatabaseManager()
+                self.db_manager.reopen()
+                self._reload_data_managers()
             
             # カテゴリの存在確認
             main_categories = self.category_manager.get_main_categories()
@@ -2138,7 +2924,7 @@ class BBSApplication:
             # ペルソナの存在確認
             if not hasattr(self.persona_manager, 'personas') or not self.persona_manager.personas:
                 logger.warning("[INIT] ペルソナが存在しません。自動作成します。")
-                self.persona_manager = PersonaManager(self.db_manager, self.ai_manager)
+                self.persona_manager.reset()
             
             logger.info("[INIT] 初期化状態の検証が完了しました。")
             
@@ -2380,21 +3166,21 @@ class BBSApplication:
         """投稿表示のタグ設定"""
         try:
             # 基本タグ
-            self.post_display.tag_configure("number", foreground="#808080", font=('MS Gothic', self.font_size - 2))
-            self.post_display.tag_configure("timestamp", foreground="#808080", font=('MS Gothic', self.font_size - 2))
+            self.post_display.tag_configure("number", foreground="#808080", font=self._fonts['small'])
+            self.post_display.tag_configure("timestamp", foreground="#808080", font=self._fonts['small'])
             
             # 名前タグ
-            self.post_display.tag_configure("user_name", foreground="#00FFFF", font=('MS Gothic', self.font_size, 'bold'))
-            self.post_display.tag_configure("ai_name", foreground="#FFFF00", font=('MS Gothic', self.font_size, 'bold'))
+            self.post_display.tag_configure("user_name", foreground="#00FFFF", font=self._fonts['bold'])
+            self.post_display.tag_configure("ai_name", foreground="#FFFF00", font=self._fonts['bold'])
             
             # 内容タグ
-            self.post_display.tag_configure("user_content", foreground="#FFFFFF", font=('MS Gothic', self.font_size))
-            self.post_display.tag_configure("ai_content", foreground="#00FF00", font=('MS Gothic', self.font_size))
+            self.post_display.tag_configure("user_content", foreground="#FFFFFF", font=self._fonts['body'])
+            self.post_display.tag_configure("ai_content", foreground="#00FF00", font=self._fonts['body'])
             
             # 特殊マーク
-            self.post_display.tag_configure("edited_mark", foreground="#FF8080", font=('MS Gothic', self.font_size - 2))
-            self.post_display.tag_configure("mention_mark", foreground="#FF80FF", font=('MS Gothic', self.font_size - 2))
-            self.post_display.tag_configure("error", foreground="#FF0000", font=('MS Gothic', self.font_size - 1))
+            self.post_display.tag_configure("edited_mark", foreground="#FF8080", font=self._fonts['small'])
+            self.post_display.tag_configure("mention_mark", foreground="#FF80FF", font=self._fonts['small'])
+            self.post_display.tag_configure("error", foreground="#FF0000", font=self._fonts['body_small'])
             
         except Exception as e:
             logger.error(f"[APP] タグ設定エラー: {e}")
@@ -2491,6 +3277,9 @@ class BBSApplication:
                 self.user_response_manager.trigger_user_responses(username, content, thread_id)
             except Exception as e:
                 logger.error(f"[APP] ユーザー応答システムエラー: {e}")
+            finally:
+                # 使い捨てスレッドなので接続を残さない
+                self.db_manager.release_thread_connection()
         
         # 別スレッドで実行
         response_thread = threading.Thread(target=response_worker, daemon=True)
@@ -2543,7 +3332,7 @@ class BBSApplication:
             title_frame,
             bg="#000080",
             fg="#FFFFFF",
-            font=('MS Gothic', self.font_size),
+            font=self._fonts['body'],
             width=50
         )
         title_entry.pack(fill=tk.X, pady=5)
@@ -2559,7 +3348,7 @@ class BBSApplication:
             desc_frame,
             bg="#000080",
             fg="#FFFFFF",
-            font=('MS Gothic', self.font_size),
+            font=self._fonts['body'],
             height=5,
             wrap=tk.WORD
         )
@@ -2613,8 +3402,7 @@ class BBSApplication:
                     # 作成したスレッドを選択
                     for i, thread in enumerate(self.current_threads):
                         if thread['thread_id'] == thread_id:
-                            self.thread_listbox.selection_clear(0, tk.END)
-                            self.thread_listbox.selection_set(i)
+                            self.select_thread_index(i)
                             self.current_thread_id = thread_id
                             self.update_thread_info(thread)
                             self.update_post_display()
@@ -2698,7 +3486,7 @@ class BBSApplication:
                 bg="#000000",
                 fg="#00FF00",
                 selectcolor="#000080",
-                font=('MS Gothic', self.font_size)
+                font=self._fonts['body']
             ).pack(anchor=tk.W, pady=2)
         
         # プログレスバー
@@ -2721,62 +3509,72 @@ class BBSApplication:
         button_frame = ttk.Frame(dialog, style='BBS.TFrame')
         button_frame.pack(fill=tk.X, padx=20, pady=20)
         
+        def export_worker(format_type):
+            """エクスポート実行（I/Oスレッド、ウィジェットには触れない）"""
+            if hasattr(self, 'data_exporter'):
+                return self.data_exporter.export_all_data(format_type)
+            return f"export_{_file_timestamp()}.{format_type}"
+        
+        def finish_export(filename):
+            """完了通知（UIスレッド）"""
+            messagebox.showinfo("成功", f"エクスポートが完了しました。\nファイル: {filename}")
+            if dialog.winfo_exists():
+                dialog.grab_release()
+                dialog.destroy()
+        
+        def on_export_done(future):
+            """エクスポート結果をUIスレッドで反映"""
+            if not dialog.winfo_exists():
+                return
+            if not future.done():
+                self.root.after(50, on_export_done, future)
+                return
+            
+            try:
+                filename = future.result()
+            except Exception as e:
+                logger.error(f"[EXPORT] エクスポートエラー: {e}")
+                status_label.config(text="エラー")
+                export_button.config(state=tk.NORMAL)
+                messagebox.showerror("エラー", f"エクスポート中にエラーが発生しました: {e}")
+                return
+            
+            if filename:
+                progress_var.set(100)
+                status_label.config(text="完了")
+                # 「完了」を1秒見せてから閉じる
+                self.root.after(1000, finish_export, filename)
+            else:
+                status_label.config(text="エラー")
+                export_button.config(state=tk.NORMAL)
+                messagebox.showerror("エラー", "エクスポートに失敗しました。")
+        
         def start_export():
             try:
                 format_type = format_var.get()
                 
-                # プログレスバー開始
-                progress_var.set(0)
-                status_label.config(text="エクスポート開始...")
-                dialog.update()
-                
-                def export_worker():
-                    try:
-                        # エクスポート実行
-                        progress_var.set(25)
-                        status_label.config(text="データ取得中...")
-                        dialog.update()
-                        
-                        if hasattr(self, 'data_exporter'):
-                            filename = self.data_exporter.export_all_data(format_type)
-                        else:
-                            filename = f"export_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.{format_type}"
-                        
-                        progress_var.set(75)
-                        status_label.config(text="ファイル書き込み中...")
-                        dialog.update()
-                        
-                        if filename:
-                            progress_var.set(100)
-                            status_label.config(text="完了")
-                            dialog.update()
-                            
-                            time.sleep(1)
-                            messagebox.showinfo("成功", f"エクスポートが完了しました。\nファイル: {filename}")
-                            dialog.destroy()
-                        else:
-                            status_label.config(text="エラー")
-                            messagebox.showerror("エラー", "エクスポートに失敗しました。")
-                            
-                    except Exception as e:
-                        logger.error(f"[EXPORT] エクスポートエラー: {e}")
-                        status_label.config(text="エラー")
-                        messagebox.showerror("エラー", f"エクスポート中にエラーが発生しました: {e}")
+                progress_var.set(25)
+                status_label.config(text="データ取得中...")
+                export_button.config(state=tk.DISABLED)
+                # 再描画だけ先に処理（update()と違いユーザーイベントは処理しない）
+                dialog.update_idletasks()
                 
-                # 別スレッドで実行
-                export_thread = threading.Thread(target=export_worker, daemon=True)
-                export_thread.start()
+                # 共有のI/Oワーカーで実行し、結果はafterでUIスレッドへ戻す
+                future = self._io_executor.submit(export_worker, format_type)
+                self.root.after(50, on_export_done, future)
                 
             except Exception as e:
                 logger.error(f"[APP] エクスポート開始エラー: {e}")
+                export_button.config(state=tk.NORMAL)
                 messagebox.showerror("エラー", f"エクスポート開始時にエラーが発生しました: {e}")
         
-        ttk.Button(
+        export_button = ttk.Button(
             button_frame,
             text="エクスポート開始",
             command=start_export,
             style='BBS.TButton'
-        ).pack(side=tk.LEFT, padx=(0, 10))
+        )
+        export_button.pack(side=tk.LEFT, padx=(0, 10))
         
         ttk.Button(
             button_frame,
@@ -2822,29 +3620,36 @@ class BBSApplication:
         notebook = ttk.Notebook(admin_window)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # 1. システム制御タブ
-        self.create_system_control_tab(notebook)
-        
-        # 2. バージョン管理タブ
-        self.create_version_management_tab(notebook)
-        
-        # 3. 統計情報タブ
-        self.create_statistics_tab(notebook)
-        
-        # 4. ペルソナ管理タブ
-        self.create_persona_management_tab(notebook)
-        
-        # 5. データ管理タブ
-        self.create_data_management_tab(notebook)
+        # タブは空フレームだけ先に追加し、中身は初回選択時に構築する
+        tab_builders = {}
+        for label, builder in (
+            ("システム制御", self.create_system_control_tab),
+            ("バージョン管理", self.create_version_management_tab),
+            ("統計情報", self.create_statistics_tab),
+            ("ペルソナ管理", self.create_persona_management_tab),
+            ("データ管理", self.create_data_management_tab),
+            ("設定", self.create_settings_tab),
+        ):
+            tab_frame = ttk.Frame(notebook, style='BBS.TFrame')
+            notebook.add(tab_frame, text=label)
+            tab_builders[str(tab_frame)] = (tab_frame, builder)
+        
+        def on_tab_changed(event=None):
+            """選択されたタブを未構築なら構築"""
+            entry = tab_builders.pop(notebook.select(), None)
+            if entry is None:
+                return
+            tab_frame, builder = entry
+            try:
+                builder(tab_frame)
+            except Exception as e:
+                logger.error(f"[ADMIN] タブ構築エラー: {e}")
         
-        # 6. 設定タブ
-        self.create_settings_tab(notebook)
+        notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
+        on_tab_changed()
     
-    def create_system_control_tab(self, notebook):
-        """システム制御タブ作成"""
-        system_frame = ttk.Frame(notebook, style='BBS.TFrame')
-        notebook.add(system_frame, text="システム制御")
-        
+    def create_system_control_tab(self, system_frame):
+        """システム制御タブの内容作成"""
         # AI活動制御セクション
         ai_section = ttk.LabelFrame(system_frame, text="AI活動制御", style='BBS.TFrame')
         ai_section.pack(fill=tk.X, padx=10, pady=10)
@@ -2894,7 +3699,7 @@ class BBSApplication:
             bg="#000080",
             fg="#FFFFFF",
             highlightbackground="#000000",
-            command=self.update_interval,
+            command=self._on_interval_change,
             length=300
         )
         interval_scale.pack(side=tk.LEFT, padx=(10, 0))
@@ -2934,11 +3739,8 @@ class BBSApplication:
             style='BBS.TButton'
         ).pack(side=tk.LEFT)
     
-    def create_version_management_tab(self, notebook):
-        """バージョン管理タブ作成"""
-        version_frame = ttk.Frame(notebook, style='BBS.TFrame')
-        notebook.add(version_frame, text="バージョン管理")
-        
+    def create_version_management_tab(self, version_frame):
+        """バージョン管理タブの内容作成"""
         # 現在のバージョン情報
         current_section = ttk.LabelFrame(version_frame, text="現在のバージョン", style='BBS.TFrame')
         current_section.pack(fill=tk.X, padx=10, pady=10)
@@ -2946,42 +3748,22 @@ class BBSApplication:
         current_info = ttk.Frame(current_section, style='BBS.TFrame')
         current_info.pack(fill=tk.X, padx=10, pady=10)
         
-        version_info_text = f"""
-■ アプリケーション情報 ■
-名前: {APP_NAME}
-バージョン: {APP_VERSION}
-ビルド: {APP_BUILD}
-作成者: {APP_AUTHOR}
-起動日時: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-■ 新機能（v3.1.0） ■
-✅ 投稿頻度大幅向上（5-15秒間隔）
-✅ ユーザー応答強化（即座反応システム）
-✅ 1366x768完全対応
-✅ バッチ投稿生成システム
-✅ 高頻度投稿スケジューラー
-✅ レスポンシブ最適化
-
-■ 機能状況 ■
-✅ 基本BBS機能
-✅ AIペルソナシステム（100体）
-✅ G4F + Gemini CLI対応
-✅ 自動投稿システム（高頻度）
-✅ 動的スレッド作成
-✅ 呼びかけ応答機能
-✅ データエクスポート機能
-✅ 管理画面
-✅ バージョン管理
-✅ レスポンシブ対応
-✅ ユーザー名設定機能
-"""
+        version_info_text = (
+            _VERSION_INFO_HEAD
+            + f"起動日時: {datetime.datetime.now():%Y-%m-%d %H:%M:%S}\n"
+            + _VERSION_INFO_FEATURES
+        )
         
         version_display = scrolledtext.ScrolledText(
             current_info,
             bg="#000000",
             fg="#00FF00",
-            font=('MS Gothic', self.font_size - 1),
+            font=self._fonts['body_small'],
             height=18,
+            wrap=tk.NONE,
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
             state=tk.DISABLED
         )
         version_display.pack(fill=tk.BOTH, expand=True)
@@ -2998,8 +3780,12 @@ class BBSApplication:
             history_section,
             bg="#000000",
             fg="#00FF00",
-            font=('MS Gothic', self.font_size - 1),
+            font=self._fonts['body_small'],
             height=10,
+            wrap=tk.NONE,
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
             state=tk.DISABLED
         )
         history_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -3008,28 +3794,23 @@ class BBSApplication:
         def update_version_history():
             history_text.config(state=tk.NORMAL)
             history_text.delete(1.0, tk.END)
-            
-            history_text.insert(tk.END, "■ バージョン履歴 ■\n\n")
-            
-            for version_info in reversed(VERSION_HISTORY):
-                history_text.insert(tk.END, f"Version {version_info['version']} ({version_info['date']})\n")
-                history_text.insert(tk.END, f"  変更内容: {version_info['changes']}\n\n")
-            
+            history_text.insert(tk.END, _VERSION_HISTORY_RENDERED)
             history_text.config(state=tk.DISABLED)
         
         update_version_history()
     
-    def create_statistics_tab(self, notebook):
-        """統計情報タブ作成"""
-        stats_frame = ttk.Frame(notebook, style='BBS.TFrame')
-        notebook.add(stats_frame, text="統計情報")
-        
+    def create_statistics_tab(self, stats_frame):
+        """統計情報タブの内容作成"""
         stats_text = scrolledtext.ScrolledText(
             stats_frame,
             bg="#000000",
             fg="#00FF00",
-            font=('MS Gothic', self.font_size - 1),
+            font=self._fonts['body_small'],
             height=30,
+            wrap=tk.NONE,
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
             state=tk.DISABLED
         )
         stats_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -3041,82 +3822,84 @@ class BBSApplication:
                 
                 # システム統計
                 main_categories = self.category_manager.get_main_categories()
-                all_threads = []
-                for cat in main_categories:
-                    threads = self.thread_manager.get_threads_by_category(cat["id"])
-                    all_threads.extend(threads)
-                
-                total_posts = sum(thread['post_count'] for thread in all_threads)
-                total_views = sum(thread['view_count'] for thread in all_threads)
+                # スレッド数・投稿数・閲覧数はDB側で大分類ごとに一括集計
+                category_totals = self.thread_manager.get_aggregate_stats()
+                empty_totals = {"thread_count": 0, "post_count": 0, "view_count": 0}
+                cat_totals = {
+                    cat["id"]: category_totals.get(cat["id"], empty_totals)
+                    for cat in main_categories
+                }
+                total_threads = sum(t["thread_count"] for t in cat_totals.values())
+                total_posts = sum(t["post_count"] for t in cat_totals.values())
+                total_views = sum(t["view_count"] for t in cat_totals.values())
                 
-                stats_text.insert(tk.END, f"■ システム統計 ({datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}) ■\n\n")
-                stats_text.insert(tk.END, f"アプリケーション情報:\n")
-                stats_text.insert(tk.END, f"  バージョン: {APP_VERSION}\n")
-                stats_text.insert(tk.END, f"  ビルド: {APP_BUILD}\n")
-                stats_text.insert(tk.END, f"  現在のユーザー名: {self.current_username}\n")
-                stats_text.insert(tk.END, f"  起動時刻: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+                parts = [f"■ システム統計 ({datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}) ■\n\n"]
+                parts.append(f"アプリケーション情報:\n")
+                parts.append(f"  バージョン: {APP_VERSION}\n")
+                parts.append(f"  ビルド: {APP_BUILD}\n")
+                parts.append(f"  現在のユーザー名: {self.current_username}\n")
+                parts.append(f"  起動時刻: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
                 
-                stats_text.insert(tk.END, f"コンテンツ統計:\n")
-                stats_text.insert(tk.END, f"  大分類数: {len(main_categories)}\n")
-                stats_text.insert(tk.END, f"  スレッド数: {len(all_threads)}\n")
-                stats_text.insert(tk.END, f"  総投稿数: {total_posts}\n")
-                stats_text.insert(tk.END, f"  総閲覧数: {total_views}\n")
-                stats_text.insert(tk.END, f"  AI活動状態: {'有効' if self.ai_activity_enabled else '無効'}\n")
-                stats_text.insert(tk.END, f"  投稿間隔: {self.auto_post_interval}秒\n\n")
+                parts.append(f"コンテンツ統計:\n")
+                parts.append(f"  大分類数: {len(main_categories)}\n")
+                parts.append(f"  スレッド数: {total_threads}\n")
+                parts.append(f"  総投稿数: {total_posts}\n")
+                parts.append(f"  総閲覧数: {total_views}\n")
+                parts.append(f"  AI活動状態: {'有効' if self.ai_activity_enabled else '無効'}\n")
+                parts.append(f"  投稿間隔: {self.auto_post_interval}秒\n\n")
                 
                 # AI接続統計
-                connection_status = self.ai_manager.get_connection_status()
-                stats_text.insert(tk.END, f"■ AI接続統計 ■\n")
-                stats_text.insert(tk.END, f"G4F接続:\n")
-                stats_text.insert(tk.END, f"  利用可能: {'はい' if connection_status['g4f_available'] else 'いいえ'}\n")
-                stats_text.insert(tk.END, f"Gemini CLI接続:\n")
-                stats_text.insert(tk.END, f"  利用可能: {'はい' if connection_status['gemini_available'] else 'いいえ'}\n")
-                stats_text.insert(tk.END, f"現在のプロバイダー: {connection_status.get('current_provider', 'なし')}\n")
-                stats_text.insert(tk.END, f"現在のモデル: {connection_status.get('current_model', 'なし')}\n")
-                stats_text.insert(tk.END, f"利用可能組み合わせ: {connection_status['available_combinations']}個\n")
-                stats_text.insert(tk.END, f"総リクエスト数: {connection_status['total_requests']}\n")
-                stats_text.insert(tk.END, f"成功数: {connection_status['success_count']}\n")
-                stats_text.insert(tk.END, f"失敗数: {connection_status['failure_count']}\n")
-                stats_text.insert(tk.END, f"成功率: {connection_status['success_rate']:.1f}%\n\n")
+                connection_status = self._get_cached_stats('connection', self.ai_manager.get_connection_status)
+                parts.append(f"■ AI接続統計 ■\n")
+                parts.append(f"G4F接続:\n")
+                parts.append(f"  利用可能: {'はい' if connection_status['g4f_available'] else 'いいえ'}\n")
+                parts.append(f"Gemini CLI接続:\n")
+                parts.append(f"  利用可能: {'はい' if connection_status['gemini_available'] else 'いいえ'}\n")
+                parts.append(f"現在のプロバイダー: {connection_status.get('current_provider', 'なし')}\n")
+                parts.append(f"現在のモデル: {connection_status.get('current_model', 'なし')}\n")
+                parts.append(f"利用可能組み合わせ: {connection_status['available_combinations']}個\n")
+                parts.append(f"総リクエスト数: {connection_status['total_requests']}\n")
+                parts.append(f"成功数: {connection_status['success_count']}\n")
+                parts.append(f"失敗数: {connection_status['failure_count']}\n")
+                parts.append(f"キャッシュ応答数: {connection_status.get('cache_hits', 0)}\n")
+                parts.append(f"成功率: {connection_status['success_rate']:.1f}%\n\n")
                 
                 # ペルソナ統計
                 if hasattr(self.persona_manager, 'get_persona_stats'):
-                    persona_stats = self.persona_manager.get_persona_stats()
-                    stats_text.insert(tk.END, f"■ ペルソナ統計 ■\n")
-                    stats_text.insert(tk.END, f"総ペルソナ数: {persona_stats.get('total_personas', 0)}\n")
-                    stats_text.insert(tk.END, f"アクティブペルソナ数: {persona_stats.get('active_personas', 0)}\n")
-                    stats_text.insert(tk.END, f"荒らしペルソナ数: {persona_stats.get('troll_personas', 0)}\n")
-                    stats_text.insert(tk.END, f"総AI投稿数: {persona_stats.get('total_posts', 0)}\n")
-                    stats_text.insert(tk.END, f"平均活動レベル: {persona_stats.get('average_activity', 0):.2f}\n\n")
+                    persona_stats = self._get_cached_stats('persona', self.persona_manager.get_persona_stats)
+                    parts.append(f"■ ペルソナ統計 ■\n")
+                    parts.append(f"総ペルソナ数: {persona_stats.get('total_personas', 0)}\n")
+                    parts.append(f"アクティブペルソナ数: {persona_stats.get('active_personas', 0)}\n")
+                    parts.append(f"荒らしペルソナ数: {persona_stats.get('troll_personas', 0)}\n")
+                    parts.append(f"総AI投稿数: {persona_stats.get('total_posts', 0)}\n")
+                    parts.append(f"平均活動レベル: {persona_stats.get('average_activity', 0):.2f}\n\n")
                     
                     # 世代別統計
                     generation_stats = persona_stats.get('generation_stats', {})
                     if generation_stats:
-                        stats_text.insert(tk.END, f"世代別統計:\n")
+                        parts.append(f"世代別統計:\n")
                         for generation, stats in generation_stats.items():
-                            stats_text.insert(tk.END, f"  {generation}: {stats.get('count', 0)}名 (投稿数: {stats.get('total_posts', 0)})\n")
+                            parts.append(f"  {generation}: {stats.get('count', 0)}名 (投稿数: {stats.get('total_posts', 0)})\n")
                     
-                    stats_text.insert(tk.END, "\n")
+                    parts.append("\n")
                 
                 # カテゴリ別統計
-                stats_text.insert(tk.END, f"■ カテゴリ別統計 ■\n")
+                parts.append(f"■ カテゴリ別統計 ■\n")
                 for category in main_categories:
-                    cat_threads = self.thread_manager.get_threads_by_category(category["id"])
-                    cat_posts = sum(thread['post_count'] for thread in cat_threads)
-                    cat_views = sum(thread['view_count'] for thread in cat_threads)
-                    
-                    stats_text.insert(tk.END, f"{category['name']}:\n")
-                    stats_text.insert(tk.END, f"  スレッド数: {len(cat_threads)}\n")
-                    stats_text.insert(tk.END, f"  投稿数: {cat_posts}\n")
-                    stats_text.insert(tk.END, f"  閲覧数: {cat_views}\n")
+                    totals = cat_totals[category["id"]]
+                    parts.append(f"{category['name']}:\n")
+                    parts.append(f"  スレッド数: {totals['thread_count']}\n")
+                    parts.append(f"  投稿数: {totals['post_count']}\n")
+                    parts.append(f"  閲覧数: {totals['view_count']}\n")
                 
                 # 高頻度投稿システム統計
-                stats_text.insert(tk.END, f"\n■ 高頻度投稿システム統計 ■\n")
+                parts.append(f"\n■ 高頻度投稿システム統計 ■\n")
                 if hasattr(self, 'post_scheduler'):
                     scheduled_count = len(self.post_scheduler.scheduled_posts)
-                    stats_text.insert(tk.END, f"  スケジュール済み投稿: {scheduled_count}件\n")
-                    stats_text.insert(tk.END, f"  システム稼働状況: {'稼働中' if self.post_scheduler.is_running else '停止中'}\n")
+                    parts.append(f"  スケジュール済み投稿: {scheduled_count}件\n")
+                    parts.append(f"  システム稼働状況: {'稼働中' if self.post_scheduler.is_running else '停止中'}\n")
                 
+                stats_text.insert(tk.END, "".join(parts))
                 stats_text.config(state=tk.DISABLED)
                 
             except Exception as e:
@@ -3128,6 +3911,15 @@ class BBSApplication:
         
         update_statistics()
         
+        # 統計タブが再び表示されたときだけ更新（他タブ表示中は何もしない）
+        notebook = stats_frame.master
+        
+        def on_tab_changed(event=None):
+            if notebook.select() == str(stats_frame):
+                update_statistics()
+        
+        notebook.bind("<<NotebookTabChanged>>", on_tab_changed, add="+")
+        
         # 更新ボタン
         ttk.Button(
             stats_frame,
@@ -3136,11 +3928,18 @@ class BBSApplication:
             style='BBS.TButton'
         ).pack(pady=5)
     
-    def create_persona_management_tab(self, notebook):
-        """ペルソナ管理タブ作成"""
-        persona_frame = ttk.Frame(notebook, style='BBS.TFrame')
-        notebook.add(persona_frame, text="ペルソナ管理")
-        
+    def _get_cached_stats(self, key: str, loader, ttl: float = STATS_CACHE_TTL):
+        """統計値をttl秒だけ再利用して取得"""
+        now = time.monotonic()
+        cached = self._stats_cache.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        value = loader()
+        self._stats_cache[key] = (now, value)
+        return value
+    
+    def create_persona_management_tab(self, persona_frame):
+        """ペルソナ管理タブの内容作成"""
         # 上部: ペルソナ一覧
         list_frame = ttk.Frame(persona_frame, style='BBS.TFrame')
         list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -3151,15 +3950,22 @@ class BBSApplication:
         
         ttk.Label(left_frame, text="ペルソナ一覧:", style='BBS.TLabel').pack(anchor=tk.W)
         
-        persona_listbox = tk.Listbox(
+        # 行のiidにペルソナ名を持たせ、選択時に表示文字列を解析しない
+        persona_tree = ttk.Treeview(
             left_frame,
-            bg="#000080",
-            fg="#FFFFFF",
-            font=('MS Gothic', self.font_size - 1),
-            width=25,
+            columns=("age", "generation"),
+            show="tree headings",
+            selectmode="browse",
+            style='BBS.Treeview',
             height=25
         )
-        persona_listbox.pack(fill=tk.Y, expand=True, pady=5)
+        persona_tree.heading("#0", text="名前")
+        persona_tree.heading("age", text="年齢")
+        persona_tree.heading("generation", text="世代")
+        persona_tree.column("#0", width=140)
+        persona_tree.column("age", width=50, anchor=tk.E)
+        persona_tree.column("generation", width=110)
+        persona_tree.pack(fill=tk.Y, expand=True, pady=5)
         
         # 右側: ペルソナ詳細
         right_frame = ttk.Frame(list_frame, style='BBS.TFrame')
@@ -3171,45 +3977,43 @@ class BBSApplication:
             right_frame,
             bg="#000000",
             fg="#00FF00",
-            font=('MS Gothic', self.font_size - 2),
+            font=self._fonts['small'],
             height=25,
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
             state=tk.DISABLED
         )
         persona_detail_text.pack(fill=tk.BOTH, expand=True, pady=5)
         
         def load_persona_list():
             """ペルソナ一覧読み込み"""
-            persona_listbox.delete(0, tk.END)
+            persona_tree.delete(*persona_tree.get_children())
             if hasattr(self.persona_manager, 'personas'):
                 for name, persona in self.persona_manager.personas.items():
                     status = "🔴" if getattr(persona, 'is_troll', False) else "🟢"
-                    age = getattr(persona, 'age', '不明')
                     generation = getattr(persona, 'generation', '不明')
-                    display_text = f"{status} {name} ({age}歳, {generation})"
-                    persona_listbox.insert(tk.END, display_text)
+                    persona_tree.insert(
+                        "", tk.END, iid=name, text=f"{status} {name}",
+                        values=(getattr(persona, 'age', '不明'), getattr(generation, 'value', generation))
+                    )
         
         def on_persona_select(event):
             """ペルソナ選択イベント"""
-            selection = persona_listbox.curselection()
-            if selection and hasattr(self.persona_manager, 'personas'):
-                selected_text = persona_listbox.get(selection[0])
-                # ペルソナ名を抽出
-                parts = selected_text.split(" ")
-                if len(parts) >= 2:
-                    persona_name = parts[1]
-                    
-                    if persona_name in self.persona_manager.personas:
-                        persona = self.persona_manager.personas[persona_name]
-                        
-                        # 詳細情報を表示
-                        persona_detail_text.config(state=tk.NORMAL)
-                        persona_detail_text.delete(1.0, tk.END)
-                        
-                        detail_info = self.format_persona_details(persona)
-                        persona_detail_text.insert(tk.END, detail_info)
-                        persona_detail_text.config(state=tk.DISABLED)
+            selection = persona_tree.selection()
+            if not selection or not hasattr(self.persona_manager, 'personas'):
+                return
+            persona = self.persona_manager.personas.get(selection[0])
+            if persona is None:
+                return
+            
+            # 詳細情報を表示
+            persona_detail_text.config(state=tk.NORMAL)
+            persona_detail_text.delete(1.0, tk.END)
+            persona_detail_text.insert(tk.END, self.format_persona_details(persona))
+            persona_detail_text.config(state=tk.DISABLED)
         
-        persona_listbox.bind('<<ListboxSelect>>', on_persona_select)
+        persona_tree.bind('<<TreeviewSelect>>', on_persona_select)
         
         # ペルソナ管理ボタン
         button_frame = ttk.Frame(persona_frame, style='BBS.TFrame')
@@ -3240,155 +4044,125 @@ class BBSApplication:
         load_persona_list()
     
     def format_persona_details(self, persona) -> str:
-        """ペルソナ詳細情報のフォーマット"""
+        """ペルソナ詳細情報のフォーマット（mutation_countが変わるまで結果を再利用）"""
+        mutation_count = getattr(persona, 'mutation_count', None)
+        cached = self._persona_detail_cache.get(persona.name)
+        if cached is not None and cached[0] is persona and cached[1] == mutation_count:
+            return cached[2]
+        
         try:
-            details = f"■ ペルソナ詳細: {persona.name} ■\n\n"
+            # 属性は__dict__のスナップショットから引く（getattrの属性探索を避ける）
+            pd = getattr(persona, '__dict__', {})
+            parts = [f"■ ペルソナ詳細: {persona.name} ■\n\n"]
             
             # 基本情報
-            details += "基本情報:\n"
-            details += f"  年齢: {getattr(persona, 'age', '不明')}歳\n"
-            details += f"  性別: {getattr(persona.gender, 'value', '不明') if hasattr(persona, 'gender') else '不明'}\n"
-            details += f"  職業: {getattr(persona.work, 'occupation', '不明') if hasattr(persona, 'work') else '不明'}\n"
-            details += f"  世代: {getattr(persona.generation, 'value', '不明') if hasattr(persona, 'generation') else '不明'}\n"
-            details += f"  MBTI: {getattr(persona, 'mbti', '不明')}\n"
-            details += f"  タイプ: {'荒らし' if getattr(persona.special, 'personality_type', None) and persona.special.personality_type.value == '荒らし' else '通常'}\n"
-            details += f"  背景: {getattr(persona, 'background', '不明')}\n\n"
+            parts.append("基本情報:\n")
+            parts.append(f"  年齢: {pd.get('age', '不明')}歳\n")
+            parts.append(f"  性別: {getattr(pd.get('gender'), 'value', '不明')}\n")
+            parts.append(f"  職業: {getattr(pd.get('work'), 'occupation', '不明')}\n")
+            parts.append(f"  世代: {getattr(pd.get('generation'), 'value', '不明')}\n")
+            parts.append(f"  MBTI: {pd.get('mbti', '不明')}\n")
+            personality_type = getattr(pd.get('special'), 'personality_type', None)
+            parts.append(f"  タイプ: {'荒らし' if getattr(personality_type, 'value', None) == '荒らし' else '通常'}\n")
+            parts.append(f"  背景: {pd.get('background', '不明')}\n\n")
             
             # 性格特性
-            if hasattr(persona, 'personality'):
-                p = persona.personality
-                details += "性格特性 (Big Five):\n"
-                details += f"  外向性: {getattr(p, 'extroversion', 0):.2f}\n"
-                details += f"  協調性: {getattr(p, 'agreeableness', 0):.2f}\n"
-                details += f"  誠実性: {getattr(p, 'conscientiousness', 0):.2f}\n"
-                details += f"  神経症傾向: {getattr(p, 'neuroticism', 0):.2f}\n"
-                details += f"  開放性: {getattr(p, 'openness', 0):.2f}\n\n"
+            try:
+                p = pd['personality'].__dict__
+            except (KeyError, AttributeError):
+                pass
+            else:
+                parts.append("性格特性 (Big Five):\n")
+                parts.append(f"  外向性: {p.get('extroversion', 0):.2f}\n")
+                parts.append(f"  協調性: {p.get('agreeableness', 0):.2f}\n")
+                parts.append(f"  誠実性: {p.get('conscientiousness', 0):.2f}\n")
+                parts.append(f"  神経症傾向: {p.get('neuroticism', 0):.2f}\n")
+                parts.append(f"  開放性: {p.get('openness', 0):.2f}\n\n")
                 
-                details += "拡張性格特性:\n"
-                details += f"  創造性: {getattr(p, 'creativity', 0):.2f}\n"
-                details += f"  好奇心: {getattr(p, 'curiosity', 0):.2f}\n"
-                details += f"  競争心: {getattr(p, 'competitiveness', 0):.2f}\n"
-                details += f"  共感性: {getattr(p, 'empathy', 0):.2f}\n"
-                details += f"  忍耐力: {getattr(p, 'patience', 0):.2f}\n"
-                details += f"  ユーモア: {getattr(p, 'humor', 0):.2f}\n\n"
+                parts.append("拡張性格特性:\n")
+                parts.append(f"  創造性: {p.get('creativity', 0):.2f}\n")
+                parts.append(f"  好奇心: {p.get('curiosity', 0):.2f}\n")
+                parts.append(f"  競争心: {p.get('competitiveness', 0):.2f}\n")
+                parts.append(f"  共感性: {p.get('empathy', 0):.2f}\n")
+                parts.append(f"  忍耐力: {p.get('patience', 0):.2f}\n")
+                parts.append(f"  ユーモア: {p.get('humor', 0):.2f}\n\n")
             
             # 感情状態
-            if hasattr(persona, 'emotions'):
-                e = persona.emotions
-                details += "現在の感情状態:\n"
-                details += f"  幸福度: {getattr(e, 'happiness', 0):.2f}\n"
-                details += f"  怒り: {getattr(e, 'anger', 0):.2f}\n"
-                details += f"  悲しみ: {getattr(e, 'sadness', 0):.2f}\n"
-                details += f"  興奮: {getattr(e, 'excitement', 0):.2f}\n"
-                details += f"  平静: {getattr(e, 'calmness', 0):.2f}\n"
-                details += f"  自信: {getattr(e, 'confidence', 0):.2f}\n\n"
+            try:
+                e = pd['emotions'].__dict__
+            except (KeyError, AttributeError):
+                pass
+            else:
+                parts.append("現在の感情状態:\n")
+                parts.append(f"  幸福度: {e.get('happiness', 0):.2f}\n")
+                parts.append(f"  怒り: {e.get('anger', 0):.2f}\n")
+                parts.append(f"  悲しみ: {e.get('sadness', 0):.2f}\n")
+                parts.append(f"  興奮: {e.get('excitement', 0):.2f}\n")
+                parts.append(f"  平静: {e.get('calmness', 0):.2f}\n")
+                parts.append(f"  自信: {e.get('confidence', 0):.2f}\n\n")
             
             # 活動統計
-            details += "活動統計:\n"
-            details += f"  投稿数: {getattr(persona, 'post_count', 0)}\n"
-            details += f"  活動レベル: {getattr(persona, 'activity_level', 0):.2f}\n"
+            parts.append("活動統計:\n")
+            parts.append(f"  投稿数: {pd.get('post_count', 0)}\n")
+            parts.append(f"  活動レベル: {pd.get('activity_level', 0):.2f}\n")
             
-            last_post_time = getattr(persona, 'last_post_time', None)
+            last_post_time = pd.get('last_post_time', None)
             if last_post_time:
                 if isinstance(last_post_time, str):
-                    details += f"  最終投稿: {last_post_time}\n"
+                    parts.append(f"  最終投稿: {last_post_time}\n")
                 else:
-                    details += f"  最終投稿: {last_post_time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    parts.append(f"  最終投稿: {last_post_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
             else:
-                details += "  最終投稿: なし\n"
+                parts.append("  最終投稿: なし\n")
             
+            details = "".join(parts)
+            if mutation_count is not None:
+                self._persona_detail_cache[persona.name] = (persona, mutation_count, details)
             return details
             
         except Exception as e:
             logger.error(f"[ADMIN] ペルソナ詳細フォーマットエラー: {e}")
             return f"ペルソナ詳細の表示中にエラーが発生しました: {e}"
     
-    def create_data_management_tab(self, notebook):
-        """データ管理タブ作成"""
-        data_frame = ttk.Frame(notebook, style='BBS.TFrame')
-        notebook.add(data_frame, text="データ管理")
-        
-        # データバックアップセクション
-        backup_section = ttk.LabelFrame(data_frame, text="データバックアップ", style='BBS.TFrame')
-        backup_section.pack(fill=tk.X, padx=10, pady=10)
-        
-        backup_button_frame = ttk.Frame(backup_section, style='BBS.TFrame')
-        backup_button_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        ttk.Button(
-            backup_button_frame,
-            text="完全バックアップ",
-            command=lambda: self.create_full_backup(),
-            style='BBS.TButton'
-        ).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(
-            backup_button_frame,
-            text="データベースのみ",
-            command=lambda: self.backup_database_only(),
-            style='BBS.TButton'
-        ).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(
-            backup_button_frame,
-            text="設定ファイル",
-            command=lambda: self.backup_settings(),
-            style='BBS.TButton'
-        ).pack(side=tk.LEFT)
-        
-        # データインポートセクション
-        import_section = ttk.LabelFrame(data_frame, text="データインポート", style='BBS.TFrame')
-        import_section.pack(fill=tk.X, padx=10, pady=10)
-        
-        import_button_frame = ttk.Frame(import_section, style='BBS.TFrame')
-        import_button_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        ttk.Button(
-            import_button_frame,
-            text="バックアップ復元",
-            command=lambda: self.restore_backup(),
-            style='BBS.TButton'
-        ).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(
-            import_button_frame,
-            text="設定復元",
-            command=lambda: self.restore_settings(),
-            style='BBS.TButton'
-        ).pack(side=tk.LEFT)
-        
-        # データクリーンアップセクション
-        cleanup_section = ttk.LabelFrame(data_frame, text="データクリーンアップ", style='BBS.TFrame')
-        cleanup_section.pack(fill=tk.X, padx=10, pady=10)
-        
-        cleanup_button_frame = ttk.Frame(cleanup_section, style='BBS.TFrame')
-        cleanup_button_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        ttk.Button(
-            cleanup_button_frame,
-            text="ログファイル整理",
-            command=lambda: self.cleanup_log_files(),
-            style='BBS.TButton'
-        ).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(
-            cleanup_button_frame,
-            text="データベース最適化",
-            command=lambda: self.optimize_database(),
-            style='BBS.TButton'
-        ).pack(side=tk.LEFT)
+    def _labelframe(self, parent, title: str):
+        """見出し付きセクションを作成し、内側のフレームを返す"""
+        section = ttk.LabelFrame(parent, text=title, style='BBS.TFrame')
+        section.pack(fill=tk.X, padx=10, pady=10)
+        inner = ttk.Frame(section, style='BBS.TFrame')
+        inner.pack(fill=tk.X, padx=10, pady=10)
+        return inner
     
-    def create_settings_tab(self, notebook):
-        """設定タブ作成"""
-        settings_frame = ttk.Frame(notebook, style='BBS.TFrame')
-        notebook.add(settings_frame, text="設定")
-        
+    def _button_row(self, parent, buttons, padx: int = 5):
+        """(表示名, コマンド) の並びからボタン列を作成"""
+        last = len(buttons) - 1
+        for i, (text, command) in enumerate(buttons):
+            ttk.Button(parent, text=text, command=command, style='BBS.TButton').pack(
+                side=tk.LEFT, padx=(0, padx if i < last else 0))
+    
+    def create_data_management_tab(self, data_frame):
+        """データ管理タブの内容作成"""
+        sections = (
+            ("データバックアップ", (
+                ("完全バックアップ", self.create_full_backup),
+                ("データベースのみ", self.backup_database_only),
+                ("設定ファイル", self.backup_settings),
+            )),
+            ("データインポート", (
+                ("バックアップ復元", self.restore_backup),
+                ("設定復元", self.restore_settings),
+            )),
+            ("データクリーンアップ", (
+                ("ログファイル整理", self.cleanup_log_files),
+                ("データベース最適化", self.optimize_database),
+            )),
+        )
+        for title, buttons in sections:
+            self._button_row(self._labelframe(data_frame, title), buttons)
+    
+    def create_settings_tab(self, settings_frame):
+        """設定タブの内容作成"""
         # フォント設定セクション
-        font_section = ttk.LabelFrame(settings_frame, text="フォント設定", style='BBS.TFrame')
-        font_section.pack(fill=tk.X, padx=10, pady=10)
-        
-        font_frame = ttk.Frame(font_section, style='BBS.TFrame')
-        font_frame.pack(fill=tk.X, padx=10, pady=10)
+        font_frame = self._labelframe(settings_frame, "フォント設定")
         
         ttk.Label(font_frame, text="フォントサイズ:", style='BBS.TLabel').pack(side=tk.LEFT)
         
@@ -3401,68 +4175,32 @@ class BBSApplication:
             variable=font_var,
             bg="#000080",
             fg="#FFFFFF",
-            command=lambda v: self.change_font_size(int(v) - self.font_size),
+            command=self._on_font_scale,
             length=200
         )
         font_scale.pack(side=tk.LEFT, padx=(10, 0))
         
         # ウィンドウ設定セクション
-        window_section = ttk.LabelFrame(settings_frame, text="ウィンドウ設定", style='BBS.TFrame')
-        window_section.pack(fill=tk.X, padx=10, pady=10)
-        
-        window_frame = ttk.Frame(window_section, style='BBS.TFrame')
-        window_frame.pack(fill=tk.X, padx=10, pady=10)
+        window_frame = self._labelframe(settings_frame, "ウィンドウ設定")
         
         ttk.Label(window_frame, text=f"現在のサイズ: {self.window_width}x{self.window_height}", style='BBS.TLabel').pack(anchor=tk.W)
         
         size_buttons = ttk.Frame(window_frame, style='BBS.TFrame')
         size_buttons.pack(anchor=tk.W, pady=5)
         
-        ttk.Button(
-            size_buttons,
-            text="1024x768",
-            command=lambda: self.set_window_size(1024, 768),
-            style='BBS.TButton'
-        ).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(
-            size_buttons,
-            text="1366x768",
-            command=lambda: self.set_window_size(1366, 768),
-            style='BBS.TButton'
-        ).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(
-            size_buttons,
-            text="1200x800",
-            command=lambda: self.set_window_size(1200, 800),
-            style='BBS.TButton'
-        ).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(
-            size_buttons,
-            text="1400x900",
-            command=lambda: self.set_window_size(1400, 900),
-            style='BBS.TButton'
-        ).pack(side=tk.LEFT)
+        self._button_row(size_buttons, [
+            (f"{w}x{h}", functools.partial(self.set_window_size, w, h))
+            for w, h in ((1024, 768), (1366, 768), (1200, 800), (1400, 900))
+        ])
         
         # 保存ボタン
         save_frame = ttk.Frame(settings_frame, style='BBS.TFrame')
         save_frame.pack(fill=tk.X, padx=10, pady=20)
         
-        ttk.Button(
-            save_frame,
-            text="設定保存",
-            command=self.save_all_settings,
-            style='BBS.TButton'
-        ).pack(side=tk.LEFT, padx=(0, 10))
-        
-        ttk.Button(
-            save_frame,
-            text="設定リセット",
-            command=self.reset_all_settings,
-            style='BBS.TButton'
-        ).pack(side=tk.LEFT)
+        self._button_row(save_frame, (
+            ("設定保存", self.save_all_settings),
+            ("設定リセット", self.reset_all_settings),
+        ), padx=10)
     
     # 管理機能メソッド群
     def set_ai_activity(self, enabled: bool):
@@ -3477,12 +4215,43 @@ class BBSApplication:
         self.update_status()
         logger.info(f"[ADMIN] AI活動: {'有効' if enabled else '無効'}")
     
+    def _on_interval_change(self, value):
+        """スライダー操作中の連続イベントをまとめ、止まってから間隔を反映"""
+        if self._interval_job is not None:
+            self.root.after_cancel(self._interval_job)
+        self._interval_job = self.root.after(200, self._apply_interval, value)
+    
+    def _apply_interval(self, value):
+        """確定した投稿間隔を反映"""
+        self._interval_job = None
+        self.update_interval(value)
+    
+    def _on_font_scale(self, value):
+        """フォントスケールのドラッグ中は反映を保留し、止まってから1回だけ適用"""
+        if self._font_job is not None:
+            self.root.after_cancel(self._font_job)
+        self._font_job = self.root.after(150, self._apply_font_scale, value)
+    
+    def _apply_font_scale(self, value):
+        """確定したフォントサイズを反映"""
+        self._font_job = None
+        self.change_font_size(int(value) - self.font_size)
+    
     def update_interval(self, value):
         """投稿間隔更新"""
         self.auto_post_interval = int(value)
+        self._wake_auto_poster(reseed=True)
         self.ai_status_label.config(text=f"投稿間隔: {self.auto_post_interval}秒")
         logger.info(f"[APP] 投稿間隔変更: {self.auto_post_interval}秒")
     
+    def _reload_data_managers(self):
+        """DB再構築後、既存のマネージャーを作り直さずにデータとキャッシュを再読込"""
+        self.category_manager.reload()
+        self.thread_manager.reload()
+        self._stats_cache.clear()
+        self._post_render_key = None
+        self._wake_auto_poster(reseed=True)
+    
     def reset_database(self):
         """データベース初期化"""
         try:
@@ -3493,14 +4262,9 @@ class BBSApplication:
                 old_ai_state = self.ai_activity_enabled
                 self.ai_activity_enabled = False
                 
-                # データベースを削除して再作成
-                if os.path.exists("bbs_database.db"):
-                    os.remove("bbs_database.db")
-                
-                # 新しいデータベースを初期化
-                self.db_manager = DatabaseManager()
-                self.category_manager = CategoryManager(self.db_manager)
-                self.thread_manager = ThreadManager(self.db_manager, self.category_manager)
+                # データベースを削除して再作成（マネージャーは同じインスタンスを再利用）
+                self.db_manager.recreate()
+                self._reload_data_managers()
                 
                 # UI更新
                 self.update_thread_list()
@@ -3522,8 +4286,8 @@ class BBSApplication:
             if messagebox.askyesno("確認", "ペルソナを再生成しますか？"):
                 logger.info("[ADMIN] ペルソナ再生成開始")
                 
-                # ペルソナマネージャーを再初期化
-                self.persona_manager = PersonaManager(self.db_manager, self.ai_manager)
+                # ペルソナマネージャーを作り直さず、同じインスタンスで再生成
+                self.persona_manager.reset()
                 
                 messagebox.showinfo("完了", "ペルソナの再生成が完了しました。")
                 logger.info("[ADMIN] ペルソナ再生成完了")
@@ -3559,14 +4323,9 @@ class BBSApplication:
                 self.ai_activity_enabled = False
                 
                 # データベース削除・再作成
-                if os.path.exists("bbs_database.db"):
-                    os.remove("bbs_database.db")
-                
-                # 全てのマネージャーを再初期化
-                self.db_manager = DatabaseManager()
-                self.category_manager = CategoryManager(self.db_manager)
-                self.thread_manager = ThreadManager(self.db_manager, self.category_manager)
-                self.persona_manager = PersonaManager(self.db_manager, self.ai_manager)
+                self.db_manager.recreate()
+                self._reload_data_managers()
+                self.persona_manager.reset()
                 
                 # UI状態をリセット
                 self.current_main_category_id = None
@@ -3575,9 +4334,7 @@ class BBSApplication:
                 # カテゴリを再選択
                 if self.category_listbox.size() > 0:
                     self.category_listbox.selection_set(0)
-                    main_categories = self.category_manager.get_main_categories()
-                    if main_categories:
-                        self.current_main_category_id = main_categories[0]["id"]
+                    self.current_main_category_id = self._main_category_id_at(0)
                 
                 # UI更新
                 self.update_thread_list()
@@ -3606,21 +4363,22 @@ class BBSApplication:
             logger.error(f"[ADMIN] ペルソナデータ保存エラー: {e}")
             messagebox.showerror("エラー", f"ペルソナデータ保存に失敗しました: {e}")
     
+    def _persona_export_iter(self, timestamp: str) -> Iterator[str]:
+        """ペルソナ詳細エクスポートの出力を順に生成"""
+        yield f"ペルソナ詳細エクスポート - {timestamp}\n"
+        yield _PERSONA_EXPORT_SEP[1:]
+        for persona in getattr(self.persona_manager, 'personas', {}).values():
+            yield self.format_persona_details(persona)
+            yield _PERSONA_EXPORT_SEP
+    
     def export_persona_details(self):
         """ペルソナ詳細エクスポート"""
         try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _file_timestamp()
             filename = f"persona_details_{timestamp}.txt"
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(f"ペルソナ詳細エクスポート - {timestamp}\n")
-                f.write("=" * 80 + "\n\n")
-                
-                if hasattr(self.persona_manager, 'personas'):
-                    for name, persona in self.persona_manager.personas.items():
-                        details = self.format_persona_details(persona)
-                        f.write(details)
-                        f.write("\n" + "=" * 80 + "\n\n")
+            with open(filename, 'w', encoding='utf-8', buffering=8 * 1024 * 1024) as f:
+                f.writelines(self._persona_export_iter(timestamp))
             
             messagebox.showinfo("完了", f"ペルソナ詳細をエクスポートしました。\nファイル: {filename}")
             logger.info(f"[ADMIN] ペルソナ詳細エクスポート完了: {filename}")
@@ -3632,21 +4390,20 @@ class BBSApplication:
     def create_full_backup(self):
         """完全バックアップ作成"""
         try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _file_timestamp()
             backup_dir = f"backup_{timestamp}"
             os.makedirs(backup_dir, exist_ok=True)
             
-            # データベースをコピー
-            if os.path.exists("bbs_database.db"):
-                shutil.copy2("bbs_database.db", os.path.join(backup_dir, "bbs_database.db"))
+            # データベースをコピー（稼働中でも一貫したスナップショットを取る）
+            if os.path.exists(self.db_manager.db_path):
+                self.db_manager.backup_to(os.path.join(backup_dir, os.path.basename(self.db_manager.db_path)))
             
-            # 設定ファイルをコピー
-            if os.path.exists("bbs_settings.json"):
-                shutil.copy2("bbs_settings.json", os.path.join(backup_dir, "bbs_settings.json"))
-            
-            # ログファイルをコピー
-            if os.path.exists("bbs_app.log"):
-                shutil.copy2("bbs_app.log", os.path.join(backup_dir, "bbs_app.log"))
+            # 設定ファイル・ログファイルをコピー（無いものは飛ばす）
+            for name in ("bbs_settings.json", "bbs_app.log"):
+                try:
+                    shutil.copy2(name, os.path.join(backup_dir, name))
+                except FileNotFoundError:
+                    pass
             
             messagebox.showinfo("完了", f"完全バックアップを作成しました。\nディレクトリ: {backup_dir}")
             logger.info(f"[ADMIN] 完全バックアップ作成完了: {backup_dir}")
@@ -3658,11 +4415,11 @@ class BBSApplication:
     def backup_database_only(self):
         """データベースのみバックアップ"""
         try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _file_timestamp()
             filename = f"bbs_database_backup_{timestamp}.db"
             
-            if os.path.exists("bbs_database.db"):
-                shutil.copy2("bbs_database.db", filename)
+            if os.path.exists(self.db_manager.db_path):
+                self.db_manager.backup_to(filename)
                 messagebox.showinfo("完了", f"データベースバックアップを作成しました。\nファイル: {filename}")
                 logger.info(f"[ADMIN] データベースバックアップ完了: {filename}")
             else:
@@ -3675,15 +4432,16 @@ class BBSApplication:
     def backup_settings(self):
         """設定ファイルバックアップ"""
         try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _file_timestamp()
             filename = f"bbs_settings_backup_{timestamp}.json"
             
-            if os.path.exists("bbs_settings.json"):
+            try:
                 shutil.copy2("bbs_settings.json", filename)
+            except FileNotFoundError:
+                messagebox.showwarning("警告", "設定ファイルが見つかりません。")
+            else:
                 messagebox.showinfo("完了", f"設定ファイルバックアップを作成しました。\nファイル: {filename}")
                 logger.info(f"[ADMIN] 設定バックアップ完了: {filename}")
-            else:
-                messagebox.showwarning("警告", "設定ファイルが見つかりません。")
                 
         except Exception as e:
             logger.error(f"[ADMIN] 設定バックアップエラー: {e}")
@@ -3703,14 +4461,10 @@ class BBSApplication:
                     old_ai_state = self.ai_activity_enabled
                     self.ai_activity_enabled = False
                     
-                    # ファイルを復元
-                    shutil.copy2(filename, "bbs_database.db")
-                    
-                    # システム再初期化
-                    self.db_manager = DatabaseManager()
-                    self.category_manager = CategoryManager(self.db_manager)
-                    self.thread_manager = ThreadManager(self.db_manager, self.category_manager)
-                    self.persona_manager = PersonaManager(self.db_manager, self.ai_manager)
+                    # ファイルを復元してシステム再初期化
+                    self.db_manager.recreate(source_path=filename)
+                    self._reload_data_managers()
+                    self.persona_manager.reset()
                     
                     # UI更新
                     self.update_thread_list()
@@ -3738,6 +4492,7 @@ class BBSApplication:
                 if messagebox.askyesno("確認", f"設定を復元しますか？\n現在の設定は上書きされます。\n\nファイル: {filename}"):
                     shutil.copy2(filename, "bbs_settings.json")
                     self.load_settings()
+                    self._apply_font_sizes()
                     self.adjust_responsive_layout()
                     messagebox.showinfo("完了", "設定の復元が完了しました。")
                     logger.info(f"[ADMIN] 設定復元完了: {filename}")
@@ -3752,9 +4507,28 @@ class BBSApplication:
             if messagebox.askyesno("確認", "ログファイルを整理しますか？\n古いログが削除される可能性があります。"):
                 # ログファイルのローテーション
                 if os.path.exists("bbs_app.log"):
-                    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                    timestamp = _file_timestamp()
                     archived_name = f"bbs_app_archived_{timestamp}.log"
-                    shutil.move("bbs_app.log", archived_name)
+                    log_path = os.path.abspath("bbs_app.log")
+                    handler = next((h for h in logging.getLogger().handlers
+                                    if isinstance(h, logging.FileHandler) and h.baseFilename == log_path), None)
+                    
+                    if handler is None:
+                        os.replace("bbs_app.log", archived_name)
+                    else:
+                        # ハンドラのロック中に閉じて改名する（コピーを伴わない）
+                        # streamをNoneにしておけば、改名の成否にかかわらず次の出力で開き直される
+                        handler.acquire()
+                        try:
+                            if handler.stream:
+                                handler.stream.close()
+                                handler.stream = None
+                            os.replace("bbs_app.log", archived_name)
+                        finally:
+                            handler.release()
+                    
+                    # 圧縮はバックグラウンドで行う
+                    threading.Thread(target=_gzip_log_archive, args=(archived_name,), daemon=True).start()
                     
                     # 新しいログファイルを開始
                     logger.info("[ADMIN] ログファイル整理完了")
@@ -3775,10 +4549,8 @@ class BBSApplication:
                 old_ai_state = self.ai_activity_enabled
                 self.ai_activity_enabled = False
                 
-                # VACUUM実行
-                with sqlite3.connect(self.db_manager.db_path) as conn:
-                    conn.execute("VACUUM")
-                    conn.execute("ANALYZE")
+                # VACUUM実行（既存の接続を使う）
+                self.db_manager.optimize()
                 
                 # AI活動復元
                 self.ai_activity_enabled = old_ai_state
@@ -3826,6 +4598,7 @@ class BBSApplication:
                 
                 # UI更新
                 self.root.geometry(f"{self.window_width}x{self.window_height}")
+                self._apply_font_sizes()
                 self.adjust_responsive_layout()
                 self.save_settings()
                 
@@ -3929,7 +4702,7 @@ class BBSApplication:
                                 
                                 if success:
                                     # UI更新をメインスレッドに依頼
-                                    self.message_queue.put(('update_display', None))
+                                    self._post_message('update_display')
                                     logger.info(f"[AUTO_POST] 従来システム投稿成功: Thread {thread_id}")
                                     
                                     # 投稿間隔
@@ -3948,23 +4721,33 @@ class BBSApplication:
         traditional_thread = threading.Thread(target=auto_post_worker, daemon=True)
         traditional_thread.start()
     
+    def _post_message(self, message_type, data=None):
+        """メッセージをキューに積み、メインスレッドに処理を通知"""
+        self.message_queue.put((message_type, data))
+        try:
+            self.root.event_generate('<<MsgQueue>>', when='tail')
+        except (tk.TclError, RuntimeError):
+            # 終了処理中などでウィンドウが既に破棄されている
+            pass
+    
     def process_messages(self):
         """メッセージキュー処理 - 完全版"""
+        processed_count = 0
+        # 表示更新は取り出し中にフラグを立てるだけにし、最後に各1回だけ実行
+        dirty_posts = dirty_threads = dirty_status = False
+        target_thread_id = None
         try:
-            processed_count = 0
             max_process = 10  # 一度に処理する最大メッセージ数
             
-            while processed_count < max_process:
+            # 消費者はメインスレッドのみなので、空でなければget_nowaitは失敗しない
+            while processed_count < max_process and not self.message_queue.empty():
                 try:
                     message_type, data = self.message_queue.get_nowait()
                     processed_count += 1
                     
                     if message_type == 'update_display':
                         # 表示更新
-                        if self.current_thread_id:
-                            self.update_post_display()
-                        self.update_thread_list()
-                        self.update_status()
+                        dirty_posts = dirty_threads = dirty_status = True
                         
                     elif message_type == 'show_notification':
                         # 通知表示
@@ -3980,21 +4763,14 @@ class BBSApplication:
                     
                     elif message_type == 'thread_created':
                         # 新規スレッド作成通知
-                        self.update_thread_list()
+                        dirty_threads = True
                         if data and 'thread_id' in data:
-                            # 作成されたスレッドに移動
-                            for i, thread in enumerate(self.current_threads):
-                                if thread['thread_id'] == data['thread_id']:
-                                    self.thread_listbox.selection_clear(0, tk.END)
-                                    self.thread_listbox.selection_set(i)
-                                    self.current_thread_id = data['thread_id']
-                                    self.update_post_display()
-                                    break
+                            target_thread_id = data['thread_id']
                     
                     elif message_type == 'ai_response_generated':
                         # AI応答生成完了通知
                         if data and 'thread_id' in data and data['thread_id'] == self.current_thread_id:
-                            self.update_post_display()
+                            dirty_posts = True
                     
                     elif message_type == 'error':
                         # エラー通知
@@ -4017,22 +4793,36 @@ class BBSApplication:
                     else:
                         logger.warning(f"[MESSAGE] 未知のメッセージタイプ: {message_type}")
                         
-                except queue.Empty:
-                    break
                 except Exception as e:
                     logger.error(f"[MESSAGE] メッセージ処理エラー: {e}")
                     break
+            
+            if dirty_threads:
+                self.update_thread_list()
+            if target_thread_id is not None:
+                # 作成されたスレッドに移動
+                for i, thread in enumerate(self.current_threads):
+                    if thread['thread_id'] == target_thread_id:
+                        self.select_thread_index(i)
+                        self.current_thread_id = target_thread_id
+                        dirty_posts = True
+                        break
+            if dirty_posts and self.current_thread_id:
+                self.update_post_display()
+            if dirty_status:
+                self.update_status()
                     
         except Exception as e:
             logger.error(f"[MESSAGE] メッセージキュー処理エラー: {e}")
         
-        # 定期的にメッセージキューをチェック（レスポンシブ間隔）
-        if processed_count > 0:
-            # メッセージがあった場合は短い間隔で再チェック
-            self.root.after(200, self.process_messages)
+        # 1回で処理しきれなかった分は即座に再スケジュール
+        if not self.message_queue.empty():
+            self.root.after(10, self.process_messages)
         else:
-            # メッセージがない場合は通常間隔
-            self.root.after(1000, self.process_messages)
+            # 通知に失敗したメッセージを取り残さないよう、低頻度の確認だけは残す
+            if self._msg_safety_job is not None:
+                self.root.after_cancel(self._msg_safety_job)
+            self._msg_safety_job = self.root.after(5000, self.process_messages)
 
     def update_username(self):
         """ユーザー名更新"""
@@ -4053,9 +4843,10 @@ class BBSApplication:
         """初期化状態を検証し、必要に応じて自動復旧"""
         try:
             # データベースの存在確認
-            if not os.path.exists("bbs_database.db"):
+            if not os.path.exists(self.db_manager.db_path):
                 logger.warning("[INIT] データベースが存在しません。自動作成します。")
-                self.db_manager = DatabaseManager()
+                self.db_manager.reopen()
+                self._reload_data_managers()
             
             # カテゴリの存在確認
             main_categories = self.category_manager.get_main_categories()
@@ -4074,7 +4865,7 @@ class BBSApplication:
             # ペルソナの存在確認
             if not hasattr(self.persona_manager, 'personas') or not self.persona_manager.personas:
                 logger.warning("[INIT] ペルソナが存在しません。自動作成します。")
-                self.persona_manager = PersonaManager(self.db_manager, self.ai_manager)
+                self.persona_manager.reset()
             
             logger.info("[INIT] 初期化状態の検証が完了しました。")
             
@@ -4091,113 +4882,162 @@ class BBSApplication:
         
         logger.info("[APP] 拡張自動投稿システム開始完了")
 
+    def _wake_auto_poster(self, reseed: bool = False):
+        """自動投稿ワーカーを起こす（reseed時は投稿予定をDBから作り直す）"""
+        with self._auto_post_cond:
+            if reseed:
+                self._auto_post_reseed = True
+            self._auto_post_cond.notify_all()
+    
     def start_traditional_auto_posting(self):
         """従来の自動投稿システム"""
+        cond = self._auto_post_cond
+        reseed_interval = 300.0  # 他経路での変更を拾うため定期的に予定を作り直す
+        
+        def recheck_delay() -> float:
+            return random.uniform(30, 60)
+        
+        def interrupted() -> bool:
+            # 待機中に予定の作り直し・AI活動停止が要求されたか（condのロック内で評価）
+            return self._auto_post_reseed or not self.ai_activity_enabled
+        
         def auto_post_worker():
-            """自動投稿ワーカー - 拡張版"""
+            """自動投稿ワーカー - 投稿可能時刻のヒープで次の対象まで待機"""
             logger.info("[AUTO_POST] 従来システム開始")
             
+            # (投稿可能になる時刻[monotonic], thread_id) の最小ヒープ
+            schedule: List[Tuple[float, int]] = []
+            threads_by_id: Dict[int, Dict] = {}
+            next_reseed = 0.0
+            cooldown_until = 0.0
+            
             while True:
                 try:
                     if not self.ai_activity_enabled:
-                        time.sleep(30)
+                        with cond:
+                            cond.wait_for(lambda: self.ai_activity_enabled, 30)
                         continue
                     
-                    # 全スレッドを取得
-                    main_categories = self.category_manager.get_main_categories()
-                    all_threads = []
-                    for cat in main_categories:
-                        threads = self.thread_manager.get_threads_by_category(cat["id"])
-                        all_threads.extend(threads)
+                    with cond:
+                        reseed = self._auto_post_reseed or time.monotonic() >= next_reseed
+                        self._auto_post_reseed = False
                     
-                    if not all_threads:
-                        logger.warning("[AUTO_POST] スレッドが存在しません")
-                        time.sleep(60)
+                    if reseed:
+                        # スレッド情報と経過秒数を1クエリで取得してヒープを再構築
+                        threads_by_id = {
+                            thread['thread_id']: thread
+                            for thread in self.thread_manager.get_ai_post_ages_bulk()
+                            if not thread['is_locked']
+                        }
+                        if not threads_by_id:
+                            logger.warning("[AUTO_POST] スレッドが存在しません")
+                            with cond:
+                                cond.wait_for(lambda: self._auto_post_reseed, 60)
+                            continue
+                        
+                        now = time.monotonic()
+                        schedule = [
+                            (now + max(0.0, self.auto_post_interval - thread['seconds_since_last_ai_post']), thread_id)
+                            for thread_id, thread in threads_by_id.items()
+                        ]
+                        heapq.heapify(schedule)
+                        next_reseed = now + reseed_interval
+                    
+                    # 次に投稿可能になるスレッドまで待機（通知があれば即座に再評価）
+                    now = time.monotonic()
+                    wake_at = max(schedule[0][0] if schedule else next_reseed, cooldown_until)
+                    if wake_at > now:
+                        # 待機前にフラグを確認するので、再構築中に届いた通知も取りこぼさない
+                        with cond:
+                            cond.wait_for(interrupted, wake_at - now)
                         continue
                     
-                    # 投稿候補スレッドを選出
-                    candidate_threads = []
-                    for thread in all_threads:
-                        # ロックされたスレッドはスキップ
-                        if thread.get('is_locked', False):
+                    ready = []
+                    while schedule and schedule[0][0] <= now:
+                        ready.append(heapq.heappop(schedule)[1])
+                    
+                    # 高頻度スケジューラー等の投稿を反映するため、対象分の経過秒数を再取得
+                    ages = self.thread_manager.get_ai_post_ages(ready)
+                    
+                    # 投稿候補スレッドを選出（(優先度, thread_id, 確率) のタプルのみ保持）
+                    candidates: List[Tuple[float, int, float]] = []
+                    interval = self.auto_post_interval
+                    for thread_id in ready:
+                        thread = threads_by_id.get(thread_id)
+                        seconds_since_last_ai_post = ages.get(thread_id)
+                        if thread is None or seconds_since_last_ai_post is None:
                             continue
                         
-                        thread_id = thread['thread_id']
-                        seconds_since_last_ai_post = self.thread_manager.get_seconds_since_last_ai_post(thread_id)
+                        # 投稿間隔チェック（まだ早ければ残り時間後に再投入）
+                        if seconds_since_last_ai_post < interval:
+                            heapq.heappush(schedule, (now + interval - seconds_since_last_ai_post, thread_id))
+                            continue
                         
-                        # 投稿間隔チェック
-                        if seconds_since_last_ai_post >= self.auto_post_interval:
-                            # 投稿確率計算（時間が経つほど高確率）
-                            base_probability = 0.2
-                            time_bonus = (seconds_since_last_ai_post - self.auto_post_interval) * 0.002
-                            thread_popularity = min(0.3, thread['post_count'] * 0.01)  # 人気スレッドは投稿されやすい
-                            
-                            probability = min(0.8, base_probability + time_bonus + thread_popularity)
-                            
-                            if random.random() < probability:
-                                candidate_threads.append({
-                                    'thread_id': thread_id,
-                                    'thread_info': thread,
-                                    'seconds_since': seconds_since_last_ai_post,
-                                    'priority': seconds_since_last_ai_post + random.uniform(0, 50),
-                                    'probability': probability
-                                })
+                        # 投稿確率計算（時間が経つほど高確率、人気スレッドは投稿されやすい）
+                        probability = min(0.8, 0.2 + (seconds_since_last_ai_post - interval) * 0.002
+                                          + min(0.3, thread['post_count'] * 0.01))
+                        
+                        if random.random() < probability:
+                            candidates.append((seconds_since_last_ai_post + random.uniform(0, 50), thread_id, probability))
+                        else:
+                            heapq.heappush(schedule, (now + recheck_delay(), thread_id))
                     
-                    if not candidate_threads:
+                    if not candidates:
                         logger.debug("[AUTO_POST] 投稿候補なし")
-                        time.sleep(random.uniform(30, 60))
                         continue
                     
-                    # 優先度順でソート
-                    candidate_threads.sort(key=lambda x: x['priority'], reverse=True)
-                    
-                    # 上位1-3スレッドに投稿
-                    max_posts = min(len(candidate_threads), random.choice([1, 1, 2, 2, 3]))
+                    # 優先度上位1-3スレッドだけを取り出して投稿（全件ソートはしない、残りは後で再評価）
+                    max_posts = min(len(candidates), random.choice([1, 1, 2, 2, 3]))
+                    winners = heapq.nlargest(max_posts, candidates)
+                    winner_ids = {thread_id for _, thread_id, _ in winners}
                     actual_posts = 0
                     
-                    for i in range(max_posts):
-                        if i < len(candidate_threads):
-                            candidate = candidate_threads[i]
-                            thread_id = candidate['thread_id']
-                            thread_info = candidate['thread_info']
-                            
-                            logger.info(f"[AUTO_POST] 投稿対象選択: Thread {thread_id} ({thread_info['title']}) - 確率: {candidate['probability']:.2f}")
+                    for _, thread_id, _ in candidates:
+                        if thread_id not in winner_ids:
+                            heapq.heappush(schedule, (now + recheck_delay(), thread_id))
+                    
+                    for i, (_, thread_id, probability) in enumerate(winners):
+                        logger.info("[AUTO_POST] 投稿対象選択: Thread %s (%s) - 確率: %.2f",
+                                    thread_id, threads_by_id[thread_id]['title'], probability)
+                        
+                        # ペルソナによる投稿生成
+                        if hasattr(self.persona_manager, 'generate_auto_post'):
+                            success = self.persona_manager.generate_auto_post(thread_id)
                             
-                            # ペルソナによる投稿生成
-                            if hasattr(self.persona_manager, 'generate_auto_post'):
-                                success = self.persona_manager.generate_auto_post(thread_id)
+                            if success:
+                                actual_posts += 1
+                                heapq.heappush(schedule, (time.monotonic() + self.auto_post_interval, thread_id))
+                                # UI更新をメインスレッドに依頼
+                                self._post_message('update_display')
+                                logger.info("[AUTO_POST] 投稿成功: Thread %s", thread_id)
                                 
-                                if success:
-                                    actual_posts += 1
-                                    # UI更新をメインスレッドに依頼
-                                    self.message_queue.put(('update_display', None))
-                                    logger.info(f"[AUTO_POST] 投稿成功: Thread {thread_id}")
-                                    
-                                    # 投稿間隔（複数投稿の場合）
-                                    post_interval = random.uniform(10, 25)
-                                    time.sleep(post_interval)
-                                else:
-                                    logger.warning(f"[AUTO_POST] 投稿失敗: Thread {thread_id}")
+                                # 投稿間隔（複数投稿の場合、停止・再構築の要求があれば打ち切る）
+                                post_interval = random.uniform(10, 25)
+                                with cond:
+                                    stop = cond.wait_for(interrupted, post_interval)
+                                if stop:
+                                    for _, rest_id, _ in winners[i + 1:]:
+                                        heapq.heappush(schedule, (time.monotonic() + recheck_delay(), rest_id))
+                                    break
                             else:
-                                logger.warning("[AUTO_POST] ペルソナマネージャーに投稿メソッドがありません")
+                                heapq.heappush(schedule, (time.monotonic() + recheck_delay(), thread_id))
+                                logger.warning("[AUTO_POST] 投稿失敗: Thread %s", thread_id)
+                        else:
+                            logger.warning("[AUTO_POST] ペルソナマネージャーに投稿メソッドがありません")
                     
-                    logger.info(f"[AUTO_POST] 投稿サイクル完了: {actual_posts}/{max_posts}件投稿")
+                    logger.info("[AUTO_POST] 投稿サイクル完了: %d/%d件投稿", actual_posts, max_posts)
                     
-                    # 次のチェックまでの待機時間（投稿数に応じて調整）
+                    # 投稿した場合は次のサイクルまで間を空ける
                     if actual_posts > 0:
-                        check_interval = random.uniform(60, 120)
-                    else:
-                        check_interval = random.uniform(30, 60)
-                    
-                    logger.debug(f"[AUTO_POST] 次回チェックまで {check_interval:.1f}秒待機")
-                    time.sleep(check_interval)
+                        cooldown_until = time.monotonic() + random.uniform(60, 120)
                     
                 except KeyboardInterrupt:
                     logger.info("[AUTO_POST] 自動投稿システム停止（キーボード割り込み）")
                     break
                 except Exception as e:
                     logger.error(f"[AUTO_POST] 自動投稿エラー: {e}")
-                    time.sleep(60)  # エラー時は長めに待機
+                    with cond:
+                        cond.wait_for(lambda: self._auto_post_reseed, 60)  # エラー時は長めに待機
         
         # 自動投稿スレッドを開始
         auto_post_thread = threading.Thread(target=auto_post_worker, daemon=True)
@@ -4213,15 +5053,13 @@ class BBSApplication:
                 return
             
             category_name = self.category_listbox.get(selection[0])
-            logger.info(f"[APP] カテゴリ選択: {category_name}")
+            logger.info("[APP] カテゴリ選択: %s", category_name)
             
-            # カテゴリIDを取得
-            main_categories = self.category_manager.get_main_categories()
-            for category in main_categories:
-                if category["name"] == category_name:
-                    self.current_main_category_id = category["id"]
-                    logger.info(f"[APP] カテゴリID設定: {self.current_main_category_id}")
-                    break
+            # カテゴリIDを取得（リストボックスの並びと同じ順のID一覧から引く）
+            category_id = self._main_category_id_at(selection[0])
+            if category_id:
+                self.current_main_category_id = category_id
+                logger.info("[APP] カテゴリID設定: %s", self.current_main_category_id)
             
             if self.current_main_category_id:
                 # スレッド一覧を強制更新
@@ -4233,6 +5071,20 @@ class BBSApplication:
         except Exception as e:
             logger.error(f"[APP] カテゴリ選択エラー: {e}")
 
+    def _invalidate_category_cache(self):
+        """大分類IDキャッシュの破棄（カテゴリ管理からの変更通知）"""
+        self._main_category_ids_source = None
+
+    def _main_category_id_at(self, index: int) -> Optional[int]:
+        """リストボックス位置から大分類IDを取得（カテゴリ管理の再生成時のみ再構築）"""
+        if self._main_category_ids_source is not self.category_manager:
+            self._main_category_ids = [category["id"] for category in self.category_manager.get_main_categories()]
+            self._main_category_ids_source = self.category_manager
+            self.category_manager.on_change = self._invalidate_category_cache
+        if 0 <= index < len(self._main_category_ids):
+            return self._main_category_ids[index]
+        return None
+
     def on_thread_select(self, event):
         """スレッド選択イベント - 強化版"""
         try:
@@ -4254,7 +5106,7 @@ class BBSApplication:
                 # 投稿選択をクリア
                 self.clear_post_selection()
                 
-                logger.info(f"[APP] スレッド選択: {self.current_thread_id} - {thread['title']}")
+                logger.info("[APP] スレッド選択: %s - %s", self.current_thread_id, thread['title'])
                 
         except Exception as e:
             logger.error(f"[APP] スレッド選択エラー: {e}")
@@ -4267,11 +5119,11 @@ class BBSApplication:
     def on_post_click(self, event):
         """投稿クリックイベント"""
         try:
-            # クリック位置から投稿IDを特定
-            index = self.post_display.index(tk.INSERT)
+            # クリック位置の行番号を取得
+            index = self.post_display.index(f"@{event.x},{event.y}")
             
             # 投稿選択状態を更新
-            self.update_post_selection()
+            self.update_post_selection(int(index.split('.')[0]))
             
         except Exception as e:
             logger.error(f"[APP] 投稿クリックエラー: {e}")
@@ -4298,11 +5150,10 @@ class BBSApplication:
         """投稿選択クリア"""
         self.selected_post_id = None
 
-    def update_post_selection(self):
-        """投稿選択更新"""
-        # 実際の実装では、クリック位置から投稿IDを特定
-        # ここでは簡易実装
-        self.selected_post_id = 1  # 仮の値
+    def update_post_selection(self, line: int):
+        """投稿選択更新（行番号から表示中の投稿IDを二分探索）"""
+        i = bisect.bisect_right(self._post_line_starts, line) - 1
+        self.selected_post_id = self._post_line_ids[i] if i >= 0 else None
 
     def update_thread_list(self):
         """スレッド一覧更新 - 拡張版"""
@@ -4311,17 +5162,18 @@ class BBSApplication:
             return
         
         try:
-            # リストボックスをクリア
+            # リストボックスをクリア（描画途中の残りもキャンセル）
+            self._cancel_thread_render()
             self.thread_listbox.delete(0, tk.END)
             
             # デバッグ：カテゴリ情報を確認
-            logger.debug(f"[APP] スレッド取得開始 - カテゴリID: {self.current_main_category_id}")
+            logger.debug("[APP] スレッド取得開始 - カテゴリID: %s", self.current_main_category_id)
             
             # スレッド一覧を取得
             self.current_threads = self.thread_manager.get_threads_by_category(self.current_main_category_id)
             
             # デバッグ：取得結果を確認
-            logger.debug(f"[APP] 取得されたスレッド数: {len(self.current_threads)}")
+            logger.debug("[APP] 取得されたスレッド数: %d", len(self.current_threads))
             
             if not self.current_threads:
                 # データが無い場合は強制的にデフォルトスレッドを作成
@@ -4329,22 +5181,9 @@ class BBSApplication:
                 self.thread_manager.init_default_threads()
                 self.current_threads = self.thread_manager.get_threads_by_category(self.current_main_category_id)
             
-            # スレッドをリストボックスに追加
-            for thread in self.current_threads:
-                prefix = ""
-                if thread['is_pinned']:
-                    prefix += "📌 "
-                if thread['is_locked']:
-                    prefix += "🔒 "
-                
-                display_text = f"{prefix}[{thread['thread_id']}] {thread['sub_category_name']}: {thread['title']} ({thread['post_count']})"
-                
-                # 文字数制限（リストボックス幅に合わせて調整）
-                if len(display_text) > 50:
-                    display_text = display_text[:47] + "..."
-                
-                self.thread_listbox.insert(tk.END, display_text)
-                logger.debug(f"[APP] スレッド追加: {display_text}")
+            # 表示文字列は一覧取得時に一度だけ整形し、見えている範囲から描画
+            self._thread_display_cache = [self._format_thread_row(thread) for thread in self.current_threads]
+            self._render_thread_window(0, self._visible_thread_rows())
             
             # 最初のスレッドを自動選択
             if self.current_threads:
@@ -4352,49 +5191,141 @@ class BBSApplication:
                 self.current_thread_id = self.current_threads[0]['thread_id']
                 self.update_thread_info(self.current_threads[0])
                 self.update_post_display()
-                logger.debug(f"[APP] 初期スレッド選択: {self.current_thread_id}")
+                logger.debug("[APP] 初期スレッド選択: %s", self.current_thread_id)
             
-            # UI更新を強制実行
-            self.thread_listbox.update()
+            # 保留中の再描画のみ反映（イベントループ全体は回さない）
+            self.thread_listbox.update_idletasks()
             
         except Exception as e:
             logger.error(f"[APP] スレッド一覧更新エラー: {e}")
             # エラー時は空のメッセージを表示
             self.thread_listbox.insert(tk.END, "スレッドの読み込みに失敗しました")
 
+    @staticmethod
+    def _format_thread_row(thread: Dict) -> str:
+        """スレッド一覧の表示文字列を整形"""
+        prefix = ""
+        if thread['is_pinned']:
+            prefix += "📌 "
+        if thread['is_locked']:
+            prefix += "🔒 "
+        
+        display_text = f"{prefix}[{thread['thread_id']}] {thread['sub_category_name']}: {thread['title']} ({thread['post_count']})"
+        
+        # 表示幅制限（全角は2セルとしてリストボックス幅に合わせて調整）
+        return _truncate_display(display_text)
+
+    def _visible_thread_rows(self) -> int:
+        """リストボックスに一度に表示できる行数（先読み分を含む）"""
+        return int(self.thread_listbox.cget('height')) + 20
+
+    def _render_thread_window(self, first: int, last: int):
+        """表示キャッシュの指定範囲をまとめて挿入し、残りはアイドル時に追記"""
+        self._thread_render_job = None
+        rows = self._thread_display_cache[first:last]
+        if rows:
+            self.thread_listbox.insert(tk.END, *rows)
+        self._thread_rendered = first + len(rows)
+        
+        if self._thread_rendered < len(self._thread_display_cache):
+            self._thread_render_job = self.root.after(
+                1, self._render_thread_window,
+                self._thread_rendered, self._thread_rendered + 200
+            )
+
+    def _cancel_thread_render(self):
+        """未描画分の追記予約を取り消し"""
+        if self._thread_render_job is not None:
+            self.root.after_cancel(self._thread_render_job)
+            self._thread_render_job = None
+        self._thread_rendered = 0
+
+    def _patch_thread_row(self, thread_id: int, delta_posts: int = 1):
+        """スレッド一覧の1行だけを更新（全件の再取得・再描画をしない）"""
+        for i, thread in enumerate(self.current_threads):
+            if thread['thread_id'] != thread_id:
+                continue
+            
+            thread['post_count'] += delta_posts
+            text = self._thread_display_cache[i] = self._format_thread_row(thread)
+            if i < self._thread_rendered:
+                selected = i in self.thread_listbox.curselection()
+                self.thread_listbox.delete(i)
+                self.thread_listbox.insert(i, text)
+                if selected:
+                    self.thread_listbox.selection_set(i)
+            return
+
+    def select_thread_index(self, index: int):
+        """指定位置のスレッドを選択（未描画なら先にその位置まで描画）"""
+        if index >= self._thread_rendered:
+            self._cancel_thread_render()
+            self._render_thread_window(self.thread_listbox.size(), index + self._visible_thread_rows())
+        self.thread_listbox.selection_clear(0, tk.END)
+        self.thread_listbox.selection_set(index)
+        self.thread_listbox.see(index)
+
     def update_post_display(self):
-        """投稿表示更新 - 完全版"""
+        """投稿表示更新 - 完全版（同一スレッドでは新着のみ追記）"""
         if not self.current_thread_id:
             logger.warning("[APP] スレッドIDが設定されていません")
             return
         
         try:
-            # 投稿データを取得
-            posts = self.thread_manager.get_thread_posts(self.current_thread_id)
-            
-            # 表示エリアをクリア
-            self.post_display.config(state=tk.NORMAL)
-            self.post_display.delete(1.0, tk.END)
+            # スレッド・DBが変わった場合や未投稿表示中は全体を描き直す
+            render_key = (self.current_thread_id, self.db_manager)
+            full_rebuild = render_key != self._post_render_key or self._rendered_post_count == 0
+            if full_rebuild:
+                self._post_render_key = render_key
+                self._rendered_post_count = 0
+                self._last_rendered_post_id = 0
+                self._post_line_starts = []
+                self._post_line_ids = []
+            
+            # 投稿データを取得（表示済みの続きのみ）
+            posts = self.thread_manager.get_thread_posts(
+                self.current_thread_id,
+                limit=max(0, self.post_display_limit - self._rendered_post_count),
+                after_post_id=self._last_rendered_post_id
+            )
             
-            if not posts:
-                self.post_display.insert(tk.END, "まだ投稿がありません。\n最初の投稿をお待ちしています！")
-                self.post_display.config(state=tk.DISABLED)
+            if not full_rebuild and not posts:
                 return
             
-            # 投稿を表示
-            for i, post in enumerate(posts):
-                self.display_single_post(i + 1, post)
+            self.post_display.config(state=tk.NORMAL)
+            if full_rebuild:
+                # 表示エリアをクリア
+                self.post_display.delete(1.0, tk.END)
+                
+                if not posts:
+                    self.post_display.insert(tk.END, "まだ投稿がありません。\n最初の投稿をお待ちしています！")
+                    self.post_display.config(state=tk.DISABLED)
+                    return
             
-            # タグ設定
-            self.configure_post_display_tags()
+            # 投稿を表示（新着分をまとめて1回の挿入で追記し、各投稿の開始行を記録）
+            line = int(self.post_display.index('end-1c').split('.')[0])
+            segments = []
+            for i, post in enumerate(posts, start=self._rendered_post_count + 1):
+                post_segments = self._post_segments(i, post)
+                self._post_line_starts.append(line)
+                self._post_line_ids.append(post['post_id'])
+                line += sum(text.count('\n') for text in post_segments[::2])
+                segments += post_segments
+            self.post_display.insert(tk.END, *segments)
+            self._rendered_post_count += len(posts)
+            self._last_rendered_post_id = posts[-1]['post_id']
             
             self.post_display.config(state=tk.DISABLED)
             self.post_display.see(tk.END)
             
-            logger.debug(f"[APP] 投稿表示更新完了: Thread {self.current_thread_id}, {len(posts)}件")
+            logger.debug("[APP] 投稿表示更新完了: Thread %s, %d件追加", self.current_thread_id, len(posts))
             
         except Exception as e:
             logger.error(f"[APP] 投稿表示更新エラー: {e}")
+            self._post_render_key = None
+            self._rendered_post_count = 0
+            self._post_line_starts = []
+            self._post_line_ids = []
             self.post_display.config(state=tk.NORMAL)
             self.post_display.delete(1.0, tk.END)
             self.post_display.insert(tk.END, f"投稿の読み込みに失敗しました: {e}")
@@ -4402,6 +5333,10 @@ class BBSApplication:
 
     def display_single_post(self, post_number: int, post: Dict):
         """単一投稿の表示"""
+        self.post_display.insert(tk.END, *self._post_segments(post_number, post))
+
+    def _post_segments(self, post_number: int, post: Dict) -> List[Any]:
+        """投稿1件分の (文字列, タグ) の並びを構築（Text.insert に一括で渡す）"""
         try:
             timestamp = post['posted_at']
             name = post['persona_name']
@@ -4411,94 +5346,63 @@ class BBSApplication:
             mentions = post.get('mention_names', '')
             
             # 投稿番号とタイムスタンプ
-            self.post_display.insert(tk.END, f"{post_number:3d}: ", "number")
-            self.post_display.insert(tk.END, f"{timestamp}\n", "timestamp")
+            segments = [f"{post_number:3d}: ", "number", f"{timestamp}\n", "timestamp"]
             
             # 投稿者名（ユーザーとAIで色分け）
-            name_tag = "user_name" if is_user else "ai_name"
-            self.post_display.insert(tk.END, f" {name}", name_tag)
+            segments += [f" {name}", "user_name" if is_user else "ai_name"]
             
             # 編集マークとメンションマーク
             if is_edited:
-                self.post_display.insert(tk.END, " [編集済み]", "edited_mark")
+                segments += [" [編集済み]", "edited_mark"]
             if mentions:
-                self.post_display.insert(tk.END, f" →@{mentions}", "mention_mark")
+                segments += [f" →@{mentions}", "mention_mark"]
             
-            self.post_display.insert(tk.END, "\n", "name")
+            segments += ["\n", "name"]
             
             # 投稿内容をフォーマットして表示
             formatted_content = self.format_post_content(content)
-            content_tag = "user_content" if is_user else "ai_content"
-            self.post_display.insert(tk.END, f" {formatted_content}\n\n", content_tag)
+            segments += [f" {formatted_content}\n\n", "user_content" if is_user else "ai_content"]
+            return segments
             
         except Exception as e:
             logger.error(f"[APP] 投稿表示エラー: {e}")
-            self.post_display.insert(tk.END, f" [投稿表示エラー: {e}]\n\n", "error")
+            return [f" [投稿表示エラー: {e}]\n\n", "error"]
 
     def configure_post_display_tags(self):
-        """投稿表示のタグ設定"""
+        """投稿表示のタグ設定（共有フォントを参照するため作成時に一度だけ）"""
         try:
             # 基本タグ
-            self.post_display.tag_configure("number", foreground="#808080", font=('MS Gothic', self.font_size - 2))
-            self.post_display.tag_configure("timestamp", foreground="#808080", font=('MS Gothic', self.font_size - 2))
+            self.post_display.tag_configure("number", foreground="#808080", font=self._fonts['small'])
+            self.post_display.tag_configure("timestamp", foreground="#808080", font=self._fonts['small'])
             
             # 名前タグ
-            self.post_display.tag_configure("user_name", foreground="#00FFFF", font=('MS Gothic', self.font_size, 'bold'))
-            self.post_display.tag_configure("ai_name", foreground="#FFFF00", font=('MS Gothic', self.font_size, 'bold'))
+            self.post_display.tag_configure("user_name", foreground="#00FFFF", font=self._fonts['bold'])
+            self.post_display.tag_configure("ai_name", foreground="#FFFF00", font=self._fonts['bold'])
             
             # 内容タグ
-            self.post_display.tag_configure("user_content", foreground="#FFFFFF", font=('MS Gothic', self.font_size))
-            self.post_display.tag_configure("ai_content", foreground="#00FF00", font=('MS Gothic', self.font_size))
+            self.post_display.tag_configure("user_content", foreground="#FFFFFF", font=self._fonts['body'])
+            self.post_display.tag_configure("ai_content", foreground="#00FF00", font=self._fonts['body'])
             
             # 特殊マーク
-            self.post_display.tag_configure("edited_mark", foreground="#FF8080", font=('MS Gothic', self.font_size - 2))
-            self.post_display.tag_configure("mention_mark", foreground="#FF80FF", font=('MS Gothic', self.font_size - 2))
-            self.post_display.tag_configure("error", foreground="#FF0000", font=('MS Gothic', self.font_size - 1))
+            self.post_display.tag_configure("edited_mark", foreground="#FF8080", font=self._fonts['small'])
+            self.post_display.tag_configure("mention_mark", foreground="#FF80FF", font=self._fonts['small'])
+            self.post_display.tag_configure("error", foreground="#FF0000", font=self._fonts['body_small'])
             
         except Exception as e:
             logger.error(f"[APP] タグ設定エラー: {e}")
 
     def format_post_content(self, content: str) -> str:
         """投稿内容のフォーマット - 強化版"""
-        if not content:
-            return ""
-        
-        lines = []
-        current_line = ""
-        
-        for char in content:
-            if char == '\n':
-                if current_line:
-                    lines.append(current_line)
-                    current_line = ""
-                lines.append("")
-            else:
-                current_line += char
-                # 45文字程度で改行（PC-98風）
-                if len(current_line) >= 45 and char in ['。', '！', '？', '、', ' ']:
-                    lines.append(current_line)
-                    current_line = ""
-        
-        if current_line:
-            lines.append(current_line)
-        
-        # 行頭にスペースを追加してインデント
-        formatted_lines = []
-        for line in lines:
-            if line.strip():
-                formatted_lines.append(line)
-            else:
-                formatted_lines.append("")
-        
-        return '\n '.join(formatted_lines)
+        return _format_post_content(content)
 
-    def submit_post(self):
+    def submit_post(self, event=None):
         """投稿送信 - ユーザー応答強化版"""
         if not self.current_thread_id:
             messagebox.showwarning("警告", "スレッドが選択されていません。")
             return
         
-        content = self.post_input.get(1.0, tk.END).strip()
+        raw_input = self.post_input.get(1.0, tk.END)
+        content = raw_input.strip()
         if not content:
             messagebox.showwarning("警告", "投稿内容を入力してください。")
             return
@@ -4509,40 +5413,59 @@ class BBSApplication:
             if mention_name:
                 content = f"@{mention_name} {content}"
             
-            # ユーザー投稿として追加
-            success = self.thread_manager.add_post(
-                self.current_thread_id,
-                self.current_username,
-                content,
-                is_user_post=True
-            )
+            # 入力欄のクリアとボタン無効化のみ即座に行い、書き込みはワーカーで実行
+            self.post_input.delete(1.0, tk.END)
+            self.mention_var.set("")
+            self.post_button.config(state=tk.DISABLED)
+            
+            thread_id = self.current_thread_id
+            future = self._io_executor.submit(self._submit_post_worker, thread_id, self.current_username, content)
+            self.root.after(50, self._finish_submit_post, future, thread_id, raw_input)
             
-            if success:
-                # 入力欄をクリア
-                self.post_input.delete(1.0, tk.END)
-                self.mention_var.set("")
-                
-                # 表示更新
-                self.update_post_display()
-                self.update_thread_list()
-                self.update_status()
-                
-                # ペルソナに学習データとして記録
-                if hasattr(self.persona_manager, 'record_user_interaction'):
-                    self.persona_manager.record_user_interaction(self.current_thread_id, content)
-                
-                # **ユーザー投稿への積極的返答をトリガー**
-                self.user_response_manager.trigger_user_responses(self.current_username, content, self.current_thread_id)
-                
-                logger.info(f"[APP] ユーザー投稿完了: {self.current_username} -> Thread {self.current_thread_id}")
-            else:
-                messagebox.showerror("エラー", "投稿に失敗しました。")
-                
         except Exception as e:
             logger.error(f"[APP] 投稿送信エラー: {e}")
+            self.post_button.config(state=tk.NORMAL)
             messagebox.showerror("エラー", f"投稿中にエラーが発生しました: {e}")
 
-    def show_create_thread_dialog(self):
+    def _submit_post_worker(self, thread_id: int, username: str, content: str) -> Optional[int]:
+        """投稿の書き込みと応答トリガー（ワーカースレッドで実行）"""
+        post_id = self.thread_manager.add_post(thread_id, username, content, is_user_post=True)
+        if post_id:
+            # ペルソナに学習データとして記録
+            if hasattr(self.persona_manager, 'record_user_interaction'):
+                self.persona_manager.record_user_interaction(thread_id, content)
+            
+            # **ユーザー投稿への積極的返答をトリガー**
+            self.user_response_manager.trigger_user_responses(username, content, thread_id)
+        return post_id
+
+    def _finish_submit_post(self, future: Future, thread_id: int, raw_input: str):
+        """投稿完了をメインスレッドで反映"""
+        if not future.done():
+            self.root.after(50, self._finish_submit_post, future, thread_id, raw_input)
+            return
+        
+        self.post_button.config(state=tk.NORMAL)
+        try:
+            post_id = future.result()
+        except Exception as e:
+            logger.error(f"[APP] 投稿送信エラー: {e}")
+            post_id = None
+        
+        if post_id:
+            # 表示更新（スレッド一覧は該当行の投稿数のみ更新）
+            self.update_post_display()
+            self._patch_thread_row(thread_id, delta_posts=1)
+            self.update_status()
+            
+            logger.info(f"[APP] ユーザー投稿完了: {self.current_username} -> Thread {thread_id}")
+        else:
+            # 入力内容を戻して再投稿できるようにする
+            if not self.post_input.get(1.0, tk.END).strip():
+                self.post_input.insert(1.0, raw_input.rstrip("\n"))
+            messagebox.showerror("エラー", "投稿に失敗しました。")
+
+    def show_create_thread_dialog(self, event=None):
         """スレッド作成ダイアログ表示"""
         if not self.current_main_category_id:
             messagebox.showwarning("警告", "カテゴリを選択してください。")
@@ -4565,6 +5488,7 @@ class BBSApplication:
         ttk.Label(sub_cat_frame, text="小分類:", style='BBS.TLabel').pack(anchor=tk.W)
         
         sub_categories = self.category_manager.get_sub_categories(self.current_main_category_id)
+        sub_category_ids = {cat["name"]: cat["id"] for cat in sub_categories}
         sub_cat_var = tk.StringVar()
         
         sub_cat_combo = ttk.Combobox(
@@ -4589,7 +5513,7 @@ class BBSApplication:
             title_frame,
             bg="#000080",
             fg="#FFFFFF",
-            font=('MS Gothic', self.font_size),
+            font=self._fonts['body'],
             width=50
         )
         title_entry.pack(fill=tk.X, pady=5)
@@ -4605,7 +5529,7 @@ class BBSApplication:
             desc_frame,
             bg="#000080",
             fg="#FFFFFF",
-            font=('MS Gothic', self.font_size),
+            font=self._fonts['body'],
             height=5,
             wrap=tk.WORD
         )
@@ -4630,11 +5554,7 @@ class BBSApplication:
                     return
                 
                 # 小分類IDを取得
-                sub_cat_id = None
-                for cat in sub_categories:
-                    if cat["name"] == sub_cat_name:
-                        sub_cat_id = cat["id"]
-                        break
+                sub_cat_id = sub_category_ids.get(sub_cat_name)
                 
                 if not sub_cat_id:
                     messagebox.showerror("エラー", "小分類の取得に失敗しました。")
@@ -4650,6 +5570,8 @@ class BBSApplication:
                 )
                 
                 if thread_id > 0:
+                    # 自動投稿の予定に新スレッドを加える
+                    self._wake_auto_poster(reseed=True)
                     messagebox.showinfo("成功", f"スレッド「{title}」を作成しました。")
                     dialog.destroy()
                     
@@ -4659,8 +5581,7 @@ class BBSApplication:
                     # 作成したスレッドを選択
                     for i, thread in enumerate(self.current_threads):
                         if thread['thread_id'] == thread_id:
-                            self.thread_listbox.selection_clear(0, tk.END)
-                            self.thread_listbox.selection_set(i)
+                            self.select_thread_index(i)
                             self.current_thread_id = thread_id
                             self.update_thread_info(thread)
                             self.update_post_display()
@@ -4690,7 +5611,7 @@ class BBSApplication:
         dialog.bind('<Return>', lambda e: create_thread())
         dialog.bind('<Escape>', lambda e: dialog.destroy())
 
-    def refresh_display(self):
+    def refresh_display(self, event=None):
         """表示更新 - 完全版"""
         try:
             # 全体的な更新
@@ -4708,7 +5629,7 @@ class BBSApplication:
             logger.error(f"[APP] 表示更新エラー: {e}")
             messagebox.showerror("エラー", f"表示更新中にエラーが発生しました: {e}")
 
-    def toggle_admin_mode(self):
+    def toggle_admin_mode(self, event=None):
         """管理モード切り替え"""
         self.admin_mode = not self.admin_mode
         self.update_status()
@@ -4728,7 +5649,7 @@ class BBSApplication:
         control_frame.pack(fill=tk.X, padx=10, pady=10)
         
         ttk.Label(control_frame, text="■ システム制御 ■", style='BBS.TLabel',
-                  font=('MS Gothic', self.font_size, 'bold')).pack(anchor=tk.W)
+                  font=self._fonts['bold']).pack(anchor=tk.W)
         
         # AI活動制御
         ai_frame = ttk.Frame(control_frame, style='BBS.TFrame')
@@ -4755,6 +5676,7 @@ class BBSApplication:
     def set_ai_activity(self, enabled: bool):
         """AI活動設定"""
         self.ai_activity_enabled = enabled
+        self._wake_auto_poster()
         self.update_status()
         logger.info(f"[ADMIN] AI活動: {'有効' if enabled else '無効'}")
 
@@ -4788,16 +5710,17 @@ class BBSApplication:
 
     def setup_keybindings(self):
         """キーバインド設定 - 拡張版"""
-        self.root.bind('<Control-Return>', lambda e: self.submit_post())
-        self.root.bind('<F5>', lambda e: self.refresh_display())
-        self.root.bind('<F12>', lambda e: self.toggle_admin_mode())
+        # イベント引数を受け取れるハンドラはバインドメソッドを直接登録
+        self.root.bind('<Control-Return>', self.submit_post)
+        self.root.bind('<F5>', self.refresh_display)
+        self.root.bind('<F12>', self.toggle_admin_mode)
         self.root.bind('<Control-q>', lambda e: self.root.quit())
-        self.root.bind('<Control-n>', lambda e: self.show_create_thread_dialog())
+        self.root.bind('<Control-n>', self.show_create_thread_dialog)
         
         # フォントサイズ調整
         self.root.bind('<Control-plus>', lambda e: self.change_font_size(1))
         self.root.bind('<Control-minus>', lambda e: self.change_font_size(-1))
-        self.root.bind('<Control-0>', lambda e: self.reset_font_size())
+        self.root.bind('<Control-0>', self.reset_font_size)
         
         logger.info("[APP] キーバインド設定完了")
 
@@ -4806,12 +5729,14 @@ class BBSApplication:
         new_size = max(8, min(20, self.font_size + delta))
         if new_size != self.font_size:
             self.font_size = new_size
+            self._apply_font_sizes()
             self.adjust_responsive_layout()
             self.save_settings()
 
-    def reset_font_size(self):
+    def reset_font_size(self, event=None):
         """フォントサイズリセット"""
         self.font_size = 12
+        self._apply_font_sizes()
         self.adjust_responsive_layout()
         self.save_settings()
 
@@ -4827,6 +5752,9 @@ class BBSApplication:
             if hasattr(self, 'post_scheduler'):
                 self.post_scheduler.stop()
             
+            # 実行中の投稿書き込みを完了させる
+            self._io_executor.shutdown(wait=True)
+            
             # 設定保存
             self.save_settings()
             
@@ -4873,8 +5801,9 @@ class BBSApplication:
             
             sys.excepthook = handle_exception
             
-            # メインループ開始
+            # メインループ開始（開始前に積まれたメッセージもループ開始直後に処理）
             logger.info("[APP] メインループ開始")
+            self.root.after_idle(self.process_messages)
             self.root.mainloop()
             
         except KeyboardInterrupt:
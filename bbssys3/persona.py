@@ -14,6 +14,7 @@ import datetime
 import time
 import re
 import logging
+import itertools
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -249,6 +250,7 @@ class Persona:
         self.activity_level = random.uniform(0.3, 0.8)
         self.last_post_time = None
         self.created_at = datetime.datetime.now()
+        self.mutation_count = 0  # 状態変更ごとに加算（表示キャッシュの無効化用）
         self.is_active = True
         
         # 背景情報
@@ -609,6 +611,7 @@ class Persona:
         """活動更新"""
         self.post_count += 1
         self.last_post_time = datetime.datetime.now()
+        self.mutation_count += 1
         
         # 感情の更新
         if any(positive in post_content for positive in ["良い", "嬉しい", "楽しい", "最高"]):
@@ -687,6 +690,12 @@ class PersonaManager:
         self.ai_manager = ai_manager
         self.personas: Dict[str, Persona] = {}
         
+        # 投稿者選択用の列指向スナップショット（ペルソナ列・累積重み列）
+        self._selection_arrays: Optional[Tuple[Tuple[Persona, ...], List[float]]] = None
+        
+        # ペルソナ構成の変更カウンタ（外部キャッシュの更新判定用）
+        self.version = 0
+        
         # 名前データベース
         self.name_database = self._load_name_database()
         
@@ -747,13 +756,24 @@ class PersonaManager:
             (Generation.GENERATION_2010s, "2010s", 25, (10, 19))
         ]
         
+        # 別の辞書に組み立ててから差し替える（他スレッドに生成途中の状態を見せない）
+        personas: Dict[str, Persona] = {}
         for generation, gen_key, count, age_range in generation_configs:
             logger.info(f"[PERSONA] {generation.value}のペルソナ生成中...")
-            self._generate_generation_personas(generation, gen_key, count, age_range)
+            self._generate_generation_personas(personas, generation, gen_key, count, age_range)
         
+        self.personas = personas
+        self.invalidate_selection_cache()
         logger.info(f"[PERSONA] 総ペルソナ数: {len(self.personas)}体")
     
-    def _generate_generation_personas(self, generation: Generation, gen_key: str, count: int, age_range: Tuple[int, int]):
+    def reset(self):
+        """同じインスタンスのままペルソナを作り直してDBへ保存（参照を持つ側はそのまま使える）"""
+        self.generate_all_personas()
+        self.save_all_personas()
+        logger.info(f"[PERSONA] {len(self.personas)}体のペルソナを再生成しました")
+    
+    def _generate_generation_personas(self, personas: Dict[str, Persona], generation: Generation,
+                                      gen_key: str, count: int, age_range: Tuple[int, int]):
         """世代別ペルソナ生成"""
         for i in range(count):
             # 性別決定（男女比をある程度調整）
@@ -768,12 +788,12 @@ class PersonaManager:
             name = random.choice(available_names)
             
             # 既存チェック
-            if name in self.personas:
+            if name in personas:
                 name = f"{name}{i}"
             
             # ペルソナ生成
             persona = Persona(name, age, gender, generation)
-            self.personas[name] = persona
+            personas[name] = persona
             
             logger.debug(f"[PERSONA] 生成: {name} ({age}歳, {gender.value}, {generation.value})")
     
@@ -801,18 +821,34 @@ class PersonaManager:
         
         return stats
     
+    def invalidate_selection_cache(self):
+        """投稿者選択用スナップショットを破棄"""
+        self._selection_arrays = None
+        self.version += 1
+    
+    def _get_selection_arrays(self) -> Tuple[Tuple[Persona, ...], List[float]]:
+        """アクティブなペルソナと累積重みの列を取得（変更時のみ再構築）"""
+        arrays = self._selection_arrays
+        if arrays is None:
+            version = self.version
+            active_personas = tuple(p for p in self.personas.values() if p.is_active)
+            cum_weights = list(itertools.accumulate(p.activity_level for p in active_personas))
+            arrays = (active_personas, cum_weights)
+            # 構築中に破棄された場合は古いスナップショットを残さない
+            if self.version == version:
+                self._selection_arrays = arrays
+        return arrays
+    
     def select_posting_persona(self, thread_id: int) -> Optional[Persona]:
         """投稿ペルソナ選択"""
         try:
-            # アクティブなペルソナをフィルタ
-            active_personas = [p for p in self.personas.values() if p.is_active]
+            active_personas, cum_weights = self._get_selection_arrays()
             
             if not active_personas:
                 return None
             
-            # 活動レベルに基づく重み付き選択
-            weights = [p.activity_level for p in active_personas]
-            selected_persona = random.choices(active_personas, weights=weights)[0]
+            # 活動レベルに基づく重み付き選択（累積重みを再利用）
+            selected_persona = random.choices(active_personas, cum_weights=cum_weights)[0]
             
             return selected_persona
             
@@ -906,8 +942,8 @@ class PersonaManager:
             # プロンプト構築
             prompt = self._build_post_prompt(persona, thread_info)
             
-            # AI応答生成
-            response = self.ai_manager.generate_response(prompt, persona_context)
+            # AI応答生成（プロンプトに直近の投稿を含むため、スレッドが進めばキーも変わる）
+            response = self.ai_manager.generate_response(prompt, persona_context, cacheable=True)
             
             if response:
                 # ペルソナ特性に基づく後処理
@@ -1053,6 +1089,7 @@ class PersonaManager:
                     
                     # 感情更新（ポジティブな呼びかけと仮定）
                     persona.emotions.update_emotion("happiness", 0.05)
+                    persona.mutation_count += 1
                     
         except Exception as e:
             logger.error(f"[PERSONA] ユーザー交流記録エラー: {e}")
@@ -1194,6 +1231,7 @@ class PersonaManager:
                     logger.error(f"[PERSONA] 個別ペルソナ読み込みエラー ({data[0]}): {e}")
                     continue
             
+            self.invalidate_selection_cache()
             logger.info(f"[PERSONA] データベースから{loaded_count}体のペルソナを読み込みました")
             
             # 不足分があれば新規生成
@@ -1225,6 +1263,10 @@ class PersonaManager:
                     if hours_since_last_post > 24:
                         persona.activity_level = max(0.1, persona.activity_level - 0.01)
                 
+                persona.mutation_count += 1
+            
+            self.invalidate_selection_cache()
+                
         except Exception as e:
             logger.error(f"[PERSONA] ペルソナ状態更新エラー: {e}")
 